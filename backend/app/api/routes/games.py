@@ -2,23 +2,54 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.config import Settings
 from app.dependencies.database import provide_db_session
+from app.dependencies.games import provide_pbp_cache
+from app.dependencies.settings import provide_settings
 from app.schemas.games import LiveGamesResponse, PlayByPlayResponse
-from app.services.games import get_play_by_play, list_live_games
+from app.services.games import (
+    get_play_by_play_json,
+    get_play_by_play_since,
+    load_all_games_snapshot,
+    load_scoreboard_snapshot,
+)
+from app.services.pbp_cache import PlayByPlayCache
 
 router = APIRouter(prefix="/games", tags=["games"])
 
 SessionDep = Annotated[Session, Depends(provide_db_session)]
+SettingsDep = Annotated[Settings, Depends(provide_settings)]
+PlayByPlayCacheDep = Annotated[PlayByPlayCache | None, Depends(provide_pbp_cache)]
 
 
 @router.get("/live", summary="List currently live NFL games", response_model=LiveGamesResponse)
-async def list_live_games_route(session: SessionDep) -> LiveGamesResponse:
-    """Return live game snapshots sourced from PyESPN ingestion."""
+async def list_live_games_route(
+    session: SessionDep,
+    settings: SettingsDep,
+    season: Annotated[int | None, Query(ge=1, description="Season year")] = None,
+    week: Annotated[int | None, Query(ge=1, description="Scoreboard week")] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Return a precomputed scoreboard, or 304 when the client's copy is current.
 
-    return list_live_games(session)
+    Without filters every ingested game is returned. With a filter, ``season``
+    defaults to the configured PyESPN season and ``week`` to its latest ingested week.
+    """
+
+    if season is None and week is None:
+        snapshot = load_all_games_snapshot(session)
+    else:
+        snapshot = load_scoreboard_snapshot(
+            session, season=season or settings.pyespn_season_year, week=week
+        )
+    etag = f'"{snapshot.etag}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match is not None and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.payload, media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -29,7 +60,31 @@ async def list_live_games_route(session: SessionDep) -> LiveGamesResponse:
 async def get_play_by_play_route(
     event_id: str,
     session: SessionDep,
-) -> PlayByPlayResponse:
-    """Return normalized play-by-play data for an event."""
+    cache: PlayByPlayCacheDep,
+    since: Annotated[
+        int | None,
+        Query(ge=0, description="Cursor from a previous response; returns only later changes"),
+    ] = None,
+) -> Response:
+    """Return normalized play-by-play data for an event.
+
+    The full timeline is served from the response cache; with ``since`` only the
+    drives and plays changed after that cursor are returned.
+    """
+
+    try:
+        if since is None:
+            payload = await get_play_by_play_json(session, event_id=event_id, cache=cache)
+        else:
+            delta = get_play_by_play_since(session, event_id=event_id, since=since)
+            payload = delta.model_dump_json().encode("utf-8")
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    return Response(content=payload, media_type="application/json")
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Apply RFC 9110's weak comparison of ``If-None-Match`` against ``etag``."""
 
-    return get_play_by_play(session, event_id=event_id)
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
@@ -1,23 +1,52 @@
 """League-centric API routes backed by Yahoo ingestion."""
 
+import asyncio
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import Field
 from sqlalchemy.orm import Session
 
-from app.core.config import Settings
 from app.dependencies import provide_db_session
 from app.dependencies.auth import provide_auth_context
-from app.dependencies.settings import provide_settings
-from app.schemas.leagues import LeagueRosterResponse
+from app.dependencies.optimizer import provide_lineup_solvers
+from app.optimizer.executor import OptimizerSaturatedError
+from app.schemas.leagues import LeagueLineupsResponse, LeagueRosterResponse, SeasonPlanResponse
+from app.services.leagues import SEASON_FINAL_WEEK, LineupSolvers, RosterQuery
+from app.services.leagues import get_league_lineups as get_league_lineups_service
 from app.services.leagues import get_league_roster as get_league_roster_service
+from app.services.leagues import get_season_plan as get_season_plan_service
+from app.services.leagues import refresh_season_plan as refresh_season_plan_service
 from app.services.models import AuthContext
 
 router = APIRouter(prefix="/leagues", tags=["leagues"])
 
-SettingsDep = Annotated[Settings, Depends(provide_settings)]
 AuthContextDep = Annotated[AuthContext, Depends(provide_auth_context)]
 SessionDep = Annotated[Session, Depends(provide_db_session)]
+LineupSolversDep = Annotated[LineupSolvers, Depends(provide_lineup_solvers)]
+
+
+def _roster_query(
+    week: int = Query(..., ge=1, le=18, description="Yahoo scoring week"),
+    alternatives: int = Query(
+        0, ge=0, le=10, description="Number of runner-up lineups to include in the insight"
+    ),
+    min_difference: int = Query(
+        1, ge=1, le=9, description="Minimum starters each alternative must change"
+    ),
+) -> RosterQuery:
+    return RosterQuery(week=week, alternatives=alternatives, min_difference=min_difference)
+
+
+RosterQueryDep = Annotated[RosterQuery, Depends(_roster_query)]
+
+
+def _saturated(exc: OptimizerSaturatedError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(exc),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 
 @router.get(
@@ -27,15 +56,116 @@ SessionDep = Annotated[Session, Depends(provide_db_session)]
 )
 async def get_league_roster(
     league_key: str,
-    settings: SettingsDep,
     auth: AuthContextDep,
     session: SessionDep,
-    week: int = Query(..., ge=1, le=18, description="Yahoo scoring week"),
+    solvers: LineupSolversDep,
+    query: RosterQueryDep,
 ) -> LeagueRosterResponse:
     """Return the user's roster for the requested week."""
 
-    _ = settings
     try:
-        return get_league_roster_service(session=session, auth=auth, league_key=league_key, week=week)
+        return await get_league_roster_service(
+            session=session,
+            auth=auth,
+            league_key=league_key,
+            query=query,
+            solvers=solvers,
+        )
+    except OptimizerSaturatedError as exc:
+        raise _saturated(exc) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+@router.get(
+    "/{league_key}/lineups",
+    summary="Optimize every team's lineup in a league across weeks",
+    response_model=LeagueLineupsResponse,
+)
+async def get_league_lineups(
+    league_key: str,
+    auth: AuthContextDep,
+    session: SessionDep,
+    solvers: LineupSolversDep,
+    weeks: Annotated[
+        list[Annotated[int, Field(ge=1, le=18)]] | None,
+        Query(alias="week", description="Yahoo scoring weeks; defaults to every stored week"),
+    ] = None,
+) -> LeagueLineupsResponse:
+    """Return optimized lineups for all teams in the league."""
+
+    try:
+        return await get_league_lineups_service(
+            session=session,
+            auth=auth,
+            league_key=league_key,
+            weeks=weeks,
+            solvers=solvers,
+        )
+    except OptimizerSaturatedError as exc:
+        raise _saturated(exc) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+def _check_week_range(start_week: int, end_week: int) -> None:
+    if end_week < start_week:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="end_week must not be before start_week",
+        )
+
+
+@router.get(
+    "/{league_key}/season-plan",
+    summary="Retrieve the precomputed optimal lineup for every remaining week",
+    response_model=SeasonPlanResponse,
+)
+async def get_season_plan(
+    league_key: str,
+    auth: AuthContextDep,
+    session: SessionDep,
+    start_week: int = Query(..., ge=1, le=18, description="First week to plan; roster source"),
+    end_week: int = Query(SEASON_FINAL_WEEK, ge=1, le=18, description="Last week to plan"),
+) -> SeasonPlanResponse:
+    """Return the user's stored season plan, flagging weeks with unfillable slots."""
+
+    _check_week_range(start_week, end_week)
+    try:
+        return get_season_plan_service(
+            session=session,
+            auth=auth,
+            league_key=league_key,
+            start_week=start_week,
+            end_week=end_week,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+
+@router.post(
+    "/{league_key}/season-plan",
+    summary="Re-solve and store the optimal lineup for every remaining week",
+    response_model=SeasonPlanResponse,
+)
+async def refresh_season_plan(
+    league_key: str,
+    auth: AuthContextDep,
+    session: SessionDep,
+    start_week: int = Query(..., ge=1, le=18, description="First week to plan; roster source"),
+    end_week: int = Query(SEASON_FINAL_WEEK, ge=1, le=18, description="Last week to plan"),
+) -> SeasonPlanResponse:
+    """Recompute the user's season plan in a worker thread and return it."""
+
+    _check_week_range(start_week, end_week)
+    try:
+        return await asyncio.to_thread(
+            refresh_season_plan_service,
+            session=session,
+            auth=auth,
+            league_key=league_key,
+            start_week=start_week,
+            end_week=end_week,
+        )
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
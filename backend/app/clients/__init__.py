@@ -1,7 +1,7 @@
 """External service clients used throughout the application."""
 
-from app.clients.pyespn import PyESPNClient
+from app.clients.pyespn import AsyncPyESPNClient, PyESPNClient
 from app.clients.redis import RedisClientFactory
 from app.clients.yahoo import YahooClient
 
-__all__ = ["PyESPNClient", "RedisClientFactory", "YahooClient"]
+__all__ = ["AsyncPyESPNClient", "PyESPNClient", "RedisClientFactory", "YahooClient"]
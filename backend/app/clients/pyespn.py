@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any, cast
@@ -13,6 +15,70 @@ from app.core.config import Settings
 SCOREBOARD_ENDPOINT = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
 PLAY_BY_PLAY_ENDPOINT = "https://cdn.espn.com/core/nfl/playbyplay"
 
+QueryParams = dict[str, str | int | float | bool | None]
+
+
+@dataclass(frozen=True, slots=True)
+class _Validators:
+    etag: str | None
+    last_modified: str | None
+    content_hash: str
+
+
+@dataclass(slots=True)
+class ResponseValidators:
+    """Validators and body hash of the last response seen for each request URL.
+
+    ``ETag``/``Last-Modified`` are replayed as ``If-None-Match``/``If-Modified-Since``
+    so upstreams that honour them can answer ``304``; for those that do not, a
+    SHA-256 of the raw body detects repeats before any JSON is parsed.
+    """
+
+    max_entries: int = 512
+    _entries: OrderedDict[str, _Validators] = field(init=False, default_factory=OrderedDict)
+
+    def request_headers(self, url: str) -> dict[str, str]:
+        entry = self._entries.get(url)
+        headers: dict[str, str] = {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def changed_payload(self, url: str, response: httpx.Response) -> Any | None:
+        """Return the parsed body, or ``None`` when it matches the last response."""
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return None
+        response.raise_for_status()
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        previous = self._entries.get(url)
+        if previous is not None and previous.content_hash == content_hash:
+            self._remember(url, response, content_hash)
+            return None
+        payload = response.json()
+        self._remember(url, response, content_hash)
+        return payload
+
+    def forget(self, url: str) -> None:
+        """Drop ``url``'s entry so its next response is treated as changed."""
+
+        self._entries.pop(url, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _remember(self, url: str, response: httpx.Response, content_hash: str) -> None:
+        self._entries[url] = _Validators(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=content_hash,
+        )
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
 
 @dataclass(slots=True)
 class PyESPNClient:
@@ -21,6 +87,7 @@ class PyESPNClient:
     settings: Settings
     http_client: httpx.Client | None = None
     timeout: float = 10.0
+    validators: ResponseValidators = field(default_factory=ResponseValidators)
     _client: httpx.Client = field(init=False, repr=False)
     _owns_client: bool = field(init=False, repr=False, default=False)
 
@@ -47,33 +114,161 @@ class PyESPNClient:
     ) -> dict[str, Any]:
         """Fetch the NFL scoreboard payload for a season/week window."""
 
-        params: dict[str, str | int | float | bool | None] = {"limit": 50}
-        if week is not None:
-            params["week"] = week
-            params["year"] = season
-        else:
-            params["dates"] = str(season)
-        if extra_params:
-            params.update(extra_params)
-
-        response = self._client.get(SCOREBOARD_ENDPOINT, params=params)
+        response = self._client.get(
+            SCOREBOARD_ENDPOINT, params=_scoreboard_params(season, week, extra_params)
+        )
         response.raise_for_status()
         return cast(dict[str, Any], response.json())
 
     def get_play_by_play(self, event_id: str) -> dict[str, Any]:
         """Fetch the detailed play-by-play timeline for a single event."""
 
-        params: dict[str, str | int | float | bool | None] = {
-            "gameId": event_id,
-            "xhr": 1,
-            "render": "false",
-        }
-        response = self._client.get(PLAY_BY_PLAY_ENDPOINT, params=params)
+        response = self._client.get(PLAY_BY_PLAY_ENDPOINT, params=_play_by_play_params(event_id))
         response.raise_for_status()
-        payload = cast(dict[str, Any], response.json())
-        gamepackage = payload.get("gamepackageJSON")
-        return cast(dict[str, Any], gamepackage) if isinstance(gamepackage, dict) else {}
+        return _gamepackage(response.json())
+
+    def get_scoreboard_if_changed(
+        self, season: int, week: int | None = None
+    ) -> dict[str, Any] | None:
+        """Fetch the scoreboard, returning ``None`` when it is unchanged since the last call."""
+
+        url = _url(SCOREBOARD_ENDPOINT, _scoreboard_params(season, week, None))
+        response = self._client.get(url, headers=self.validators.request_headers(url))
+        payload = self.validators.changed_payload(url, response)
+        return None if payload is None else cast(dict[str, Any], payload)
+
+    def get_play_by_play_if_changed(self, event_id: str) -> dict[str, Any] | None:
+        """Fetch an event's play-by-play, returning ``None`` when it is unchanged."""
+
+        url = _url(PLAY_BY_PLAY_ENDPOINT, _play_by_play_params(event_id))
+        response = self._client.get(url, headers=self.validators.request_headers(url))
+        payload = self.validators.changed_payload(url, response)
+        return None if payload is None else _gamepackage(payload)
+
+    def forget_scoreboard(self, season: int, week: int | None = None) -> None:
+        """Refetch the scoreboard in full next time, e.g. after its ingest failed."""
+
+        self.validators.forget(_url(SCOREBOARD_ENDPOINT, _scoreboard_params(season, week, None)))
+
+    def forget_play_by_play(self, event_id: str) -> None:
+        """Refetch an event's play-by-play in full next time, e.g. after its ingest failed."""
+
+        self.validators.forget(_url(PLAY_BY_PLAY_ENDPOINT, _play_by_play_params(event_id)))
 
     # FastAPI lifespan hooks expect async close support when using dependencies.
     async def aclose(self) -> None:  # pragma: no cover - sync close path used in tests
         self.close()
+
+
+@dataclass(slots=True)
+class AsyncPyESPNClient:
+    """Asynchronous ESPN client sharing one pooled connection set across requests."""
+
+    settings: Settings
+    http_client: httpx.AsyncClient | None = None
+    timeout: float = 10.0
+    max_connections: int = 8
+    validators: ResponseValidators = field(default_factory=ResponseValidators)
+    _client: httpx.AsyncClient = field(init=False, repr=False)
+    _owns_client: bool = field(init=False, repr=False, default=False)
+
+    def __post_init__(self) -> None:
+        if self.http_client is not None:
+            self._client = self.http_client
+            self._owns_client = False
+        else:
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            )
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=limits)
+            self._owns_client = True
+
+    async def aclose(self) -> None:
+        """Release the underlying HTTP resources when owned by the client."""
+
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def get_scoreboard(
+        self,
+        season: int,
+        week: int | None = None,
+        *,
+        extra_params: Mapping[str, str | int | float | bool | None] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch the NFL scoreboard payload for a season/week window."""
+
+        response = await self._client.get(
+            SCOREBOARD_ENDPOINT, params=_scoreboard_params(season, week, extra_params)
+        )
+        response.raise_for_status()
+        return cast(dict[str, Any], response.json())
+
+    async def get_play_by_play(self, event_id: str) -> dict[str, Any]:
+        """Fetch the detailed play-by-play timeline for a single event."""
+
+        response = await self._client.get(
+            PLAY_BY_PLAY_ENDPOINT, params=_play_by_play_params(event_id)
+        )
+        response.raise_for_status()
+        return _gamepackage(response.json())
+
+    async def get_scoreboard_if_changed(
+        self, season: int, week: int | None = None
+    ) -> dict[str, Any] | None:
+        """Fetch the scoreboard, returning ``None`` when it is unchanged since the last call."""
+
+        url = _url(SCOREBOARD_ENDPOINT, _scoreboard_params(season, week, None))
+        response = await self._client.get(url, headers=self.validators.request_headers(url))
+        payload = self.validators.changed_payload(url, response)
+        return None if payload is None else cast(dict[str, Any], payload)
+
+    async def get_play_by_play_if_changed(self, event_id: str) -> dict[str, Any] | None:
+        """Fetch an event's play-by-play, returning ``None`` when it is unchanged."""
+
+        url = _url(PLAY_BY_PLAY_ENDPOINT, _play_by_play_params(event_id))
+        response = await self._client.get(url, headers=self.validators.request_headers(url))
+        payload = self.validators.changed_payload(url, response)
+        return None if payload is None else _gamepackage(payload)
+
+    def forget_scoreboard(self, season: int, week: int | None = None) -> None:
+        """Refetch the scoreboard in full next time, e.g. after its ingest failed."""
+
+        self.validators.forget(_url(SCOREBOARD_ENDPOINT, _scoreboard_params(season, week, None)))
+
+    def forget_play_by_play(self, event_id: str) -> None:
+        """Refetch an event's play-by-play in full next time, e.g. after its ingest failed."""
+
+        self.validators.forget(_url(PLAY_BY_PLAY_ENDPOINT, _play_by_play_params(event_id)))
+
+
+def _scoreboard_params(
+    season: int,
+    week: int | None,
+    extra_params: Mapping[str, str | int | float | bool | None] | None,
+) -> QueryParams:
+    params: QueryParams = {"limit": 50}
+    if week is not None:
+        params["week"] = week
+        params["year"] = season
+    else:
+        params["dates"] = str(season)
+    if extra_params:
+        params.update(extra_params)
+    return params
+
+
+def _play_by_play_params(event_id: str) -> QueryParams:
+    return {"gameId": event_id, "xhr": 1, "render": "false"}
+
+
+def _url(endpoint: str, params: QueryParams) -> str:
+    """Return the full request URL, which also keys the response validators."""
+
+    return str(httpx.URL(endpoint, params=params))
+
+
+def _gamepackage(payload: Any) -> dict[str, Any]:
+    gamepackage = payload.get("gamepackageJSON") if isinstance(payload, dict) else None
+    return cast(dict[str, Any], gamepackage) if isinstance(gamepackage, dict) else {}
@@ -1,13 +1,23 @@
 """Redis client scaffolding for caching and pub/sub."""
 
+from collections.abc import Awaitable
 from dataclasses import dataclass
-from typing import cast
+from typing import Any, Protocol, cast
 
+import redis as redis_sync
 import redis.asyncio as redis
 
 from app.core.config import Settings
 
 
+class AsyncRedis(Protocol):
+    """Subset of the ``redis.asyncio`` client used by the shared cache tiers."""
+
+    def get(self, name: str) -> Awaitable[Any]: ...
+
+    def set(self, name: str, value: str, ex: int | None = None) -> Awaitable[Any]: ...
+
+
 @dataclass
 class RedisClientFactory:
     """Produce Redis clients using Upstash connection strings."""
@@ -20,3 +30,9 @@ class RedisClientFactory:
             raise ValueError("REDIS_URL is not configured.")
         client = redis.from_url(self.settings.redis_url, decode_responses=True)
         return cast(redis.Redis, client)
+
+    def create_sync(self) -> redis_sync.Redis:  # pragma: no cover - placeholder
+        """Instantiate a blocking Redis client for use from worker threads."""
+        if not self.settings.redis_url:
+            raise ValueError("REDIS_URL is not configured.")
+        return redis_sync.Redis.from_url(self.settings.redis_url, decode_responses=True)
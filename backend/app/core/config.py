@@ -64,6 +64,24 @@ class Settings(BaseSettings):
     rate_limit_window: int = Field(default=60, alias="RATE_LIMIT_WINDOW")
     rate_limit_max: int = Field(default=120, alias="RATE_LIMIT_MAX")
     ws_heartbeat_sec: int = Field(default=25, alias="WS_HEARTBEAT_SEC")
+    pbp_cache_size: int = Field(default=256, ge=0, alias="PBP_CACHE_SIZE")
+
+    # PyESPN polling
+    pyespn_season_year: int = Field(default=2025, alias="PYESPN_SEASON_YEAR")
+    pyespn_poll_ms: int = Field(default=2000, ge=1, alias="PYESPN_POLL_MS")
+    pyespn_pregame_poll_ms: int = Field(default=60000, ge=1, alias="PYESPN_PREGAME_POLL_MS")
+    pyespn_concurrency: int = Field(default=4, ge=1, alias="PYESPN_CONCURRENCY")
+
+    # Optimizer
+    optimizer_batch_workers: int = Field(default=2, ge=0, alias="OPTIMIZER_BATCH_WORKERS")
+    optimizer_cache_size: int = Field(default=1024, ge=0, alias="OPTIMIZER_CACHE_SIZE")
+    optimizer_concurrency: int = Field(default=2, ge=1, alias="OPTIMIZER_CONCURRENCY")
+    optimizer_queue_depth: int = Field(default=16, ge=0, alias="OPTIMIZER_QUEUE_DEPTH")
+    optimizer_deadline_ms: int = Field(default=2000, ge=1, alias="OPTIMIZER_DEADLINE_MS")
+    optimizer_solver_workers: int = Field(default=8, ge=1, alias="OPTIMIZER_SOLVER_WORKERS")
+    optimizer_gap_tolerance: float = Field(
+        default=0.0, ge=0.0, le=1.0, alias="OPTIMIZER_GAP_TOLERANCE"
+    )
 
     # Observability
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
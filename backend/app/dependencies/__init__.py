@@ -2,6 +2,13 @@
 
 from app.dependencies.auth import provide_auth_context
 from app.dependencies.database import provide_db_session
+from app.dependencies.games import provide_pbp_cache
+from app.dependencies.optimizer import (
+    provide_async_optimizer,
+    provide_incremental_optimizer,
+    provide_lineup_solvers,
+    provide_optimizer_cache,
+)
 from app.dependencies.rate_limit import enforce_rate_limit, provide_rate_limiter
 from app.dependencies.redis import provide_redis_client
 from app.dependencies.settings import provide_settings
@@ -10,6 +17,11 @@ __all__ = [
     "provide_settings",
     "provide_auth_context",
     "provide_db_session",
+    "provide_optimizer_cache",
+    "provide_async_optimizer",
+    "provide_incremental_optimizer",
+    "provide_lineup_solvers",
+    "provide_pbp_cache",
     "provide_redis_client",
     "provide_rate_limiter",
     "enforce_rate_limit",
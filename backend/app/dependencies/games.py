@@ -0,0 +1,40 @@
+"""FastAPI dependencies for shared game-data state."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from app.clients.redis import RedisClientFactory
+from app.core.config import Settings
+from app.dependencies.settings import provide_settings
+from app.services.pbp_cache import PlayByPlayCache
+
+SettingsDep = Annotated[Settings, Depends(provide_settings)]
+
+
+def build_pbp_cache(settings: Settings) -> PlayByPlayCache | None:
+    """Create the play-by-play response cache, sharing it through Redis when configured."""
+
+    if settings.pbp_cache_size <= 0:
+        return None
+    redis_client = RedisClientFactory(settings=settings).create() if settings.redis_url else None
+    return PlayByPlayCache(
+        max_entries=settings.pbp_cache_size,
+        live_ttl_seconds=settings.cache_ttl_default,
+        redis_client=redis_client,
+    )
+
+
+async def provide_pbp_cache(request: Request, settings: SettingsDep) -> PlayByPlayCache | None:
+    """Return (and lazily initialize) the process-wide play-by-play response cache."""
+
+    cache: PlayByPlayCache | None = getattr(request.app.state, "pbp_cache", None)
+    if cache is None or (
+        cache.max_entries != settings.pbp_cache_size
+        or cache.live_ttl_seconds != settings.cache_ttl_default
+    ):
+        cache = build_pbp_cache(settings)
+        request.app.state.pbp_cache = cache
+    return cache
@@ -0,0 +1,107 @@
+"""FastAPI dependencies for shared optimizer state."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from app.clients.redis import RedisClientFactory
+from app.core.config import Settings
+from app.dependencies.settings import provide_settings
+from app.optimizer.cache import OptimizerResultCache
+from app.optimizer.executor import AdmissionLimits, AsyncLineupOptimizer
+from app.optimizer.incremental import IncrementalLineupOptimizer
+from app.optimizer.models import SolverBudget
+from app.services.leagues import LineupSolvers
+
+SettingsDep = Annotated[Settings, Depends(provide_settings)]
+
+
+def build_optimizer_cache(settings: Settings) -> OptimizerResultCache | None:
+    """Create the optimizer result cache, sharing it through Redis when configured."""
+
+    if settings.optimizer_cache_size <= 0:
+        return None
+    redis_client = RedisClientFactory(settings=settings).create() if settings.redis_url else None
+    return OptimizerResultCache(
+        max_entries=settings.optimizer_cache_size,
+        ttl_seconds=settings.cache_ttl_default,
+        redis_client=redis_client,
+    )
+
+
+def solver_budget(settings: Settings) -> SolverBudget:
+    """Return the default per-solve budget configured for this deployment."""
+
+    return SolverBudget(
+        deadline_seconds=settings.optimizer_deadline_ms / 1000,
+        workers=settings.optimizer_solver_workers,
+        relative_gap=settings.optimizer_gap_tolerance,
+    )
+
+
+async def provide_optimizer_cache(
+    request: Request, settings: SettingsDep
+) -> OptimizerResultCache | None:
+    """Return (and lazily initialize) the process-wide optimizer result cache."""
+
+    cache: OptimizerResultCache | None = getattr(request.app.state, "optimizer_cache", None)
+    if cache is None or (
+        cache.max_entries != settings.optimizer_cache_size
+        or cache.ttl_seconds != settings.cache_ttl_default
+    ):
+        cache = build_optimizer_cache(settings)
+        request.app.state.optimizer_cache = cache
+    return cache
+
+
+async def provide_incremental_optimizer(
+    request: Request, settings: SettingsDep
+) -> IncrementalLineupOptimizer | None:
+    """Return (and lazily initialize) the process-wide warm-start lineup state."""
+
+    if settings.optimizer_cache_size <= 0:
+        return None
+    incremental: IncrementalLineupOptimizer | None = getattr(
+        request.app.state, "incremental_optimizer", None
+    )
+    if incremental is None or incremental.max_entries != settings.optimizer_cache_size:
+        incremental = IncrementalLineupOptimizer(max_entries=settings.optimizer_cache_size)
+        request.app.state.incremental_optimizer = incremental
+    return incremental
+
+
+async def provide_async_optimizer(request: Request, settings: SettingsDep) -> AsyncLineupOptimizer:
+    """Return (and lazily initialize) the process-wide bounded optimizer pool."""
+
+    optimizer: AsyncLineupOptimizer | None = getattr(request.app.state, "async_optimizer", None)
+    limits = AdmissionLimits(
+        max_concurrency=settings.optimizer_concurrency,
+        max_queue_depth=settings.optimizer_queue_depth,
+    )
+    budget = solver_budget(settings)
+    if optimizer is None or optimizer.limits != limits or optimizer.budget != budget:
+        if optimizer is not None:
+            optimizer.shutdown()
+        optimizer = AsyncLineupOptimizer(limits, budget=budget)
+        request.app.state.async_optimizer = optimizer
+    return optimizer
+
+
+async def provide_lineup_solvers(
+    settings: SettingsDep,
+    optimizer: Annotated[AsyncLineupOptimizer, Depends(provide_async_optimizer)],
+    cache: Annotated[OptimizerResultCache | None, Depends(provide_optimizer_cache)],
+    incremental: Annotated[
+        IncrementalLineupOptimizer | None, Depends(provide_incremental_optimizer)
+    ],
+) -> LineupSolvers:
+    """Bundle the optimizer pool and caches that league routes solve through."""
+
+    return LineupSolvers(
+        optimizer=optimizer,
+        cache=cache,
+        incremental=incremental,
+        batch_jobs=settings.optimizer_batch_workers,
+    )
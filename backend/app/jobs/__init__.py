@@ -1,8 +1,13 @@
 """Background job definitions for ingestion and maintenance tasks."""
 
+from app.jobs.archive import archive_event_plays, archive_final_events
+from app.jobs.planning import materialize_season_plans
 from app.jobs.reference import seed_canonical_players, seed_reference_data
 
 __all__ = [
+    "archive_event_plays",
+    "archive_final_events",
+    "materialize_season_plans",
     "seed_canonical_players",
     "seed_reference_data",
 ]
@@ -0,0 +1,62 @@
+"""Archive the plays of completed events into compressed columnar blocks."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, undefer
+
+from app.models.espn import EventState, Play, PlayArchive
+from app.services.games import PHASE_FINAL, build_play_detail, game_phase
+from app.services.play_archive import encode_play_archive
+
+
+def archive_event_plays(session: Session, event_id: str) -> PlayArchive | None:
+    """Archive one event's plays and strip their raw JSON from the ``plays`` rows."""
+
+    plays = session.execute(
+        select(Play)
+        .options(undefer(Play.raw_json))
+        .where(Play.event_id == event_id)
+        .order_by(Play.drive_id, Play.sequence)
+    ).scalars().all()
+    if not plays:
+        return None
+
+    archive = PlayArchive(
+        event_id=event_id,
+        play_count=len(plays),
+        payload=encode_play_archive(
+            [play.drive_id for play in plays],
+            [build_play_detail(play) for play in plays],
+            [play.raw_json for play in plays],
+        ),
+        archived_at=datetime.now(tz=UTC),
+    )
+    session.add(archive)
+    session.execute(update(Play).where(Play.event_id == event_id).values(raw_json={}))
+    return archive
+
+
+def archive_final_events(session: Session) -> int:
+    """Archive every final event that has plays and no archive yet."""
+
+    candidates = session.execute(
+        select(EventState.event_id, EventState.status)
+        .where(
+            select(Play.play_id).where(Play.event_id == EventState.event_id).exists(),
+            ~select(PlayArchive.event_id)
+            .where(PlayArchive.event_id == EventState.event_id)
+            .exists(),
+        )
+        .order_by(EventState.event_id)
+    ).all()
+    archived = 0
+    for event_id, status in candidates:
+        if game_phase(status) == PHASE_FINAL and archive_event_plays(session, event_id):
+            archived += 1
+    return archived
+
+
+__all__ = ["archive_event_plays", "archive_final_events"]
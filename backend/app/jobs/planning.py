@@ -0,0 +1,36 @@
+"""Materialize season lineup plans so dashboards read stored rows."""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.yahoo import YahooRoster, YahooTeam
+from app.services.leagues import SEASON_FINAL_WEEK, materialize_season_plan
+
+
+def materialize_season_plans(
+    session: Session, start_week: int, *, end_week: int = SEASON_FINAL_WEEK
+) -> int:
+    """Recompute the stored season plan for every user team rostered in ``start_week``."""
+
+    teams = (
+        session.execute(
+            select(YahooTeam)
+            .where(
+                YahooTeam.is_user_team.is_(True),
+                YahooTeam.team_key.in_(
+                    select(YahooRoster.team_key).where(YahooRoster.week == start_week)
+                ),
+            )
+            .order_by(YahooTeam.team_key)
+        )
+        .scalars()
+        .all()
+    )
+    for team in teams:
+        materialize_season_plan(session, team, start_week, end_week=end_week)
+    return len(teams)
+
+
+__all__ = ["materialize_season_plans"]
@@ -2,6 +2,8 @@
 
 import os
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import sentry_sdk
@@ -11,9 +13,20 @@ from app.api.routes import games, health, leagues, me, meta, oauth
 from app.core.config import get_settings
 from app.core.metrics import RequestMetrics
 from app.core.rate_limiter import SlidingWindowRateLimiter
+from app.dependencies.optimizer import build_optimizer_cache
 from app.ws import router as ws_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Release process-wide resources created lazily by dependencies."""
+
+    yield
+    optimizer = getattr(app.state, "async_optimizer", None)
+    if optimizer is not None:
+        optimizer.shutdown()
+
+
 def create_app() -> FastAPI:
     """Instantiate and configure the FastAPI application."""
     # --- Observability Setup ---
@@ -67,6 +80,7 @@ def create_app() -> FastAPI:
             "Read-only Yahoo Fantasy companion with PyESPN game data and lineup optimization "
             "capabilities."
         ),
+        lifespan=lifespan,
     )
 
     # Instrument the FastAPI app after it's created for production
@@ -83,6 +97,7 @@ def create_app() -> FastAPI:
         max_requests=settings.rate_limit_max,
         window_seconds=settings.rate_limit_window,
     )
+    app.state.optimizer_cache = build_optimizer_cache(settings)
 
     @app.middleware("http")
     async def record_request_metrics(request: Request, call_next):  # type: ignore[override]
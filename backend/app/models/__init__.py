@@ -1,10 +1,26 @@
 """ORM models describing the backend persistence layer."""
 
 from app.models.base import Base
-from app.models.espn import Athlete, Drive, Event, EventState, Play, Team, Venue
+from app.models.espn import (
+    Athlete,
+    Drive,
+    Event,
+    EventState,
+    Play,
+    PlayArchive,
+    ScoreboardSnapshot,
+    Team,
+    Venue,
+)
 from app.models.projection import IdMap, WeeklyProjection
 from app.models.user import OAuthToken, User
-from app.models.yahoo import YahooLeague, YahooPlayer, YahooRoster, YahooTeam
+from app.models.yahoo import (
+    YahooLeague,
+    YahooLineupPlan,
+    YahooPlayer,
+    YahooRoster,
+    YahooTeam,
+)
 
 __all__ = [
     "Athlete",
@@ -15,11 +31,14 @@ __all__ = [
     "IdMap",
     "OAuthToken",
     "Play",
+    "PlayArchive",
+    "ScoreboardSnapshot",
     "Team",
     "User",
     "Venue",
     "WeeklyProjection",
     "YahooLeague",
+    "YahooLineupPlan",
     "YahooPlayer",
     "YahooRoster",
     "YahooTeam",
@@ -11,9 +11,12 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     PrimaryKeyConstraint,
     String,
+    Text,
 )
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -78,6 +81,10 @@ class Event(Base):
     venue_id: Mapped[str | None] = mapped_column(
         String(32), ForeignKey("venues.venue_id", ondelete="SET NULL"), nullable=True
     )
+    # Bumped by ingest whenever the event's drives or plays change.
+    pbp_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Last version that removed drives or plays; older cursors need the full timeline.
+    pbp_reset_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
 
 class Drive(Base):
@@ -98,13 +105,18 @@ class Drive(Base):
     result: Mapped[str | None] = mapped_column(String(64), nullable=True)
     start_clock: Mapped[str | None] = mapped_column(String(16), nullable=True)
     end_clock: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    # ``Event.pbp_version`` at which the drive was last inserted or changed.
+    pbp_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
 
 class Play(Base):
     """Normalized play-by-play record."""
 
     __tablename__ = "plays"
-    __table_args__ = (PrimaryKeyConstraint("event_id", "play_id", name="pk_plays"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("event_id", "play_id", name="pk_plays"),
+        Index("ix_plays_event_version", "event_id", "pbp_version"),
+    )
 
     event_id: Mapped[str] = mapped_column(
         String(32), ForeignKey("events.event_id", ondelete="CASCADE"), nullable=False
@@ -119,7 +131,39 @@ class Play(Base):
     yardline_100: Mapped[int | None] = mapped_column(Integer, nullable=True)
     type: Mapped[str | None] = mapped_column(String(32), nullable=True)  # noqa: A003
     yards: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    raw_json: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    scoring_play: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    type_abbreviation: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    # Only ingest and archiving need the full ESPN document; reads use the columns above.
+    raw_json: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False, deferred=True)
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    # ``Event.pbp_version`` at which the play was last inserted or changed.
+    pbp_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class PlayArchive(Base):
+    """Compressed columnar copy of a completed event's plays (``app.services.play_archive``)."""
+
+    __tablename__ = "play_archives"
+
+    event_id: Mapped[str] = mapped_column(
+        String(32), ForeignKey("events.event_id", ondelete="CASCADE"), primary_key=True
+    )
+    play_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class ScoreboardSnapshot(Base):
+    """Serialized ``/games/live`` payload for one season week, rebuilt by ingest."""
+
+    __tablename__ = "scoreboard_snapshots"
+
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    week: Mapped[int] = mapped_column(Integer, primary_key=True)
+    etag: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, deferred=True)
+    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
 
 
 class EventState(Base):
@@ -82,3 +82,20 @@ class YahooRoster(Base):
     is_starter: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     projected_points: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     actual_points: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+
+class YahooLineupPlan(Base):
+    """Materialized optimal lineup for a team in one week of the season plan."""
+
+    __tablename__ = "lineup_plans"
+    __table_args__ = (PrimaryKeyConstraint("team_key", "week", name="pk_lineup_plans"),)
+
+    team_key: Mapped[str] = mapped_column(
+        String(64), ForeignKey("yahoo_teams.team_key", ondelete="CASCADE"), nullable=False
+    )
+    week: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_points: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    assignments_json: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False)
+    unfillable_slots_json: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    bye_players_json: Mapped[list[str]] = mapped_column(JSON, nullable=False)
+    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -1,25 +1,64 @@
-"""Lineup optimization modules leveraging ILP/CP-SAT solvers."""
+"""Lineup optimization modules leveraging assignment and CP-SAT solvers."""
 
+from app.optimizer.alternatives import optimize_lineup_alternatives
+from app.optimizer.batch import optimize_lineups
 from app.optimizer.engine import optimize_lineup
+from app.optimizer.incremental import IncrementalLineupOptimizer, LineupRepair
+from app.optimizer.matrix import LineupMatrix, build_lineup_matrix
 from app.optimizer.models import (
+    LineupDistribution,
     OptimizerAssignment,
+    OptimizerEngine,
     OptimizerPlayer,
+    OptimizerProblem,
     OptimizerResult,
     OptimizerSlot,
+    SolverBudget,
 )
+from app.optimizer.roster import ReservePlacement, RosterPlan, optimize_roster, plan_reserves
 from app.optimizer.rules import (
     eligible_positions_for_slot,
+    is_injured_reserve_eligible,
     is_reserve_slot,
     parse_player_positions,
+    position_mask,
+    reserve_slot_kind,
+    slot_positions,
 )
+from app.optimizer.season import SeasonPlan, WeekPlan, plan_season
+from app.optimizer.simulation import RiskObjective, RiskProfile, optimize_lineup_risk_aware
 
 __all__ = [
+    "build_lineup_matrix",
+    "IncrementalLineupOptimizer",
+    "LineupRepair",
+    "LineupMatrix",
     "optimize_lineup",
+    "optimize_lineup_alternatives",
+    "optimize_lineups",
+    "optimize_roster",
+    "plan_reserves",
+    "ReservePlacement",
+    "RosterPlan",
+    "plan_season",
+    "SeasonPlan",
+    "WeekPlan",
+    "optimize_lineup_risk_aware",
+    "LineupDistribution",
     "OptimizerAssignment",
+    "OptimizerEngine",
     "OptimizerPlayer",
+    "OptimizerProblem",
     "OptimizerResult",
     "OptimizerSlot",
+    "RiskObjective",
+    "RiskProfile",
+    "SolverBudget",
     "eligible_positions_for_slot",
+    "is_injured_reserve_eligible",
     "is_reserve_slot",
     "parse_player_positions",
+    "position_mask",
+    "reserve_slot_kind",
+    "slot_positions",
 ]
@@ -0,0 +1,133 @@
+"""Ranked alternative lineups (K-best) over the exact assignment model."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from itertools import count
+
+import numpy as np
+
+from app.optimizer.assignment import FORBIDDEN, InfeasibleAssignmentError, solve_assignment
+from app.optimizer.engine import optimize_lineup, slot_cost_matrix
+from app.optimizer.matrix import build_lineup_matrix
+from app.optimizer.models import (
+    OptimizerAssignment,
+    OptimizerPlayer,
+    OptimizerResult,
+    OptimizerSlot,
+)
+
+# Subproblems explored per requested lineup before giving up on ``min_difference``.
+_CANDIDATES_PER_LINEUP = 25
+
+
+@dataclass(order=True, slots=True)
+class _Candidate:
+    cost: float
+    sequence: int
+    row_to_col: tuple[int, ...] = field(compare=False)
+    forced_in: frozenset[int] = field(compare=False)
+    forced_out: frozenset[int] = field(compare=False)
+
+
+def optimize_lineup_alternatives(
+    players: Iterable[OptimizerPlayer],
+    slots: Iterable[OptimizerSlot],
+    *,
+    k: int = 3,
+    min_difference: int = 1,
+) -> list[OptimizerResult]:
+    """Return up to ``k`` lineups with distinct starters, best first.
+
+    Uses Lawler/Murty partitioning over *which players start*: after each
+    lineup is found, its starters are split into subproblems that force earlier
+    starters in and exclude the next one. Every subproblem reuses the same cost
+    matrix with a few columns masked, so no model is rebuilt per alternative.
+    Each returned lineup differs from every better one by at least
+    ``min_difference`` starters.
+    """
+
+    if k <= 0:
+        raise ValueError("k must be positive")
+    if min_difference <= 0:
+        raise ValueError("min_difference must be positive")
+
+    player_list = list(players)
+    slot_list = list(slots)
+    if not player_list or not slot_list:
+        return [optimize_lineup(player_list, slot_list)]
+
+    matrix = build_lineup_matrix(player_list, slot_list)
+    base_cost, vacancy_cost = slot_cost_matrix(matrix)
+    player_count = len(player_list)
+    # Large enough that covering a forced player outweighs any vacancy it causes.
+    force_bonus = 2.0 * len(slot_list) * vacancy_cost + 1.0
+
+    def solve(forced_in: frozenset[int], forced_out: frozenset[int]) -> _Candidate | None:
+        cost = base_cost.copy()
+        if forced_out:
+            cost[:, sorted(forced_out)] = FORBIDDEN
+        if forced_in:
+            columns = sorted(forced_in)
+            cost[:, columns] -= force_bonus
+        try:
+            solution = solve_assignment(cost.tolist())
+        except InfeasibleAssignmentError:
+            return None
+        if not forced_in <= set(solution.row_to_col):
+            return None
+        true_cost = float(base_cost[np.arange(len(slot_list)), solution.row_to_col].sum())
+        return _Candidate(true_cost, next(sequence), solution.row_to_col, forced_in, forced_out)
+
+    sequence = count()
+    root = solve(frozenset(), frozenset())
+    heap: list[_Candidate] = [root] if root is not None else []
+    accepted: list[_Candidate] = []
+    accepted_starters: list[frozenset[int]] = []
+    budget = k * _CANDIDATES_PER_LINEUP
+
+    while heap and len(accepted) < k and budget > 0:
+        budget -= 1
+        candidate = heapq.heappop(heap)
+        starters = frozenset(col for col in candidate.row_to_col if col < player_count)
+        if all(len(starters - other) >= min_difference for other in accepted_starters):
+            accepted.append(candidate)
+            accepted_starters.append(starters)
+
+        # Partition the rest of this subproblem's space by the first starter dropped.
+        forced_in = set(candidate.forced_in)
+        for column in sorted(starters - candidate.forced_in):
+            child = solve(frozenset(forced_in), candidate.forced_out | {column})
+            if child is not None:
+                heapq.heappush(heap, child)
+            forced_in.add(column)
+
+    return [
+        _result_for(player_list, slot_list, candidate.row_to_col, player_count)
+        for candidate in accepted
+    ]
+
+
+def _result_for(
+    players: list[OptimizerPlayer],
+    slots: list[OptimizerSlot],
+    row_to_col: tuple[int, ...],
+    player_count: int,
+) -> OptimizerResult:
+    assignments = tuple(
+        OptimizerAssignment(
+            slot_id=slot.slot_id,
+            slot_name=slot.slot_name,
+            player_id=players[column].player_id,
+            projected_points=players[column].projected_points,
+        )
+        for slot, column in zip(slots, row_to_col, strict=True)
+        if column < player_count
+    )
+    return OptimizerResult(
+        assignments=assignments,
+        total_points=sum(assignment.projected_points for assignment in assignments),
+        engine="assignment",
+    )
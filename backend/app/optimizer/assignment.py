@@ -0,0 +1,168 @@
+"""Exact rectangular assignment solver (Hungarian / shortest augmenting path)."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+# Cost marking a row/column pairing that may never be selected.
+FORBIDDEN = math.inf
+
+# Reduced costs at or below this are treated as tight when repairing a solution.
+_TIGHTNESS_EPSILON = 1e-9
+
+
+class InfeasibleAssignmentError(ValueError):
+    """Raised when some row cannot be matched to any remaining column."""
+
+
+@dataclass(frozen=True, slots=True)
+class AssignmentSolution:
+    """Minimum-cost assignment of every row to a distinct column."""
+
+    row_to_col: tuple[int, ...]
+    total_cost: float
+    row_potentials: tuple[float, ...]
+    col_potentials: tuple[float, ...]
+
+
+def solve_assignment(cost: Sequence[Sequence[float]]) -> AssignmentSolution:
+    """Assign each row to a distinct column minimizing the summed cost.
+
+    ``cost`` is a dense ``rows x cols`` matrix with ``rows <= cols``; entries equal
+    to :data:`FORBIDDEN` are never selected. Runs in ``O(rows^2 * cols)`` and also
+    returns the dual potentials, which satisfy ``u[i] + v[j] <= cost[i][j]`` with
+    equality on every selected pair.
+    """
+
+    row_count = len(cost)
+    col_count = len(cost[0]) if row_count else 0
+    if row_count > col_count:
+        raise ValueError("Assignment requires at least as many columns as rows")
+
+    # 1-based arrays; column 0 is the virtual root of each augmenting search.
+    u = [0.0] * (row_count + 1)
+    v = [0.0] * (col_count + 1)
+    col_owner = [0] * (col_count + 1)
+
+    for row in range(1, row_count + 1):
+        _augment(row, cost, u, v, col_owner)
+
+    row_to_col = [0] * row_count
+    for col in range(1, col_count + 1):
+        if col_owner[col]:
+            row_to_col[col_owner[col] - 1] = col - 1
+
+    total_cost = sum(cost[row][col] for row, col in enumerate(row_to_col))
+    return AssignmentSolution(
+        row_to_col=tuple(row_to_col),
+        total_cost=total_cost,
+        row_potentials=tuple(u[1:]),
+        col_potentials=tuple(v[1:]),
+    )
+
+
+def _augment(
+    row: int,
+    cost: Sequence[Sequence[float]],
+    u: list[float],
+    v: list[float],
+    col_owner: list[int],
+) -> None:
+    """Match 1-based ``row`` along a shortest augmenting path, updating potentials."""
+
+    col_count = len(v) - 1
+    col_owner[0] = row
+    current_col = 0
+    way = [0] * (col_count + 1)
+    min_slack = [math.inf] * (col_count + 1)
+    visited = [False] * (col_count + 1)
+
+    while True:
+        visited[current_col] = True
+        current_row = col_owner[current_col]
+        row_costs = cost[current_row - 1]
+        row_potential = u[current_row]
+        delta = math.inf
+        next_col = 0
+
+        for col in range(1, col_count + 1):
+            if visited[col]:
+                continue
+            slack = row_costs[col - 1] - row_potential - v[col]
+            if slack < min_slack[col]:
+                min_slack[col] = slack
+                way[col] = current_col
+            if min_slack[col] < delta:
+                delta = min_slack[col]
+                next_col = col
+
+        if delta == math.inf:
+            raise InfeasibleAssignmentError(f"Row {row - 1} has no feasible column")
+
+        for col in range(col_count + 1):
+            if visited[col]:
+                u[col_owner[col]] += delta
+                v[col] -= delta
+            else:
+                min_slack[col] -= delta
+
+        current_col = next_col
+        if col_owner[current_col] == 0:
+            break
+
+    # Flip the alternating path back to the root.
+    while current_col:
+        previous_col = way[current_col]
+        col_owner[current_col] = col_owner[previous_col]
+        current_col = previous_col
+
+
+def repair_assignment(
+    cost: Sequence[Sequence[float]],
+    solution: AssignmentSolution,
+    changed_columns: Iterable[int],
+) -> AssignmentSolution:
+    """Re-optimize a square assignment after the costs of a few columns changed.
+
+    Starts from the previous matching and potentials: each changed column gets the
+    largest potential that keeps every reduced cost non-negative, its row is freed
+    when the matched pair is no longer tight, and only the freed rows are
+    re-augmented. That is ``O(n^2)`` per changed column instead of ``O(n^3)``.
+    """
+
+    size = len(cost)
+    if any(len(row) != size for row in cost) or len(solution.row_to_col) != size:
+        raise ValueError("Warm-start repair requires the square cost matrix of the prior solve")
+
+    u = [0.0, *solution.row_potentials]
+    v = [0.0, *solution.col_potentials]
+    col_owner = [0] * (size + 1)
+    for row, col in enumerate(solution.row_to_col):
+        col_owner[col + 1] = row + 1
+
+    free_rows: list[int] = []
+    for col in sorted(set(changed_columns)):
+        reduced = [
+            cost[row][col] - u[row + 1] for row in range(size) if cost[row][col] != FORBIDDEN
+        ]
+        v[col + 1] = min(reduced) if reduced else 0.0
+        owner = col_owner[col + 1]
+        if owner and cost[owner - 1][col] - u[owner] - v[col + 1] > _TIGHTNESS_EPSILON:
+            col_owner[col + 1] = 0
+            free_rows.append(owner)
+
+    for row in free_rows:
+        _augment(row, cost, u, v, col_owner)
+
+    row_to_col = [0] * size
+    for col in range(1, size + 1):
+        row_to_col[col_owner[col] - 1] = col - 1
+
+    return AssignmentSolution(
+        row_to_col=tuple(row_to_col),
+        total_cost=sum(cost[row][col] for row, col in enumerate(row_to_col)),
+        row_potentials=tuple(u[1:]),
+        col_potentials=tuple(v[1:]),
+    )
@@ -0,0 +1,65 @@
+"""Batch lineup optimization across many teams and weeks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+
+from app.optimizer.engine import optimize_lineup
+from app.optimizer.models import (
+    OptimizerEngine,
+    OptimizerProblem,
+    OptimizerResult,
+    SolverBudget,
+)
+
+# Below this many distinct problems, process start-up costs more than the solves.
+MIN_PARALLEL_PROBLEMS = 8
+
+
+def optimize_lineups(
+    problems: Iterable[OptimizerProblem],
+    *,
+    engine: OptimizerEngine = "assignment",
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    budget: SolverBudget | None = None,
+) -> list[OptimizerResult]:
+    """Solve many lineup problems, returning results in input order.
+
+    Identical problems are solved once. Distinct problems run on ``executor`` when
+    provided, otherwise on a process pool of ``max_workers`` processes when the
+    batch is large enough to amortize the pool, and inline in every other case.
+    """
+
+    problem_list = list(problems)
+    unique_index: dict[OptimizerProblem, int] = {}
+    for problem in problem_list:
+        unique_index.setdefault(problem, len(unique_index))
+    unique_problems = list(unique_index)
+
+    solve = partial(solve_problem, engine=engine, budget=budget)
+    if executor is not None:
+        unique_results = list(executor.map(solve, unique_problems))
+    elif max_workers and max_workers > 1 and len(unique_problems) >= MIN_PARALLEL_PROBLEMS:
+        chunksize = max(1, len(unique_problems) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            unique_results = list(pool.map(solve, unique_problems, chunksize=chunksize))
+    else:
+        unique_results = [solve(problem) for problem in unique_problems]
+
+    return [unique_results[unique_index[problem]] for problem in problem_list]
+
+
+def solve_problem(
+    problem: OptimizerProblem,
+    *,
+    engine: OptimizerEngine = "assignment",
+    budget: SolverBudget | None = None,
+) -> OptimizerResult:
+    """Solve one lineup problem; a picklable entry point for worker pools."""
+
+    return optimize_lineup(
+        problem.players, problem.slots, engine=engine, budget=budget, matrix=problem.matrix
+    )
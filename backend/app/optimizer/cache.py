@@ -0,0 +1,199 @@
+"""Content-addressed cache for optimizer results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import asdict
+from threading import Lock
+
+from app.clients.redis import AsyncRedis
+from app.optimizer.models import (
+    LineupDistribution,
+    OptimizerAssignment,
+    OptimizerEngine,
+    OptimizerProblem,
+    OptimizerResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the fingerprint layout or the serialized result format changes.
+CACHE_KEY_VERSION = "v1"
+
+
+def problem_fingerprint(problem: OptimizerProblem, engine: OptimizerEngine = "assignment") -> str:
+    """Return a stable hash of everything that determines a lineup's solution.
+
+    Covers each player's ``(player_id, positions, projected_points, status)`` and
+    the slot layout, so any projection or eligibility change yields a new key.
+    """
+
+    payload = {
+        "engine": engine,
+        "players": [
+            [player.player_id, list(player.positions), player.projected_points, player.status]
+            for player in problem.players
+        ],
+        "slots": [
+            [slot.slot_id, slot.slot_name, list(slot.eligible_positions)]
+            for slot in problem.slots
+        ],
+    }
+    encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class OptimizerResultCache:
+    """Two-tier (in-process LRU + optional Redis) cache of optimizer results.
+
+    Entries are keyed by :func:`problem_fingerprint`, so a changed roster or
+    projection simply misses and stale results age out via the TTL. Reads and
+    writes are coroutines so the Redis round trip never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl_seconds: int = 300,
+        redis_client: AsyncRedis | None = None,
+        namespace: str = "optimizer",
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._redis = redis_client
+        self._namespace = namespace
+        self._entries: OrderedDict[str, tuple[float, OptimizerResult]] = OrderedDict()
+        self._lock = Lock()
+
+    async def get(
+        self, problem: OptimizerProblem, engine: OptimizerEngine = "assignment"
+    ) -> OptimizerResult | None:
+        """Return the cached result for ``problem`` or ``None`` on a miss."""
+
+        fingerprint = problem_fingerprint(problem, engine)
+        result = self._get_local(fingerprint)
+        if result is not None:
+            return result
+
+        result = await self._get_remote(fingerprint)
+        if result is not None:
+            self._set_local(fingerprint, result)
+        return result
+
+    async def set(
+        self,
+        problem: OptimizerProblem,
+        result: OptimizerResult,
+        engine: OptimizerEngine = "assignment",
+    ) -> None:
+        """Store ``result`` for ``problem`` in every configured tier.
+
+        Anytime results cut off by a solver budget (positive optimality gap) are
+        not stored, so a truncated solve under load never outlives that load.
+        """
+
+        if result.optimality_gap:
+            return
+        fingerprint = problem_fingerprint(problem, engine)
+        self._set_local(fingerprint, result)
+        await self._set_remote(fingerprint, result)
+
+    async def get_or_compute(
+        self,
+        problem: OptimizerProblem,
+        compute: Callable[[OptimizerProblem], OptimizerResult],
+        engine: OptimizerEngine = "assignment",
+    ) -> OptimizerResult:
+        """Return the cached result or compute, store, and return a fresh one."""
+
+        result = await self.get(problem, engine)
+        if result is None:
+            result = compute(problem)
+            await self.set(problem, result, engine)
+        return result
+
+    def clear(self) -> None:
+        """Drop every in-process entry (the Redis tier expires on its own)."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _get_local(self, fingerprint: str) -> OptimizerResult | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(fingerprint)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= now:
+                del self._entries[fingerprint]
+                return None
+            self._entries.move_to_end(fingerprint)
+            return result
+
+    def _set_local(self, fingerprint: str, result: OptimizerResult) -> None:
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[fingerprint] = (expires_at, result)
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _redis_key(self, fingerprint: str) -> str:
+        return f"{self._namespace}:{CACHE_KEY_VERSION}:{fingerprint}"
+
+    async def _get_remote(self, fingerprint: str) -> OptimizerResult | None:
+        if self._redis is None:
+            return None
+        try:
+            payload = await self._redis.get(self._redis_key(fingerprint))
+        except Exception:  # pragma: no cover - network failures degrade to a miss
+            logger.warning("Optimizer cache read failed", exc_info=True)
+            return None
+        if payload is None:
+            return None
+        try:
+            return _decode_result(payload)
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Discarding malformed optimizer cache entry %s", fingerprint)
+            return None
+
+    async def _set_remote(self, fingerprint: str, result: OptimizerResult) -> None:
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                self._redis_key(fingerprint), _encode_result(result), ex=self.ttl_seconds
+            )
+        except Exception:  # pragma: no cover - network failures only skip the shared tier
+            logger.warning("Optimizer cache write failed", exc_info=True)
+
+
+def _encode_result(result: OptimizerResult) -> str:
+    return json.dumps(asdict(result), separators=(",", ":"))
+
+
+def _decode_result(payload: str | bytes) -> OptimizerResult:
+    data = json.loads(payload)
+    distribution = data.get("distribution")
+    return OptimizerResult(
+        assignments=tuple(OptimizerAssignment(**item) for item in data["assignments"]),
+        total_points=float(data["total_points"]),
+        fallback_used=bool(data["fallback_used"]),
+        engine=data["engine"],
+        distribution=LineupDistribution(**distribution) if distribution else None,
+        objective_bound=data.get("objective_bound"),
+        optimality_gap=data.get("optimality_gap"),
+    )
@@ -0,0 +1,179 @@
+"""Columnar roster storage shared by the roster service and the optimizer."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from threading import Lock
+
+import numpy as np
+
+from app.optimizer.matrix import LineupMatrix, lineup_matrix_from_masks
+from app.optimizer.models import OptimizerPlayer, OptimizerSlot
+from app.optimizer.rules import position_mask
+
+# Bitmasks are packed into uint64 lanes; wider token sets fall back to Python ints.
+_MAX_VECTOR_BITS = 64
+
+# Process-wide code per player status; code 0 is reserved for "no status".
+_status_codes: dict[str, int] = {}
+_statuses: list[str | None] = [None]
+_status_codes_lock = Lock()
+
+
+def status_code(status: str | None) -> int:
+    """Return the small integer interned for ``status`` (``0`` for ``None``)."""
+
+    if status is None:
+        return 0
+    code = _status_codes.get(status)
+    if code is None:
+        with _status_codes_lock:
+            code = _status_codes.get(status)
+            if code is None:
+                code = len(_statuses)
+                _status_codes[status] = code
+                _statuses.append(status)
+    return code
+
+
+def status_for_code(code: int) -> str | None:
+    """Return the status string interned as ``code``."""
+
+    return _statuses[code]
+
+
+@dataclass(frozen=True, slots=True)
+class RosterColumns:
+    """Struct-of-arrays view of a roster; row ``i`` describes ``player_ids[i]``.
+
+    Numeric fields are NumPy arrays so rendering and summaries stay vectorized,
+    and string fields are tuples shared with the ORM rows they came from.
+    Missing actual points are stored as NaN.
+    """
+
+    player_ids: tuple[str, ...]
+    names: tuple[str, ...]
+    team_abbrs: tuple[str, ...]
+    position_labels: tuple[str, ...]
+    positions: tuple[tuple[str, ...], ...]
+    slots: tuple[str, ...]
+    points: np.ndarray
+    actual_points: np.ndarray
+    status_codes: np.ndarray
+    position_masks: np.ndarray
+    index: Mapping[str, int]
+
+    def __len__(self) -> int:
+        return len(self.player_ids)
+
+    @property
+    def available_mask(self) -> int:
+        """Return the union of every rostered player's position bitmask."""
+
+        return int(np.bitwise_or.reduce(self.position_masks, initial=0))
+
+    def status(self, row: int) -> str | None:
+        return status_for_code(int(self.status_codes[row]))
+
+    def actual(self, row: int) -> float | None:
+        value = float(self.actual_points[row])
+        return None if math.isnan(value) else value
+
+    def lineup_matrix(self, slots: Sequence[OptimizerSlot]) -> LineupMatrix:
+        """Build the optimizer's eligibility matrix straight from the stored masks."""
+
+        return lineup_matrix_from_masks(
+            self.position_masks,
+            [position_mask(slot.eligible_positions) for slot in slots],
+            self.points,
+        )
+
+    def optimizer_players(self) -> tuple[OptimizerPlayer, ...]:
+        """Materialize the optimizer's player records in row order."""
+
+        return tuple(
+            OptimizerPlayer(
+                player_id=player_id,
+                name=name,
+                positions=positions,
+                projected_points=points,
+                status=self.status(row),
+            )
+            for row, (player_id, name, positions, points) in enumerate(
+                zip(
+                    self.player_ids,
+                    self.names,
+                    self.positions,
+                    self.points.tolist(),
+                    strict=True,
+                )
+            )
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RosterEntry:
+    """One player's roster entry as handed to :class:`RosterColumnsBuilder`."""
+
+    player_id: str
+    name: str
+    team_abbr: str
+    position_label: str
+    positions: tuple[str, ...]
+    slot: str
+    points: float
+    actual_points: float | None = None
+    status: str | None = None
+
+
+@dataclass(slots=True)
+class RosterColumnsBuilder:
+    """Accumulate roster rows column by column, then freeze them into arrays."""
+
+    player_ids: list[str] = field(default_factory=list)
+    names: list[str] = field(default_factory=list)
+    team_abbrs: list[str] = field(default_factory=list)
+    position_labels: list[str] = field(default_factory=list)
+    positions: list[tuple[str, ...]] = field(default_factory=list)
+    slots: list[str] = field(default_factory=list)
+    points: list[float] = field(default_factory=list)
+    actual_points: list[float] = field(default_factory=list)
+    status_codes: list[int] = field(default_factory=list)
+    position_masks: list[int] = field(default_factory=list)
+    index: dict[str, int] = field(default_factory=dict)
+
+    def append(self, entry: RosterEntry) -> bool:
+        """Add one player row; returns False when its ``player_id`` is already present."""
+
+        if entry.player_id in self.index:
+            return False
+        self.index[entry.player_id] = len(self.player_ids)
+        self.player_ids.append(entry.player_id)
+        self.names.append(entry.name)
+        self.team_abbrs.append(entry.team_abbr)
+        self.position_labels.append(entry.position_label)
+        self.positions.append(entry.positions)
+        self.slots.append(entry.slot)
+        self.points.append(entry.points)
+        self.actual_points.append(math.nan if entry.actual_points is None else entry.actual_points)
+        self.status_codes.append(status_code(entry.status))
+        self.position_masks.append(position_mask(entry.positions))
+        return True
+
+    def build(self) -> RosterColumns:
+        wide = max(self.position_masks, default=0).bit_length() > _MAX_VECTOR_BITS
+        return RosterColumns(
+            player_ids=tuple(self.player_ids),
+            names=tuple(self.names),
+            team_abbrs=tuple(self.team_abbrs),
+            position_labels=tuple(self.position_labels),
+            positions=tuple(self.positions),
+            slots=tuple(self.slots),
+            points=np.array(self.points, dtype=np.float64),
+            actual_points=np.array(self.actual_points, dtype=np.float64),
+            status_codes=np.array(self.status_codes, dtype=np.int32),
+            position_masks=np.array(self.position_masks, dtype=object if wide else np.uint64),
+            index=self.index,
+        )
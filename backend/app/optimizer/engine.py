@@ -2,156 +2,302 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
 
+import numpy as np
+
+from app.optimizer.assignment import FORBIDDEN, solve_assignment
+from app.optimizer.matrix import LineupMatrix, build_lineup_matrix
 from app.optimizer.models import (
+    DEFAULT_SOLVER_BUDGET,
     OptimizerAssignment,
+    OptimizerEngine,
     OptimizerPlayer,
     OptimizerResult,
     OptimizerSlot,
+    SolverBudget,
 )
 
 
 def optimize_lineup(
     players: Iterable[OptimizerPlayer],
     slots: Iterable[OptimizerSlot],
+    *,
+    engine: OptimizerEngine = "assignment",
+    budget: SolverBudget | None = None,
+    matrix: LineupMatrix | None = None,
 ) -> OptimizerResult:
-    """Compute the optimal lineup using CP-SAT with a greedy fallback."""
+    """Compute the optimal lineup with the requested engine.
+
+    The default ``assignment`` engine solves the slot-filling matching exactly
+    without external dependencies. ``cp_sat`` is kept for lineups that need side
+    constraints and falls back to the greedy heuristic when ortools is unavailable.
+    ``budget`` bounds the CP-SAT search; the result then carries the best lineup
+    found, the proven objective bound, and the remaining optimality gap.
+    ``matrix`` reuses an eligibility matrix already built for these players and slots.
+    """
 
     player_list = list(players)
     slot_list = list(slots)
 
     if not player_list or not slot_list:
-        return OptimizerResult(assignments=tuple(), total_points=0.0, fallback_used=True)
+        return OptimizerResult(
+            assignments=tuple(), total_points=0.0, fallback_used=True, engine=engine
+        )
+
+    if matrix is None:
+        matrix = build_lineup_matrix(player_list, slot_list)
+
+    if engine == "assignment":
+        return _solve_with_assignment(player_list, slot_list, matrix)
+    if engine == "greedy":
+        return _solve_with_greedy(player_list, slot_list, matrix)
+    if engine != "cp_sat":
+        raise ValueError(f"Unknown optimizer engine {engine!r}")
 
     try:
-        return _solve_with_cp_sat(player_list, slot_list)
+        return _solve_with_cp_sat(player_list, slot_list, matrix, budget or DEFAULT_SOLVER_BUDGET)
     except Exception:  # pragma: no cover - exercised when ortools unavailable
-        return _solve_with_greedy(player_list, slot_list)
+        return _solve_with_greedy(player_list, slot_list, matrix)
+
+
+def _solve_with_assignment(
+    players: list[OptimizerPlayer],
+    slots: list[OptimizerSlot],
+    matrix: LineupMatrix,
+) -> OptimizerResult:
+    assignments = [
+        _assignment_for(slot, players[player_index])
+        for slot, player_index in zip(slots, assign_slots(matrix), strict=True)
+        if player_index is not None
+    ]
+
+    total_points = sum(assignment.projected_points for assignment in assignments)
+    return OptimizerResult(
+        assignments=tuple(assignments),
+        total_points=total_points,
+        engine="assignment",
+        objective_bound=total_points,
+        optimality_gap=0.0,
+    )
+
+
+def assign_slots(matrix: LineupMatrix, weights: np.ndarray | None = None) -> list[int | None]:
+    """Return the optimal player index per slot (``None`` when left vacant).
+
+    ``weights`` overrides the projection vector, letting callers score players on
+    a different objective while reusing the same eligibility structure.
+    """
+
+    player_count = matrix.shape[1]
+    cost, _ = slot_cost_matrix(matrix, weights)
+    solution = solve_assignment(cost.tolist())
+    return [
+        player_index if player_index < player_count else None
+        for player_index in solution.row_to_col
+    ]
+
+
+def slot_cost_matrix(
+    matrix: LineupMatrix, weights: np.ndarray | None = None
+) -> tuple[np.ndarray, float]:
+    """Return the ``slots x (players + slots)`` assignment costs and the vacancy cost.
+
+    One private "vacant" column per slot keeps the problem feasible when the
+    roster cannot fill every slot; its cost dominates any achievable points so
+    vacancies are only used when unavoidable.
+    """
+
+    slot_count = matrix.shape[0]
+    points = matrix.points if weights is None else weights
+    vacancy_cost = 1.0 + 2.0 * slot_count * float(np.abs(points).max(initial=0.0))
+    vacancy_block = np.full((slot_count, slot_count), FORBIDDEN)
+    np.fill_diagonal(vacancy_block, vacancy_cost)
+    cost = np.hstack([np.where(matrix.eligibility, -points, FORBIDDEN), vacancy_block])
+    return cost, vacancy_cost
 
 
 def _solve_with_cp_sat(
     players: list[OptimizerPlayer],
     slots: list[OptimizerSlot],
+    matrix: LineupMatrix,
+    budget: SolverBudget,
 ) -> OptimizerResult:
     from ortools.sat.python import cp_model  # type: ignore
 
-    model = cp_model.CpModel()
-    variables: dict[tuple[int, int], cp_model.IntVar] = {}
-    player_indices = {player.player_id: idx for idx, player in enumerate(players)}
+    template = _get_cp_sat_template(matrix)
 
-    for slot_idx, slot in enumerate(slots):
-        eligible_indices = [
-            player_indices[player.player_id]
-            for player in players
-            if set(player.positions) & set(slot.eligible_positions)
-        ]
-
-        # If we cannot determine eligibility for a slot, allow all players.
-        if not eligible_indices:
-            eligible_indices = list(player_indices.values())
-
-        slot_vars = []
-        for player_index in eligible_indices:
-            var = model.NewBoolVar(f"slot_{slot_idx}_player_{player_index}")
-            variables[(slot_idx, player_index)] = var
-            slot_vars.append(var)
-
-        model.Add(sum(slot_vars) == 1)
-
-    for player_index in player_indices.values():
-        player_vars = [
-            variables[(slot_idx, player_index)]
-            for slot_idx in range(len(slots))
-            if (slot_idx, player_index) in variables
-        ]
-        if player_vars:
-            model.Add(sum(player_vars) <= 1)
-
-    objective_terms = []
     scaling_factor = 1000
-    for slot_idx, slot in enumerate(slots):
-        for player_index, player in enumerate(players):
-            key = (slot_idx, player_index)
-            if key not in variables:
-                continue
-            weight = int(round(player.projected_points * scaling_factor))
-            objective_terms.append(variables[key] * weight)
-
-    model.Maximize(sum(objective_terms))
+    weights = np.rint(matrix.points[template.player_indices] * scaling_factor).astype(int).tolist()
 
     solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = 2.0
-    solver.parameters.num_search_workers = 8
+    solver.parameters.max_time_in_seconds = budget.deadline_seconds
+    solver.parameters.num_workers = budget.workers
+    solver.parameters.relative_gap_limit = budget.relative_gap
+
+    # Templates are shared between requests: only the copy happens under the lock,
+    # and the objective is set and solved on this call's private clone.
+    with template.lock:
+        model = template.model.Clone()
+    variables = [model.GetBoolVarFromProtoIndex(index) for index in template.variable_indices]
+    model.Maximize(cp_model.LinearExpr.WeightedSum(variables, weights))
     status = solver.Solve(model)
+    solved = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    chosen_indices: dict[int, int] = {}
+    objective_bound: float | None = None
+    optimality_gap: float | None = None
+    if solved:
+        objective = solver.ObjectiveValue()
+        bound = solver.BestObjectiveBound()
+        objective_bound = bound / scaling_factor
+        optimality_gap = (
+            0.0
+            if status == cp_model.OPTIMAL
+            else max(0.0, (bound - objective) / max(abs(bound), 1.0))
+        )
+        for slot_idx, player_index, var in zip(
+            template.slot_indices, template.player_indices, variables, strict=True
+        ):
+            if solver.Value(var) == 1:
+                chosen_indices[slot_idx] = player_index
 
-    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-        return _solve_with_greedy(players, slots)
+    if not solved:
+        return _solve_with_greedy(players, slots, matrix)
 
     assignments: list[OptimizerAssignment] = []
     for slot_idx, slot in enumerate(slots):
-        chosen_player: OptimizerPlayer | None = None
-        for player_index, player in enumerate(players):
-            key = (slot_idx, player_index)
-            if key not in variables:
-                continue
-            if solver.Value(variables[key]) == 1:
-                chosen_player = player
-                break
-        if chosen_player is None:
+        chosen_index = chosen_indices.get(slot_idx)
+        if chosen_index is None:
             # Fallback to the highest projected player for the slot.
-            eligible_players = [
-                player
-                for player in players
-                if set(player.positions) & set(slot.eligible_positions)
-            ]
-            if not eligible_players:
-                eligible_players = players
-            chosen_player = max(eligible_players, key=lambda p: p.projected_points)
-
-        assignments.append(
-            OptimizerAssignment(
-                slot_id=slot.slot_id,
-                slot_name=slot.slot_name,
-                player_id=chosen_player.player_id,
-                projected_points=chosen_player.projected_points,
-            )
-        )
+            eligible = matrix.eligible_players(slot_idx)
+            chosen_index = int(eligible[np.argmax(matrix.points[eligible])])
+        assignments.append(_assignment_for(slot, players[chosen_index]))
 
     total_points = sum(assignment.projected_points for assignment in assignments)
-    return OptimizerResult(assignments=tuple(assignments), total_points=total_points)
+    return OptimizerResult(
+        assignments=tuple(assignments),
+        total_points=total_points,
+        engine="cp_sat",
+        objective_bound=objective_bound,
+        optimality_gap=optimality_gap,
+    )
+
+
+@dataclass(slots=True)
+class _CpSatTemplate:
+    """Structural CP-SAT model reused across calls with the same slot layout.
+
+    ``model`` carries no objective and is never mutated after it is built; each
+    solve clones it and looks its variables up by ``variable_indices``.
+    """
+
+    model: Any
+    slot_indices: tuple[int, ...]
+    player_indices: np.ndarray
+    variable_indices: tuple[int, ...]
+    lock: Lock = field(default_factory=Lock)
+
+
+_CP_SAT_TEMPLATE_CACHE_SIZE = 256
+_cp_sat_templates: OrderedDict[tuple[tuple[int, int], bytes], _CpSatTemplate] = OrderedDict()
+_cp_sat_templates_lock = Lock()
+
+
+def _get_cp_sat_template(matrix: LineupMatrix) -> _CpSatTemplate:
+    """Return the cached structural model for a slot/eligibility signature."""
+
+    signature = matrix.signature()
+    with _cp_sat_templates_lock:
+        template = _cp_sat_templates.get(signature)
+        if template is not None:
+            _cp_sat_templates.move_to_end(signature)
+            return template
+
+    template = _build_cp_sat_template(matrix)
+
+    with _cp_sat_templates_lock:
+        # Another caller may have built the same template concurrently; keep the first.
+        existing = _cp_sat_templates.setdefault(signature, template)
+        _cp_sat_templates.move_to_end(signature)
+        while len(_cp_sat_templates) > _CP_SAT_TEMPLATE_CACHE_SIZE:
+            _cp_sat_templates.popitem(last=False)
+    return existing
+
+
+def _build_cp_sat_template(matrix: LineupMatrix) -> _CpSatTemplate:
+    from ortools.sat.python import cp_model  # type: ignore
+
+    model = cp_model.CpModel()
+    slot_indices, player_indices = np.nonzero(matrix.eligibility)
+    variables = [
+        model.NewBoolVar(f"slot_{slot_idx}_player_{player_index}")
+        for slot_idx, player_index in zip(slot_indices, player_indices, strict=True)
+    ]
+
+    slot_vars: dict[int, list[cp_model.IntVar]] = defaultdict(list)
+    player_vars: dict[int, list[cp_model.IntVar]] = defaultdict(list)
+    for slot_idx, player_index, var in zip(slot_indices, player_indices, variables, strict=True):
+        slot_vars[int(slot_idx)].append(var)
+        player_vars[int(player_index)].append(var)
+
+    for vars_for_slot in slot_vars.values():
+        model.Add(sum(vars_for_slot) == 1)
+    for vars_for_player in player_vars.values():
+        model.Add(sum(vars_for_player) <= 1)
+
+    return _CpSatTemplate(
+        model=model,
+        slot_indices=tuple(slot_indices.tolist()),
+        player_indices=player_indices,
+        variable_indices=tuple(var.Index() for var in variables),
+    )
+
+
+def clear_model_cache() -> None:
+    """Drop every cached CP-SAT model template."""
+
+    with _cp_sat_templates_lock:
+        _cp_sat_templates.clear()
 
 
 def _solve_with_greedy(
     players: list[OptimizerPlayer],
     slots: list[OptimizerSlot],
+    matrix: LineupMatrix,
 ) -> OptimizerResult:
-    remaining_players = players.copy()
-    assignments: list[OptimizerAssignment] = []
+    remaining = np.ones(len(players), dtype=bool)
+    assignments: dict[int, OptimizerAssignment] = {}
 
-    for slot in slots:
-        eligible_players = [
-            player
-            for player in remaining_players
-            if set(player.positions) & set(slot.eligible_positions)
-        ]
-        if not eligible_players:
-            eligible_players = remaining_players
+    # Fill the most restrictive slots first so broad slots such as FLEX do not
+    # consume a player that a narrower slot listed later depends on.
+    slot_order = np.argsort(matrix.eligibility.sum(axis=1), kind="stable")
 
-        if not eligible_players:
+    for slot_idx in slot_order.tolist():
+        candidates = matrix.eligibility[slot_idx] & remaining
+        if not candidates.any():
+            candidates = remaining
+        if not candidates.any():
             break
 
-        chosen_player = max(eligible_players, key=lambda p: p.projected_points)
-        assignments.append(
-            OptimizerAssignment(
-                slot_id=slot.slot_id,
-                slot_name=slot.slot_name,
-                player_id=chosen_player.player_id,
-                projected_points=chosen_player.projected_points,
-            )
-        )
-        remaining_players = [player for player in remaining_players if player.player_id != chosen_player.player_id]
+        chosen_index = int(np.argmax(np.where(candidates, matrix.points, -np.inf)))
+        assignments[slot_idx] = _assignment_for(slots[slot_idx], players[chosen_index])
+        remaining[chosen_index] = False
+
+    ordered = tuple(assignments[slot_idx] for slot_idx in sorted(assignments))
+    total_points = sum(assignment.projected_points for assignment in ordered)
+    return OptimizerResult(
+        assignments=ordered, total_points=total_points, fallback_used=True, engine="greedy"
+    )
 
-    total_points = sum(assignment.projected_points for assignment in assignments)
-    return OptimizerResult(assignments=tuple(assignments), total_points=total_points, fallback_used=True)
 
+def _assignment_for(slot: OptimizerSlot, player: OptimizerPlayer) -> OptimizerAssignment:
+    return OptimizerAssignment(
+        slot_id=slot.slot_id,
+        slot_name=slot.slot_name,
+        player_id=player.player_id,
+        projected_points=player.projected_points,
+    )
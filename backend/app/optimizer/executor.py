@@ -0,0 +1,177 @@
+"""Async facade that keeps lineup solves off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Any, TypeVar
+
+from app.optimizer.alternatives import optimize_lineup_alternatives
+from app.optimizer.batch import optimize_lineups, solve_problem
+from app.optimizer.incremental import IncrementalLineupOptimizer
+from app.optimizer.models import (
+    DEFAULT_SOLVER_BUDGET,
+    OptimizerEngine,
+    OptimizerProblem,
+    OptimizerResult,
+    SolverBudget,
+)
+
+T = TypeVar("T")
+
+
+class OptimizerSaturatedError(RuntimeError):
+    """Raised when the optimizer queue is full and the request is shed."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("Lineup optimizer is at capacity. Please try again soon.")
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionLimits:
+    """How many solves may run and wait at once, and the Retry-After for the rest."""
+
+    max_concurrency: int = 2
+    max_queue_depth: int = 16
+    retry_after_seconds: int = 1
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if self.max_queue_depth < 0:
+            raise ValueError("max_queue_depth must be non-negative")
+
+
+DEFAULT_ADMISSION_LIMITS = AdmissionLimits()
+
+
+class AsyncLineupOptimizer:
+    """Run solves on a bounded worker pool with admission control.
+
+    Per ``limits``, at most ``max_concurrency`` solves run at once and at most
+    ``max_queue_depth`` more may wait for a worker; anything beyond that fails fast
+    with :class:`OptimizerSaturatedError` instead of queueing unboundedly.
+
+    Search-based solves get ``budget`` when a worker is free; once solves start
+    queueing, the deadline shrinks with the backlog (down to
+    ``min_deadline_seconds``) so queued requests still finish in bounded time.
+    """
+
+    def __init__(
+        self,
+        limits: AdmissionLimits = DEFAULT_ADMISSION_LIMITS,
+        *,
+        executor: Executor | None = None,
+        budget: SolverBudget = DEFAULT_SOLVER_BUDGET,
+        min_deadline_seconds: float = 0.1,
+    ) -> None:
+        self.limits = limits
+        self.max_concurrency = limits.max_concurrency
+        self.max_queue_depth = limits.max_queue_depth
+        self.retry_after_seconds = limits.retry_after_seconds
+        self.budget = budget
+        self.min_deadline_seconds = min(min_deadline_seconds, budget.deadline_seconds)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore = asyncio.Semaphore(limits.max_concurrency)
+        self._admitted = 0
+        self._running = 0
+
+    @property
+    def running(self) -> int:
+        """Number of solves currently executing on a worker."""
+
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        """Number of admitted solves waiting for a worker."""
+
+        return self._admitted - self._running
+
+    def budget_for_load(self) -> SolverBudget:
+        """Return the budget for the next solve given the current backlog."""
+
+        backlog = self._admitted + 1 - self.max_concurrency
+        if backlog <= 0:
+            return self.budget
+        deadline = self.budget.deadline_seconds / (1 + backlog)
+        return replace(self.budget, deadline_seconds=max(self.min_deadline_seconds, deadline))
+
+    async def solve(
+        self,
+        problem: OptimizerProblem,
+        engine: OptimizerEngine = "assignment",
+        *,
+        budget: SolverBudget | None = None,
+    ) -> OptimizerResult:
+        """Solve a single lineup on the worker pool."""
+
+        solve = partial(solve_problem, engine=engine, budget=budget or self.budget_for_load())
+        return await self._submit(solve, problem)
+
+    async def solve_batch(
+        self,
+        problems: Iterable[OptimizerProblem],
+        engine: OptimizerEngine = "assignment",
+        *,
+        budget: SolverBudget | None = None,
+    ) -> list[OptimizerResult]:
+        """Solve a group of lineups as one pool job, returning results in input order."""
+
+        solve = partial(optimize_lineups, engine=engine, budget=budget or self.budget_for_load())
+        return await self._submit(solve, tuple(problems))
+
+    async def solve_alternatives(
+        self, problem: OptimizerProblem, *, k: int, min_difference: int = 1
+    ) -> list[OptimizerResult]:
+        """Solve the ``k`` best distinct lineups for one problem on the worker pool."""
+
+        solve = partial(optimize_lineup_alternatives, k=k, min_difference=min_difference)
+        return await self._submit(solve, problem.players, problem.slots)
+
+    async def solve_incremental(
+        self, incremental: IncrementalLineupOptimizer, key: Hashable, problem: OptimizerProblem
+    ) -> OptimizerResult:
+        """Solve ``problem`` through ``incremental`` so later player updates warm start.
+
+        The cached duals live in this process, so the solve runs on a thread here
+        rather than on the worker pool, under the same admission control.
+        """
+
+        solve = partial(incremental.refresh, key, problem.players, problem.slots)
+        return await self._submit(solve, in_process=True)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool owned by this facade."""
+
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _submit(self, func: Callable[..., T], *args: Any, in_process: bool = False) -> T:
+        if self._admitted >= self.max_concurrency + self.max_queue_depth:
+            raise OptimizerSaturatedError(retry_after=self.retry_after_seconds)
+
+        self._admitted += 1
+        try:
+            async with self._semaphore:
+                self._running += 1
+                try:
+                    if in_process:
+                        return await asyncio.to_thread(func, *args)
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(self._get_executor(), func, *args)
+                finally:
+                    self._running -= 1
+        finally:
+            self._admitted -= 1
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_concurrency)
+        return self._executor
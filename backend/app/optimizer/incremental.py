@@ -0,0 +1,315 @@
+"""Warm-started lineup re-optimization for single-player projection changes."""
+
+from __future__ import annotations
+
+from collections import OrderedDict, defaultdict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+from threading import Lock
+
+import numpy as np
+
+from app.optimizer.assignment import (
+    FORBIDDEN,
+    AssignmentSolution,
+    repair_assignment,
+    solve_assignment,
+)
+from app.optimizer.engine import optimize_lineup
+from app.optimizer.matrix import build_lineup_matrix
+from app.optimizer.models import (
+    OptimizerAssignment,
+    OptimizerPlayer,
+    OptimizerResult,
+    OptimizerSlot,
+)
+from app.optimizer.rules import position_mask
+
+
+@dataclass(frozen=True, slots=True)
+class LineupRepair:
+    """Outcome of re-optimizing a cached lineup after a player update."""
+
+    key: Hashable
+    result: OptimizerResult
+    changed_assignments: tuple[OptimizerAssignment, ...]
+    vacated_slot_ids: tuple[str, ...] = ()
+    warm_started: bool = True
+
+
+@dataclass(slots=True)
+class _LineupState:
+    players: list[OptimizerPlayer]
+    slots: list[OptimizerSlot]
+    player_index: dict[str, int]
+    slot_masks: list[int]
+    open_slots: list[bool]
+    vacancy_cost: float
+    cost: list[list[float]]
+    solution: AssignmentSolution
+    result: OptimizerResult
+
+
+class IncrementalLineupOptimizer:
+    """Keep the last solution and duals per lineup key and repair them in place.
+
+    Lineups are solved as a square assignment (slots plus one slack row per
+    player, against players plus one vacancy column per slot) so that the dual
+    potentials stay valid for warm starts. A player update only touches that
+    player's column: the stored potentials are patched and a single augmenting
+    pass re-optimizes the lineup.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._states: OrderedDict[Hashable, _LineupState] = OrderedDict()
+        self._keys_by_player: dict[str, set[Hashable]] = defaultdict(set)
+        self._lock = Lock()
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of lineups kept before the least recently used is evicted."""
+
+        return self._max_entries
+
+    def solve(
+        self,
+        key: Hashable,
+        players: Iterable[OptimizerPlayer],
+        slots: Iterable[OptimizerSlot],
+    ) -> OptimizerResult:
+        """Solve a lineup from scratch and remember it under ``key``."""
+
+        player_list = list(players)
+        slot_list = list(slots)
+        if not player_list or not slot_list:
+            with self._lock:
+                self._forget_locked(key)
+            return optimize_lineup(player_list, slot_list)
+
+        state = _build_state(player_list, slot_list)
+        with self._lock:
+            self._forget_locked(key)
+            self._states[key] = state
+            for player in player_list:
+                self._keys_by_player[player.player_id].add(key)
+            while len(self._states) > self._max_entries:
+                evicted_key, evicted = self._states.popitem(last=False)
+                self._unindex_locked(evicted_key, evicted)
+        return state.result
+
+    def refresh(
+        self,
+        key: Hashable,
+        players: Iterable[OptimizerPlayer],
+        slots: Iterable[OptimizerSlot],
+    ) -> OptimizerResult:
+        """Return the lineup for ``key``, repairing the cached one when only player data changed.
+
+        Falls back to :meth:`solve` when nothing is cached or the roster or slots differ.
+        """
+
+        player_list = list(players)
+        slot_list = list(slots)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or not _same_roster(state, player_list, slot_list):
+                changed = None
+            else:
+                changed = [
+                    player
+                    for player, cached in zip(player_list, state.players, strict=True)
+                    if player != cached
+                ]
+        if changed is None:
+            return self.solve(key, player_list, slot_list)
+        for player in changed:
+            self.update_player(key, player)
+        result = self.result_for(key)
+        return result if result is not None else self.solve(key, player_list, slot_list)
+
+    def result_for(self, key: Hashable) -> OptimizerResult | None:
+        """Return the cached result for ``key`` if one exists."""
+
+        with self._lock:
+            state = self._states.get(key)
+            return state.result if state else None
+
+    def update_player(self, key: Hashable, player: OptimizerPlayer) -> LineupRepair | None:
+        """Apply a changed projection/status/eligibility for one player on one lineup.
+
+        Returns ``None`` when the lineup is not cached or does not roster the player.
+        """
+
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or player.player_id not in state.player_index:
+                return None
+            self._states.move_to_end(key)
+            previous = state.result
+            warm_started = _apply_player_update(state, player)
+            if not warm_started:
+                state = _build_state(state.players, state.slots)
+                self._states[key] = state
+
+        return _describe_repair(key, previous, state.result, warm_started=warm_started)
+
+    def apply_player_update(self, player: OptimizerPlayer) -> list[LineupRepair]:
+        """Fan a single player's update out to every cached lineup rostering them."""
+
+        with self._lock:
+            keys = list(self._keys_by_player.get(player.player_id, ()))
+        repairs = [self.update_player(key, player) for key in keys]
+        return [repair for repair in repairs if repair is not None]
+
+    def forget(self, key: Hashable) -> None:
+        """Drop the cached lineup for ``key``."""
+
+        with self._lock:
+            self._forget_locked(key)
+
+    def _forget_locked(self, key: Hashable) -> None:
+        state = self._states.pop(key, None)
+        if state is not None:
+            self._unindex_locked(key, state)
+
+    def _unindex_locked(self, key: Hashable, state: _LineupState) -> None:
+        for player_id in state.player_index:
+            keys = self._keys_by_player.get(player_id)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_player[player_id]
+
+
+def _same_roster(
+    state: _LineupState, players: list[OptimizerPlayer], slots: list[OptimizerSlot]
+) -> bool:
+    return state.slots == slots and [player.player_id for player in state.players] == [
+        player.player_id for player in players
+    ]
+
+
+def _build_state(players: list[OptimizerPlayer], slots: list[OptimizerSlot]) -> _LineupState:
+    matrix = build_lineup_matrix(players, slots)
+    slot_count, player_count = matrix.shape
+    size = slot_count + player_count
+    vacancy_cost = 1.0 + 2.0 * slot_count * float(np.abs(matrix.points).max())
+
+    # Rows: slots then one slack row per player. Columns: players then one
+    # vacancy per slot. Slack rows absorb the players (and vacancies) left over.
+    cost = np.full((size, size), FORBIDDEN)
+    cost[:slot_count, :player_count] = np.where(matrix.eligibility, -matrix.points, FORBIDDEN)
+    cost[np.arange(slot_count), player_count + np.arange(slot_count)] = vacancy_cost
+    cost[slot_count:, :] = 0.0
+    cost_rows = cost.tolist()
+
+    # Slots whose positions match nobody were opened to every player by the matrix.
+    player_masks = [position_mask(player.positions) for player in players]
+    slot_masks = [position_mask(slot.eligible_positions) for slot in slots]
+    open_slots = [not any(slot_mask & mask for mask in player_masks) for slot_mask in slot_masks]
+
+    solution = solve_assignment(cost_rows)
+    return _LineupState(
+        players=players,
+        slots=slots,
+        player_index={player.player_id: idx for idx, player in enumerate(players)},
+        slot_masks=slot_masks,
+        open_slots=open_slots,
+        vacancy_cost=vacancy_cost,
+        cost=cost_rows,
+        solution=solution,
+        result=_result_from_solution(players, slots, solution),
+    )
+
+
+def _apply_player_update(state: _LineupState, player: OptimizerPlayer) -> bool:
+    """Patch ``player``'s column and repair; return False when a rebuild is needed."""
+
+    column = state.player_index[player.player_id]
+    state.players[column] = player
+    slot_count = len(state.slots)
+
+    # Vacancy costs are sized from the largest projection; rebuild if exceeded.
+    if 1.0 + 2.0 * slot_count * abs(player.projected_points) > state.vacancy_cost:
+        return False
+
+    player_mask = position_mask(player.positions)
+    eligible = [bool(mask & player_mask) for mask in state.slot_masks]
+    for slot_idx, matches in enumerate(eligible):
+        # Slots open to every player only stay open while nobody matches them.
+        if state.open_slots[slot_idx] and matches:
+            return False
+        allowed = matches or state.open_slots[slot_idx]
+        state.cost[slot_idx][column] = -player.projected_points if allowed else FORBIDDEN
+
+    if any(
+        not state.open_slots[slot_idx] and not _slot_has_match(state, slot_idx)
+        for slot_idx in range(slot_count)
+    ):
+        return False
+
+    state.solution = repair_assignment(state.cost, state.solution, [column])
+    state.result = _result_from_solution(state.players, state.slots, state.solution)
+    return True
+
+
+def _slot_has_match(state: _LineupState, slot_idx: int) -> bool:
+    row = state.cost[slot_idx]
+    return any(row[column] != FORBIDDEN for column in range(len(state.players)))
+
+
+def _result_from_solution(
+    players: list[OptimizerPlayer],
+    slots: list[OptimizerSlot],
+    solution: AssignmentSolution,
+) -> OptimizerResult:
+    player_count = len(players)
+    assignments: list[OptimizerAssignment] = []
+    # Rows past the slots are slack rows and never describe a lineup assignment.
+    for slot, column in zip(slots, solution.row_to_col[: len(slots)], strict=True):
+        if column >= player_count:
+            continue
+        player = players[column]
+        assignments.append(
+            OptimizerAssignment(
+                slot_id=slot.slot_id,
+                slot_name=slot.slot_name,
+                player_id=player.player_id,
+                projected_points=player.projected_points,
+            )
+        )
+    return OptimizerResult(
+        assignments=tuple(assignments),
+        total_points=sum(assignment.projected_points for assignment in assignments),
+        engine="assignment",
+    )
+
+
+def _describe_repair(
+    key: Hashable,
+    previous: OptimizerResult,
+    current: OptimizerResult,
+    *,
+    warm_started: bool,
+) -> LineupRepair:
+    previous_by_slot = {
+        assignment.slot_id: assignment.player_id for assignment in previous.assignments
+    }
+    current_slots = {assignment.slot_id for assignment in current.assignments}
+    changed = tuple(
+        assignment
+        for assignment in current.assignments
+        if previous_by_slot.get(assignment.slot_id) != assignment.player_id
+    )
+    vacated = tuple(slot_id for slot_id in previous_by_slot if slot_id not in current_slots)
+    return LineupRepair(
+        key=key,
+        result=current,
+        changed_assignments=changed,
+        vacated_slot_ids=vacated,
+        warm_started=warm_started,
+    )
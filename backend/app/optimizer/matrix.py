@@ -0,0 +1,82 @@
+"""Dense eligibility/projection arrays shared by every optimizer backend."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.optimizer.models import OptimizerPlayer, OptimizerSlot
+from app.optimizer.rules import position_mask
+
+# Bitmasks are packed into uint64 lanes; wider token sets fall back to Python ints.
+_MAX_VECTOR_BITS = 64
+
+
+@dataclass(frozen=True, slots=True)
+class LineupMatrix:
+    """Slot x player eligibility matrix plus the projection vector.
+
+    ``eligibility[s, p]`` is true when player ``p`` may fill slot ``s``. Slots whose
+    positions match no player are opened to every player, mirroring the optimizer's
+    long-standing behaviour for unknown slot types.
+    """
+
+    eligibility: np.ndarray
+    points: np.ndarray
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        slot_count, player_count = self.eligibility.shape
+        return slot_count, player_count
+
+    def eligible_players(self, slot_index: int) -> np.ndarray:
+        """Return the player indices eligible for ``slot_index``."""
+
+        return np.flatnonzero(self.eligibility[slot_index])
+
+    def signature(self) -> tuple[tuple[int, int], bytes]:
+        """Return a compact, hashable key describing the eligibility structure."""
+
+        return self.shape, np.packbits(self.eligibility).tobytes()
+
+
+def build_lineup_matrix(
+    players: list[OptimizerPlayer],
+    slots: list[OptimizerSlot],
+) -> LineupMatrix:
+    """Encode positions as bitmasks and evaluate eligibility in one pass."""
+
+    return lineup_matrix_from_masks(
+        [position_mask(player.positions) for player in players],
+        [position_mask(slot.eligible_positions) for slot in slots],
+        np.array([player.projected_points for player in players], dtype=np.float64),
+    )
+
+
+def lineup_matrix_from_masks(
+    player_masks: Sequence[int] | np.ndarray,
+    slot_masks: Sequence[int],
+    points: np.ndarray,
+) -> LineupMatrix:
+    """Evaluate eligibility from precomputed player and slot position bitmasks."""
+
+    widest = max(int(np.max(player_masks, initial=0)), max(slot_masks, default=0))
+    if widest.bit_length() <= _MAX_VECTOR_BITS:
+        player_vector = np.asarray(player_masks, dtype=np.uint64)
+        slot_vector = np.array(slot_masks, dtype=np.uint64)
+        eligibility = (slot_vector[:, None] & player_vector[None, :]) != 0
+    else:  # pragma: no cover - requires more than 64 distinct position tokens
+        eligibility = np.array(
+            [
+                [bool(slot_mask & int(player_mask)) for player_mask in player_masks]
+                for slot_mask in slot_masks
+            ],
+            dtype=bool,
+        ).reshape(len(slot_masks), len(player_masks))
+
+    # If we cannot determine eligibility for a slot, allow all players.
+    eligibility[~eligibility.any(axis=1)] = True
+
+    return LineupMatrix(eligibility=eligibility, points=points)
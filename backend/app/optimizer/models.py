@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from app.optimizer.matrix import LineupMatrix
+
+OptimizerEngine = Literal["assignment", "cp_sat", "greedy"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -14,6 +20,7 @@ class OptimizerPlayer:
     positions: tuple[str, ...]
     projected_points: float
     status: str | None = None
+    projected_stddev: float | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -26,6 +33,45 @@ class OptimizerSlot:
     current_player_id: str | None = None
 
 
+@dataclass(frozen=True, slots=True)
+class OptimizerProblem:
+    """Self-contained lineup problem; identical problems compare and hash equal.
+
+    ``matrix`` optionally carries the eligibility matrix already built for these
+    players and slots so the solver can skip rebuilding it; it is not part of the
+    problem's identity.
+    """
+
+    players: tuple[OptimizerPlayer, ...]
+    slots: tuple[OptimizerSlot, ...]
+    matrix: LineupMatrix | None = field(default=None, compare=False, repr=False)
+
+
+@dataclass(frozen=True, slots=True)
+class SolverBudget:
+    """Per-call limits for search-based engines (CP-SAT).
+
+    The solver stops at ``deadline_seconds`` or once the best solution is within
+    ``relative_gap`` of the proven bound, whichever comes first, and returns the
+    best lineup found so far.
+    """
+
+    deadline_seconds: float = 2.0
+    workers: int = 8
+    relative_gap: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.deadline_seconds <= 0:
+            raise ValueError("deadline_seconds must be positive")
+        if self.workers <= 0:
+            raise ValueError("workers must be positive")
+        if not 0.0 <= self.relative_gap <= 1.0:
+            raise ValueError("relative_gap must be between 0 and 1")
+
+
+DEFAULT_SOLVER_BUDGET = SolverBudget()
+
+
 @dataclass(frozen=True, slots=True)
 class OptimizerAssignment:
     """Mapping of a slot to the player selected for that role."""
@@ -36,6 +82,20 @@ class OptimizerAssignment:
     projected_points: float
 
 
+@dataclass(frozen=True, slots=True)
+class LineupDistribution:
+    """Simulated score distribution for a lineup.
+
+    ``floor`` and ``ceiling`` are the 10th and 90th percentile (p10/p90) totals.
+    """
+
+    mean: float
+    floor: float
+    ceiling: float
+    simulations: int
+    win_probability: float | None = None
+
+
 @dataclass(frozen=True, slots=True)
 class OptimizerResult:
     """Outcome returned from the lineup optimizer."""
@@ -43,6 +103,10 @@ class OptimizerResult:
     assignments: tuple[OptimizerAssignment, ...]
     total_points: float
     fallback_used: bool = False
+    engine: OptimizerEngine = "assignment"
+    distribution: LineupDistribution | None = None
+    objective_bound: float | None = None
+    optimality_gap: float | None = None
 
     @property
     def recommended_player_ids(self) -> set[str]:
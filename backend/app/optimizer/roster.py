@@ -0,0 +1,153 @@
+"""Roster-wide optimization covering starters, bench, IR, and taxi capacity."""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from app.optimizer.engine import optimize_lineup
+from app.optimizer.models import OptimizerPlayer, OptimizerResult, OptimizerSlot
+from app.optimizer.rules import (
+    ReserveSlotKind,
+    is_injured_reserve_eligible,
+    reserve_slot_kind,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ReservePlacement:
+    """Recommended non-starting slot for one rostered player."""
+
+    player_id: str
+    slot_name: str
+    kind: ReserveSlotKind
+
+
+@dataclass(frozen=True, slots=True)
+class RosterPlan:
+    """Complete recommended roster layout."""
+
+    lineup: OptimizerResult
+    reserves: tuple[ReservePlacement, ...]
+    overflow_player_ids: tuple[str, ...] = ()
+
+
+def optimize_roster(
+    players: Iterable[OptimizerPlayer],
+    slots: Iterable[OptimizerSlot],
+    reserve_slots: Iterable[str],
+    *,
+    current_slots: Mapping[str, str] | None = None,
+) -> RosterPlan:
+    """Recommend starters plus a bench/IR/taxi home for every other rostered player.
+
+    ``reserve_slots`` lists the league's non-starting slot names (for example
+    ``["BN", "BN", "IR", "TAXI"]``) and ``current_slots`` maps player ids to the
+    slot they occupy today. See :func:`plan_reserves` for the placement rules.
+    """
+
+    player_list = list(players)
+    lineup = optimize_lineup(player_list, slots)
+    return plan_reserves(player_list, lineup, reserve_slots, current_slots=current_slots)
+
+
+def plan_reserves(
+    players: Iterable[OptimizerPlayer],
+    lineup: OptimizerResult,
+    reserve_slots: Iterable[str],
+    *,
+    current_slots: Mapping[str, str] | None = None,
+) -> RosterPlan:
+    """Place every non-starter into the league's bench, IR, and taxi capacity.
+
+    Anyone may take the bench, IR takes IR-eligible statuses, and the taxi squad
+    only keeps its current occupants. Non-starters are taken by projection and
+    kept whenever the kept group still fits the three capacities, which keeps as
+    many players as possible and then the highest total projection in
+    ``O(n log n)``. Kept players fill taxi, then IR (current IR occupants first)
+    to keep bench spots open, then the bench. Players that fit nowhere are
+    reported as overflow, which means the roster needs a drop or a move before
+    lineups lock.
+    """
+
+    current = current_slots or {}
+    capacity: Counter[ReserveSlotKind] = Counter()
+    slot_names: dict[ReserveSlotKind, str] = {}
+    for slot_name in reserve_slots:
+        kind = reserve_slot_kind(slot_name)
+        if kind is None:
+            continue
+        capacity[kind] += 1
+        slot_names.setdefault(kind, slot_name)
+
+    def current_kind(player: OptimizerPlayer) -> ReserveSlotKind | None:
+        return reserve_slot_kind(current.get(player.player_id, ""))
+
+    def injured(player: OptimizerPlayer) -> bool:
+        return is_injured_reserve_eligible(player.status)
+
+    starters = lineup.recommended_player_ids
+    remaining = sorted(
+        (player for player in players if player.player_id not in starters),
+        key=lambda player: player.projected_points,
+        reverse=True,
+    )
+    kept: list[OptimizerPlayer] = []
+    overflow: list[OptimizerPlayer] = []
+    groups: Counter[tuple[bool, bool]] = Counter()
+    for player in remaining:
+        group = (current_kind(player) == "taxi", injured(player))
+        groups[group] += 1
+        if _fits(groups, capacity):
+            kept.append(player)
+        else:
+            groups[group] -= 1
+            overflow.append(player)
+
+    reserves: list[ReservePlacement] = []
+
+    def place(candidates: list[OptimizerPlayer], kind: ReserveSlotKind) -> set[str]:
+        placed = candidates[: capacity[kind]]
+        capacity[kind] -= len(placed)
+        for player in placed:
+            # Keep the player's current slot label when it already has the right kind.
+            slot_name = current.get(player.player_id)
+            if slot_name is None or reserve_slot_kind(slot_name) != kind:
+                slot_name = slot_names[kind]
+            reserves.append(ReservePlacement(player.player_id, slot_name, kind))
+        return {player.player_id for player in placed}
+
+    # Taxi players who could also use IR go to the taxi squad last.
+    taxi = sorted((p for p in kept if current_kind(p) == "taxi"), key=injured)
+    placed = place(taxi, "taxi")
+    kept = [p for p in kept if p.player_id not in placed]
+
+    ir = sorted((p for p in kept if injured(p)), key=lambda p: current_kind(p) != "injured_reserve")
+    placed = place(ir, "injured_reserve")
+    kept = [p for p in kept if p.player_id not in placed]
+
+    place(kept, "bench")
+    return RosterPlan(
+        lineup=lineup,
+        reserves=tuple(reserves),
+        overflow_player_ids=tuple(player.player_id for player in overflow),
+    )
+
+
+def _fits(groups: Counter[tuple[bool, bool]], capacity: Counter[ReserveSlotKind]) -> bool:
+    """Return True when players grouped by (taxi occupant, IR-eligible) fit the capacity.
+
+    Every player may take the bench, so Hall's condition reduces to four checks:
+    bench-only players, players limited to bench or taxi, players limited to
+    bench or IR, and everyone.
+    """
+
+    bench, taxi, ir = capacity["bench"], capacity["taxi"], capacity["injured_reserve"]
+    bench_only = groups[False, False]
+    return (
+        bench_only <= bench
+        and bench_only + groups[True, False] <= bench + taxi
+        and bench_only + groups[False, True] <= bench + ir
+        and sum(groups.values()) <= bench + taxi + ir
+    )
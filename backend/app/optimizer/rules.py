@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from functools import lru_cache
+from threading import Lock
+from typing import Literal
 
 # Slot tokens that indicate the player is not eligible for the starting optimization.
 RESERVE_SLOT_PREFIXES = (
@@ -19,6 +22,39 @@ RESERVE_SLOT_PREFIXES = (
 )
 
 
+ReserveSlotKind = Literal["bench", "injured_reserve", "taxi"]
+
+# Reserve slot prefixes grouped by the kind of capacity they provide.
+_RESERVE_KIND_PREFIXES: tuple[tuple[str, ReserveSlotKind], ...] = (
+    ("BENCH", "bench"),
+    ("BN", "bench"),
+    ("TAXI", "taxi"),
+    ("RESERVE", "injured_reserve"),
+    ("RES", "injured_reserve"),
+    ("IR", "injured_reserve"),
+    ("PUP", "injured_reserve"),
+    ("NFI", "injured_reserve"),
+    ("COVID", "injured_reserve"),
+)
+
+# Player statuses that qualify for an injured-reserve slot. Game-day "O"/"OUT"
+# designations do not: leagues only open IR to players on a reserve list.
+INJURED_RESERVE_STATUSES = frozenset(
+    {
+        "IR",
+        "IR-R",
+        "IR-LT",
+        "IR-NR",
+        "INJURED_RESERVE",
+        "PUP",
+        "PUP-R",
+        "NFI",
+        "NFI-R",
+        "COVID-19",
+    }
+)
+
+
 POSITION_SYNONYMS: dict[str, str] = {
     "W": "WR",
     "R": "RB",
@@ -45,44 +81,86 @@ POSITION_SYNONYMS: dict[str, str] = {
 }
 
 
-SLOT_OVERRIDES: dict[str, set[str]] = {
-    "FLEX": {"RB", "WR", "TE"},
-    "W/R": {"WR", "RB"},
-    "R/W": {"WR", "RB"},
-    "W/T": {"WR", "TE"},
-    "WR/RB": {"WR", "RB"},
-    "RB/WR": {"WR", "RB"},
-    "WR/TE": {"WR", "TE"},
-    "RB/WR/TE": {"RB", "WR", "TE"},
-    "W/R/T": {"WR", "RB", "TE"},
-    "SUPERFLEX": {"QB", "RB", "WR", "TE"},
-    "SUPER FLEX": {"QB", "RB", "WR", "TE"},
-    "OP": {"QB", "RB", "WR", "TE"},
-    "Q/W/R": {"QB", "WR", "RB"},
-    "Q/W/R/T": {"QB", "WR", "RB", "TE"},
-    "WR": {"WR"},
-    "WR1": {"WR"},
-    "WR2": {"WR"},
-    "WR3": {"WR"},
-    "RB": {"RB"},
-    "RB1": {"RB"},
-    "RB2": {"RB"},
-    "RB3": {"RB"},
-    "TE": {"TE"},
-    "TE1": {"TE"},
-    "QB": {"QB"},
-    "QB1": {"QB"},
+SLOT_OVERRIDES: dict[str, frozenset[str]] = {
+    "FLEX": frozenset({"RB", "WR", "TE"}),
+    "W/R": frozenset({"WR", "RB"}),
+    "R/W": frozenset({"WR", "RB"}),
+    "W/T": frozenset({"WR", "TE"}),
+    "WR/RB": frozenset({"WR", "RB"}),
+    "RB/WR": frozenset({"WR", "RB"}),
+    "WR/TE": frozenset({"WR", "TE"}),
+    "RB/WR/TE": frozenset({"RB", "WR", "TE"}),
+    "W/R/T": frozenset({"WR", "RB", "TE"}),
+    "SUPERFLEX": frozenset({"QB", "RB", "WR", "TE"}),
+    "SUPER FLEX": frozenset({"QB", "RB", "WR", "TE"}),
+    "OP": frozenset({"QB", "RB", "WR", "TE"}),
+    "Q/W/R": frozenset({"QB", "WR", "RB"}),
+    "Q/W/R/T": frozenset({"QB", "WR", "RB", "TE"}),
+    "WR": frozenset({"WR"}),
+    "WR1": frozenset({"WR"}),
+    "WR2": frozenset({"WR"}),
+    "WR3": frozenset({"WR"}),
+    "RB": frozenset({"RB"}),
+    "RB1": frozenset({"RB"}),
+    "RB2": frozenset({"RB"}),
+    "RB3": frozenset({"RB"}),
+    "TE": frozenset({"TE"}),
+    "TE1": frozenset({"TE"}),
+    "QB": frozenset({"QB"}),
+    "QB1": frozenset({"QB"}),
 }
 
 
+_SLOT_NAME_PATTERN = re.compile(r"[^A-Z/]+")
+_POSITION_SEPARATOR_PATTERN = re.compile(r"[\s/,]+")
+
+# Process-wide bit index per position token; tokens are interned on first use.
+_position_bits: dict[str, int] = {}
+_position_tokens: list[str] = []
+_position_bits_lock = Lock()
+
+
+def position_bit(token: str) -> int:
+    """Return the single-bit mask interned for a canonical position token."""
+
+    bit = _position_bits.get(token)
+    if bit is None:
+        with _position_bits_lock:
+            bit = _position_bits.get(token)
+            if bit is None:
+                bit = 1 << len(_position_tokens)
+                _position_bits[token] = bit
+                _position_tokens.append(token)
+    return bit
+
+
+def position_mask(positions: Iterable[str]) -> int:
+    """Return the bitmask covering every position token in ``positions``."""
+
+    mask = 0
+    for token in positions:
+        mask |= position_bit(token)
+    return mask
+
+
+@lru_cache(maxsize=1024)
+def positions_for_mask(mask: int) -> frozenset[str]:
+    """Return the position tokens encoded in ``mask``."""
+
+    return frozenset(
+        token for index, token in enumerate(_position_tokens) if mask & (1 << index)
+    )
+
+
 @lru_cache(maxsize=None)
 def normalize_slot_name(slot_name: str) -> str:
     """Normalize a roster slot name for comparison."""
 
-    cleaned = re.sub(r"[^A-Z/]+", "", slot_name.upper())
+    cleaned = _SLOT_NAME_PATTERN.sub("", slot_name.upper())
     return cleaned
 
 
+@lru_cache(maxsize=1024)
 def is_reserve_slot(slot_name: str) -> bool:
     """Return True if the slot is a bench or reserve position."""
 
@@ -90,10 +168,30 @@ def is_reserve_slot(slot_name: str) -> bool:
     return any(normalized.startswith(prefix) for prefix in RESERVE_SLOT_PREFIXES)
 
 
+@lru_cache(maxsize=256)
+def reserve_slot_kind(slot_name: str) -> ReserveSlotKind | None:
+    """Return which reserve capacity a slot provides, or ``None`` for starting slots."""
+
+    normalized = slot_name.strip().upper().replace(" ", "")
+    for prefix, kind in _RESERVE_KIND_PREFIXES:
+        if normalized.startswith(prefix):
+            return kind
+    return None
+
+
+def is_injured_reserve_eligible(status: str | None) -> bool:
+    """Return True if a player's status allows stashing them in an IR slot."""
+
+    if not status:
+        return False
+    return status.strip().upper().replace(" ", "_") in INJURED_RESERVE_STATUSES
+
+
+@lru_cache(maxsize=4096)
 def parse_player_positions(position_string: str) -> tuple[str, ...]:
     """Split a Yahoo position string into canonical tokens."""
 
-    tokens = re.split(r"[\s/,]+", position_string.upper())
+    tokens = _POSITION_SEPARATOR_PATTERN.split(position_string.upper())
     normalized: set[str] = set()
     for token in tokens:
         if not token:
@@ -103,31 +201,53 @@ def parse_player_positions(position_string: str) -> tuple[str, ...]:
     return tuple(sorted(normalized))
 
 
-def eligible_positions_for_slot(slot_name: str, available_positions: set[str]) -> set[str]:
+def eligible_positions_for_slot(
+    slot_name: str, available_positions: Iterable[str]
+) -> frozenset[str]:
     """Return the set of eligible positions for a roster slot."""
 
+    return positions_for_mask(resolve_slot_mask(slot_name, position_mask(available_positions)))
+
+
+def slot_positions(slot_name: str, available_mask: int) -> tuple[str, ...]:
+    """Return the sorted eligible positions for a slot given the roster's position mask."""
+
+    return _sorted_positions(resolve_slot_mask(slot_name, available_mask))
+
+
+@lru_cache(maxsize=1024)
+def _sorted_positions(mask: int) -> tuple[str, ...]:
+    return tuple(sorted(positions_for_mask(mask)))
+
+
+@lru_cache(maxsize=4096)
+def resolve_slot_mask(slot_name: str, available_mask: int) -> int:
+    """Resolve a roster slot to the bitmask of positions it accepts.
+
+    Memoized per ``(slot_name, available_mask)`` so roster requests only pay for
+    slot-name normalization the first time a layout is seen.
+    """
+
     normalized_slot = normalize_slot_name(slot_name)
     if normalized_slot in SLOT_OVERRIDES:
-        return SLOT_OVERRIDES[normalized_slot]
+        return position_mask(SLOT_OVERRIDES[normalized_slot])
 
+    # Only tokens already interned can be in ``available_mask``; unknown slot
+    # tokens are looked up without interning them.
     if "/" in normalized_slot:
-        tokens = normalized_slot.split("/")
-        eligible = {
-            POSITION_SYNONYMS.get(token, token)
-            for token in tokens
-            if POSITION_SYNONYMS.get(token, token) in available_positions
-        }
-        if eligible:
-            return eligible
+        eligible = 0
+        for token in normalized_slot.split("/"):
+            eligible |= _position_bits.get(POSITION_SYNONYMS.get(token, token), 0)
+        if eligible & available_mask:
+            return eligible & available_mask
 
     stripped = normalized_slot.rstrip("1234567890")
     if stripped in SLOT_OVERRIDES:
-        return SLOT_OVERRIDES[stripped]
+        return position_mask(SLOT_OVERRIDES[stripped])
 
-    canonical = POSITION_SYNONYMS.get(stripped, stripped)
-    if canonical in available_positions:
-        return {canonical}
+    canonical = _position_bits.get(POSITION_SYNONYMS.get(stripped, stripped), 0)
+    if canonical & available_mask:
+        return canonical
 
     # Fall back to all available positions when the slot type is unknown.
-    return set(available_positions)
-
+    return available_mask
@@ -0,0 +1,150 @@
+"""Season-long lineup planning across the remaining scoring weeks."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.optimizer.assignment import FORBIDDEN, solve_assignment
+from app.optimizer.matrix import build_lineup_matrix
+from app.optimizer.models import (
+    OptimizerAssignment,
+    OptimizerPlayer,
+    OptimizerResult,
+    OptimizerSlot,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class WeekPlan:
+    """Optimal lineup for one scoring week of a season plan."""
+
+    week: int
+    result: OptimizerResult
+    unfillable_slot_ids: tuple[str, ...] = ()
+    bye_player_ids: tuple[str, ...] = ()
+
+    @property
+    def has_unfillable_slots(self) -> bool:
+        return bool(self.unfillable_slot_ids)
+
+
+@dataclass(frozen=True, slots=True)
+class SeasonPlan:
+    """Per-week optimal lineups for a fixed roster."""
+
+    weeks: tuple[WeekPlan, ...]
+
+    @property
+    def unfillable_weeks(self) -> list[int]:
+        """Weeks in which at least one starting slot cannot be filled."""
+
+        return [plan.week for plan in self.weeks if plan.has_unfillable_slots]
+
+
+def plan_season(
+    players: Iterable[OptimizerPlayer],
+    slots: Iterable[OptimizerSlot],
+    weeks: Iterable[int],
+    *,
+    weekly_points: Mapping[int, Mapping[str, float]] | None = None,
+    bye_weeks: Mapping[str, int | None] | None = None,
+) -> SeasonPlan:
+    """Solve the optimal lineup for every week in ``weeks`` for one roster.
+
+    ``weekly_points`` maps week -> player id -> projection; players without a
+    projection for a week keep their default ``projected_points``. Players on a
+    bye are unavailable that week. Eligibility is evaluated once, and the weeks x
+    slots x players cost tensor is built in a single NumPy pass before each week's
+    assignment is solved, so the plan costs one matrix build plus W small solves.
+    """
+
+    player_list = list(players)
+    slot_list = list(slots)
+    week_list = sorted(set(weeks))
+    if not week_list:
+        return SeasonPlan(weeks=())
+    if not player_list or not slot_list:
+        empty = OptimizerResult(assignments=(), total_points=0.0, fallback_used=True)
+        unfillable = tuple(slot.slot_id for slot in slot_list)
+        return SeasonPlan(weeks=tuple(WeekPlan(week, empty, unfillable) for week in week_list))
+
+    matrix = build_lineup_matrix(player_list, slot_list)
+    points = _weekly_points_matrix(player_list, week_list, weekly_points or {})
+    byes = bye_weeks or {}
+    bye_vector = np.array([byes.get(player.player_id) or 0 for player in player_list])
+    available = bye_vector[None, :] != np.array(week_list)[:, None]
+
+    # weeks x slots x players: eligible for the slot and not on a bye that week.
+    playable = matrix.eligibility[None, :, :] & available[:, None, :]
+    slot_count = len(slot_list)
+    vacancy_cost = 1.0 + 2.0 * slot_count * float(np.abs(points).max(initial=0.0))
+    vacancy_block = np.full((slot_count, slot_count), FORBIDDEN)
+    np.fill_diagonal(vacancy_block, vacancy_cost)
+    costs = np.concatenate(
+        [
+            np.where(playable, -points[:, None, :], FORBIDDEN),
+            np.broadcast_to(vacancy_block, (len(week_list), slot_count, slot_count)),
+        ],
+        axis=2,
+    )
+
+    player_count = len(player_list)
+    plans: list[WeekPlan] = []
+    for week_index, week in enumerate(week_list):
+        solution = solve_assignment(costs[week_index].tolist())
+        assignments = tuple(
+            OptimizerAssignment(
+                slot_id=slot.slot_id,
+                slot_name=slot.slot_name,
+                player_id=player_list[column].player_id,
+                projected_points=float(points[week_index, column]),
+            )
+            for slot, column in zip(slot_list, solution.row_to_col, strict=True)
+            if column < player_count
+        )
+        total_points = sum(assignment.projected_points for assignment in assignments)
+        plans.append(
+            WeekPlan(
+                week=week,
+                result=OptimizerResult(
+                    assignments=assignments,
+                    total_points=total_points,
+                    objective_bound=total_points,
+                    optimality_gap=0.0,
+                ),
+                unfillable_slot_ids=tuple(
+                    slot.slot_id
+                    for slot, column in zip(slot_list, solution.row_to_col, strict=True)
+                    if column >= player_count
+                ),
+                bye_player_ids=tuple(
+                    player.player_id
+                    for player, is_available in zip(
+                        player_list, available[week_index].tolist(), strict=True
+                    )
+                    if not is_available
+                ),
+            )
+        )
+    return SeasonPlan(weeks=tuple(plans))
+
+
+def _weekly_points_matrix(
+    players: list[OptimizerPlayer],
+    weeks: list[int],
+    weekly_points: Mapping[int, Mapping[str, float]],
+) -> np.ndarray:
+    defaults = np.array([player.projected_points for player in players], dtype=np.float64)
+    points = np.tile(defaults, (len(weeks), 1))
+    for week_index, week in enumerate(weeks):
+        projections = weekly_points.get(week)
+        if not projections:
+            continue
+        for player_index, player in enumerate(players):
+            projected = projections.get(player.player_id)
+            if projected is not None:
+                points[week_index, player_index] = projected
+    return points
@@ -0,0 +1,152 @@
+"""Risk-aware lineup optimization over simulated projection distributions."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Literal, get_args
+
+import numpy as np
+
+from app.optimizer.engine import assign_slots, optimize_lineup
+from app.optimizer.matrix import LineupMatrix, build_lineup_matrix
+from app.optimizer.models import (
+    LineupDistribution,
+    OptimizerAssignment,
+    OptimizerPlayer,
+    OptimizerResult,
+    OptimizerSlot,
+)
+
+RiskObjective = Literal["expected", "percentile", "win_probability"]
+
+DEFAULT_SIMULATIONS = 5000
+FLOOR_QUANTILE = 0.1
+CEILING_QUANTILE = 0.9
+
+# Candidate lineups are drawn from the exact solutions for mean + z * stddev.
+_CANDIDATE_Z_SCORES = np.linspace(-2.0, 2.0, 9)
+
+
+@dataclass(frozen=True, slots=True)
+class RiskProfile:
+    """What the risk-aware optimizer maximizes and how many weeks it simulates.
+
+    ``percentile`` is used by the ``percentile`` objective. ``opponent_mean`` and
+    ``opponent_stddev`` describe the opponent's total; ``win_probability`` needs them.
+    """
+
+    objective: RiskObjective = "expected"
+    percentile: float = 0.5
+    opponent_mean: float | None = None
+    opponent_stddev: float = 0.0
+    simulations: int = DEFAULT_SIMULATIONS
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.objective not in get_args(RiskObjective):
+            raise ValueError(f"Unknown risk objective {self.objective!r}")
+        if self.simulations <= 0:
+            raise ValueError("simulations must be positive")
+        if not 0 <= self.percentile <= 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if self.objective == "win_probability" and self.opponent_mean is None:
+            raise ValueError("opponent_mean is required for the win_probability objective")
+
+
+DEFAULT_RISK_PROFILE = RiskProfile()
+
+
+def optimize_lineup_risk_aware(
+    players: Iterable[OptimizerPlayer],
+    slots: Iterable[OptimizerSlot],
+    profile: RiskProfile = DEFAULT_RISK_PROFILE,
+) -> OptimizerResult:
+    """Pick the lineup that best satisfies ``profile.objective`` across simulated weeks.
+
+    Each player's score is drawn from a normal distribution around
+    ``projected_points`` with ``projected_stddev`` (zero when unknown). For the
+    ``expected`` objective the exact optimum of the means is returned as is. For
+    the others, candidate lineups are the exact optima for a sweep of
+    risk-adjusted projections, each scored against the same batch of draws. The
+    winner carries its floor/ceiling (10th/90th percentile) and, when an opponent
+    projection is supplied, its win probability.
+    """
+
+    player_list = list(players)
+    slot_list = list(slots)
+    if not player_list or not slot_list:
+        return optimize_lineup(player_list, slot_list)
+
+    matrix = build_lineup_matrix(player_list, slot_list)
+    stddev = np.array(
+        [max(player.projected_stddev or 0.0, 0.0) for player in player_list], dtype=np.float64
+    )
+
+    simulations = profile.simulations
+    rng = np.random.default_rng(profile.seed)
+    draws = matrix.points + rng.standard_normal((simulations, len(player_list))) * stddev
+    opponent_totals: np.ndarray | None = None
+    if profile.opponent_mean is not None:
+        opponent_noise = rng.standard_normal(simulations) * max(profile.opponent_stddev, 0.0)
+        opponent_totals = profile.opponent_mean + opponent_noise
+
+    if profile.objective == "expected":
+        # The exact optimum of the means maximizes the expected total outright;
+        # the draws only describe its spread.
+        lineup = tuple(assign_slots(matrix))
+    else:
+        lineups, totals = _candidate_totals(matrix, stddev, draws)
+        if profile.objective == "win_probability" and opponent_totals is not None:
+            scores = (totals > opponent_totals[:, None]).mean(axis=0)
+        else:
+            scores = np.quantile(totals, profile.percentile, axis=0)
+        lineup = lineups[int(np.argmax(scores))]
+
+    best_totals = draws[:, _starter_indices(lineup)].sum(axis=1)
+    assignments = tuple(
+        OptimizerAssignment(
+            slot_id=slot.slot_id,
+            slot_name=slot.slot_name,
+            player_id=player_list[player_index].player_id,
+            projected_points=player_list[player_index].projected_points,
+        )
+        for slot, player_index in zip(slot_list, lineup, strict=True)
+        if player_index is not None
+    )
+    distribution = LineupDistribution(
+        mean=float(best_totals.mean()),
+        floor=float(np.quantile(best_totals, FLOOR_QUANTILE)),
+        ceiling=float(np.quantile(best_totals, CEILING_QUANTILE)),
+        simulations=simulations,
+        win_probability=(
+            float((best_totals > opponent_totals).mean()) if opponent_totals is not None else None
+        ),
+    )
+    return OptimizerResult(
+        assignments=assignments,
+        total_points=sum(assignment.projected_points for assignment in assignments),
+        engine="assignment",
+        distribution=distribution,
+    )
+
+
+def _candidate_totals(
+    matrix: LineupMatrix, stddev: np.ndarray, draws: np.ndarray
+) -> tuple[list[tuple[int | None, ...]], np.ndarray]:
+    """Return the swept candidate lineups and their simulated totals (draws x lineups)."""
+
+    candidates: dict[tuple[int | None, ...], None] = {}
+    for z_score in _CANDIDATE_Z_SCORES:
+        candidates.setdefault(tuple(assign_slots(matrix, matrix.points + z_score * stddev)))
+    lineups = list(candidates)
+
+    # selection[p, c] == 1 when candidate lineup c starts player p.
+    selection = np.zeros((matrix.shape[1], len(lineups)), dtype=np.float64)
+    for column, lineup in enumerate(lineups):
+        selection[_starter_indices(lineup), column] = 1.0
+    return lineups, draws @ selection
+
+
+def _starter_indices(lineup: tuple[int | None, ...]) -> list[int]:
+    return [index for index in lineup if index is not None]
@@ -11,11 +11,17 @@ from app.schemas.games import (
 )
 from app.schemas.health import HealthStatus
 from app.schemas.leagues import (
+    LeagueLineupsResponse,
     LeagueRosterResponse,
     LeagueSummary,
+    LineupAlternative,
     OptimizerInsight,
+    PlannedStarter,
     PlayerProjection,
     RosterSlot,
+    SeasonPlanResponse,
+    SeasonPlanWeek,
+    TeamLineup,
     TeamSummary,
     UserLeaguesResponse,
 )
@@ -25,17 +31,23 @@ __all__ = [
     "DriveSummary",
     "HealthStatus",
     "FeatureFlags",
+    "LeagueLineupsResponse",
     "LeagueRosterResponse",
     "LeagueSummary",
+    "LineupAlternative",
     "LiveGameSummary",
     "LiveGamesResponse",
     "OptimizerInsight",
     "PlayByPlayResponse",
     "PlayDetail",
+    "PlannedStarter",
     "PlayerProjection",
     "RuntimeConfigResponse",
     "RosterSlot",
+    "SeasonPlanResponse",
+    "SeasonPlanWeek",
     "TeamGameState",
+    "TeamLineup",
     "TeamSummary",
     "UserLeaguesResponse",
     "VenueInfo",
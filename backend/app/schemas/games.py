@@ -80,9 +80,16 @@ class DriveSummary(BaseModel):
 
 
 class PlayByPlayResponse(BaseModel):
-    """Response payload for `/games/{event_id}/pbp`."""
+    """Response payload for `/games/{event_id}/pbp`.
+
+    ``cursor`` is the event's play-by-play version. When ``since`` is set the
+    drives hold only the plays added or changed after that cursor; otherwise the
+    response is the full timeline.
+    """
 
     event_id: str
     generated_at: datetime
     drives: list[DriveSummary]
+    cursor: int = Field(default=0, ge=0)
+    since: int | None = Field(default=None, ge=0)
     source: Literal["pyespn"] = "pyespn"
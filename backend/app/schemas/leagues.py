@@ -55,6 +55,20 @@ class RosterSlot(BaseModel):
     player: PlayerProjection
     recommended: bool = Field(default=False)
     locked: bool = Field(default=False)
+    recommended_slot: str | None = Field(
+        default=None, description="Recommended bench/IR/taxi slot for non-starters"
+    )
+
+
+class LineupAlternative(BaseModel):
+    """Next-best distinct lineup offered as a positional alternative."""
+
+    rank: int = Field(..., ge=2, description="2 for the runner-up lineup, and so on")
+    total_points: float
+    points_behind: float = Field(..., ge=0)
+    recommended_starters: list[str]
+    starts: list[str] = Field(default_factory=list, description="Starters not in the best lineup")
+    sits: list[str] = Field(default_factory=list, description="Best-lineup starters benched here")
 
 
 class OptimizerInsight(BaseModel):
@@ -63,6 +77,14 @@ class OptimizerInsight(BaseModel):
     recommended_starters: list[str]
     delta_points: float
     rationale: list[str]
+    floor_points: float | None = Field(default=None, description="10th percentile score")
+    ceiling_points: float | None = Field(default=None, description="90th percentile score")
+    win_probability: float | None = Field(default=None, ge=0, le=1)
+    alternatives: list[LineupAlternative] = Field(default_factory=list)
+    reserve_moves: list[str] = Field(default_factory=list)
+    overflow_players: list[str] = Field(
+        default_factory=list, description="Players with no legal roster spot; a drop is needed"
+    )
     source: Literal["optimizer"] = "optimizer"
 
 
@@ -76,3 +98,52 @@ class LeagueRosterResponse(BaseModel):
     starters: list[RosterSlot]
     bench: list[RosterSlot]
     optimizer: OptimizerInsight
+
+
+class TeamLineup(BaseModel):
+    """Optimized lineup for one team in one scoring week."""
+
+    team: TeamSummary
+    week: int = Field(..., ge=1, le=18)
+    starters: list[RosterSlot]
+    bench: list[RosterSlot]
+    optimizer: OptimizerInsight
+
+
+class PlannedStarter(BaseModel):
+    """Starter chosen for one slot in a season-plan week."""
+
+    slot: str
+    yahoo_player_id: str
+    full_name: str
+    projected_points: float
+
+
+class SeasonPlanWeek(BaseModel):
+    """Precomputed optimal lineup for one remaining scoring week."""
+
+    week: int = Field(..., ge=1, le=18)
+    total_points: float
+    starters: list[PlannedStarter]
+    unfillable_slots: list[str] = Field(
+        default_factory=list, description="Starting slots no available player can fill"
+    )
+    bye_players: list[str] = Field(default_factory=list)
+
+
+class SeasonPlanResponse(BaseModel):
+    """Response payload for `/leagues/{league_key}/season-plan`."""
+
+    league_key: str
+    team: TeamSummary
+    generated_at: datetime
+    weeks: list[SeasonPlanWeek]
+    unfillable_weeks: list[int] = Field(default_factory=list)
+
+
+class LeagueLineupsResponse(BaseModel):
+    """Response payload for `/leagues/{league_key}/lineups`."""
+
+    league_key: str
+    generated_at: datetime
+    lineups: list[TeamLineup]
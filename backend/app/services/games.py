@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
 from datetime import UTC, datetime
-from typing import Iterable
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session, aliased, load_only
 
-from app.models.espn import Drive, Event, EventState, Play, Team, Venue
+from app.models.espn import Drive, Event, EventState, Play, ScoreboardSnapshot, Team, Venue
 from app.schemas.games import (
     DriveSummary,
     LiveGamesResponse,
@@ -19,10 +20,52 @@ from app.schemas.games import (
     TeamGameState,
     VenueInfo,
 )
+from app.services.pbp_cache import PlayByPlayCache
+from app.services.play_archive import load_play_archive
+
+PHASE_PREGAME = "pregame"
+PHASE_LIVE = "live"
+PHASE_FINAL = "final"
+
+# ``EventState.status`` holds ESPN's status description ("Scheduled", "Halftime", ...).
+_PREGAME_STATUSES = frozenset({"Scheduled"})
+_STOPPED_STATUSES = frozenset({"Canceled", "Postponed", "Forfeit"})
+
+# Snapshot key of the unfiltered ``/games/live`` scoreboard covering every ingested game.
+ALL_GAMES_SNAPSHOT_KEY = (0, 0)
+
+# The narrow projection ``build_play_detail`` reads.
+PLAY_DETAIL_COLUMNS = (
+    Play.play_id,
+    Play.drive_id,
+    Play.sequence,
+    Play.clock,
+    Play.quarter,
+    Play.down,
+    Play.distance,
+    Play.yardline_100,
+    Play.type,
+    Play.yards,
+    Play.description,
+    Play.scoring_play,
+    Play.type_abbreviation,
+)
+
+
+def game_phase(status: str | None) -> str:
+    """Classify an ``EventState.status`` as pregame, live, or final."""
 
+    if not status or status in _PREGAME_STATUSES:
+        return PHASE_PREGAME
+    if status.startswith("Final") or status in _STOPPED_STATUSES:
+        return PHASE_FINAL
+    return PHASE_LIVE
 
-def list_live_games(session: Session) -> LiveGamesResponse:
-    """Return the scoreboard snapshot for all ingested events."""
+
+def list_live_games(
+    session: Session, *, season: int | None = None, week: int | None = None
+) -> LiveGamesResponse:
+    """Return the scoreboard for ingested events, optionally limited to a season and week."""
 
     generated_at = datetime.now(tz=UTC)
     home_team = aliased(Team)
@@ -36,6 +79,10 @@ def list_live_games(session: Session) -> LiveGamesResponse:
         .join(Venue, Venue.venue_id == Event.venue_id, isouter=True)
         .order_by(Event.start_ts)
     )
+    if season is not None:
+        stmt = stmt.where(Event.season == season)
+    if week is not None:
+        stmt = stmt.where(Event.week == week)
 
     games: list[LiveGameSummary] = []
     for event, state, home, away, venue in session.execute(stmt):
@@ -59,68 +106,234 @@ def list_live_games(session: Session) -> LiveGamesResponse:
     return LiveGamesResponse(generated_at=generated_at, games=games)
 
 
+def build_scoreboard_snapshot(session: Session, season: int, week: int) -> ScoreboardSnapshot:
+    """Serialize one week's scoreboard and tag it with an ETag over its game content."""
+
+    return _scoreboard_snapshot(season, week, list_live_games(session, season=season, week=week))
+
+
+def build_all_games_snapshot(session: Session) -> ScoreboardSnapshot:
+    """Serialize the unfiltered scoreboard of every ingested event."""
+
+    return _scoreboard_snapshot(*ALL_GAMES_SNAPSHOT_KEY, list_live_games(session))
+
+
+def refresh_scoreboard_snapshots(session: Session, weeks: Iterable[tuple[int, int]]) -> int:
+    """Rebuild the stored scoreboard of each ``(season, week)``; call after states change.
+
+    The all-games scoreboard is rebuilt too whenever any week changed.
+    """
+
+    refreshed = 0
+    for season, week in sorted(set(weeks)):
+        session.merge(build_scoreboard_snapshot(session, season, week))
+        refreshed += 1
+    if refreshed:
+        session.merge(build_all_games_snapshot(session))
+    return refreshed
+
+
+def load_all_games_snapshot(session: Session) -> ScoreboardSnapshot:
+    """Return the stored scoreboard of every ingested game, building it if none is stored."""
+
+    snapshot = session.get(ScoreboardSnapshot, ALL_GAMES_SNAPSHOT_KEY)
+    return snapshot if snapshot is not None else build_all_games_snapshot(session)
+
+
+def load_scoreboard_snapshot(
+    session: Session, *, season: int, week: int | None = None
+) -> ScoreboardSnapshot:
+    """Return the stored scoreboard for a season week (the latest ingested week by default).
+
+    The payload column is deferred, so callers that only compare ETags never load
+    it. Weeks ingested before snapshots existed are built on demand, not stored.
+    """
+
+    stmt = select(ScoreboardSnapshot).where(ScoreboardSnapshot.season == season)
+    if week is not None:
+        stmt = stmt.where(ScoreboardSnapshot.week == week)
+    snapshot = session.scalars(stmt.order_by(ScoreboardSnapshot.week.desc()).limit(1)).first()
+    if snapshot is not None:
+        return snapshot
+
+    if week is None:
+        week = session.scalar(select(func.max(Event.week)).where(Event.season == season))
+    if week is None:
+        # Nothing ingested for the season yet; the placeholder week is never stored.
+        empty = LiveGamesResponse(generated_at=datetime.now(tz=UTC), games=[])
+        return _scoreboard_snapshot(season, 0, empty)
+    return build_scoreboard_snapshot(session, season, week)
+
+
+async def get_play_by_play_json(
+    session: Session, event_id: str, cache: PlayByPlayCache | None = None
+) -> bytes:
+    """Return the serialized play-by-play for an event, built at most once per version.
+
+    The cache key combines the event's ``pbp_version`` (bumped by ingest when drives
+    or plays change) with the scores and timeouts shown on each drive, so one
+    small query decides whether the stored response is still current.
+    """
+
+    row = session.execute(
+        select(
+            Event.pbp_version,
+            EventState.status,
+            EventState.home_score,
+            EventState.away_score,
+            EventState.home_timeouts,
+            EventState.away_timeouts,
+        )
+        .join(EventState, EventState.event_id == Event.event_id)
+        .where(Event.event_id == event_id)
+    ).one_or_none()
+    if row is None:
+        raise ValueError(f"Unknown event_id {event_id}")
+
+    version, status, *scoreboard = row
+    key = ":".join([event_id, str(version), *(str(value) for value in scoreboard)])
+    if cache is not None:
+        payload = await cache.get(key)
+        if payload is not None:
+            return payload
+
+    payload = get_play_by_play(session, event_id).model_dump_json().encode("utf-8")
+    if cache is not None:
+        await cache.set(key, payload, final=game_phase(status) == PHASE_FINAL)
+    return payload
+
+
 def get_play_by_play(session: Session, event_id: str) -> PlayByPlayResponse:
     """Build the normalized play-by-play timeline for an event."""
 
+    event, state = _load_event_state(session, event_id)
+    drives = session.scalars(
+        select(Drive).where(Drive.event_id == event_id).order_by(Drive.drive_id)
+    ).all()
+    plays_by_drive = load_play_details_by_drive(session, event_id)
+
+    return PlayByPlayResponse(
+        event_id=event_id,
+        generated_at=datetime.now(tz=UTC),
+        drives=_drive_summaries(session, event, state, drives, plays_by_drive),
+        cursor=event.pbp_version,
+    )
+
+
+def get_play_by_play_since(session: Session, event_id: str, since: int) -> PlayByPlayResponse:
+    """Return only the drives and plays written after the ``since`` cursor.
+
+    Rows carry the ``pbp_version`` that last changed them, so the lookup is a range
+    scan of ``ix_plays_event_version`` rather than a read of the whole game. A
+    cursor from before the last removal of drives or plays, or one the event has
+    not reached, gets the full timeline (``since`` is then ``None``).
+    """
+
+    event, state = _load_event_state(session, event_id)
+    if since < event.pbp_reset_version or since > event.pbp_version:
+        return get_play_by_play(session, event_id)
+
+    plays_by_drive: dict[str, list[PlayDetail]] = defaultdict(list)
+    drives: Sequence[Drive] = []
+    if since < event.pbp_version:
+        plays = session.scalars(
+            select(Play)
+            .options(load_only(*PLAY_DETAIL_COLUMNS))
+            .where(Play.event_id == event_id, Play.pbp_version > since)
+            .order_by(Play.drive_id, Play.sequence)
+        )
+        for play in plays:
+            plays_by_drive[play.drive_id].append(build_play_detail(play))
+        drives = session.scalars(
+            select(Drive)
+            .where(
+                Drive.event_id == event_id,
+                or_(Drive.pbp_version > since, Drive.drive_id.in_(plays_by_drive)),
+            )
+            .order_by(Drive.drive_id)
+        ).all()
+
+    return PlayByPlayResponse(
+        event_id=event_id,
+        generated_at=datetime.now(tz=UTC),
+        drives=_drive_summaries(session, event, state, drives, plays_by_drive),
+        cursor=event.pbp_version,
+        since=since,
+    )
+
+
+def load_play_details_by_drive(session: Session, event_id: str) -> dict[str, list[PlayDetail]]:
+    """Return an event's play details per drive in sequence order.
+
+    Archived (completed) events are read from their columnar archive without
+    decoding the raw play JSON; other events are built from the ``plays`` rows.
+    """
+
+    archive = load_play_archive(session, event_id)
+    if archive is not None:
+        return archive.play_details_by_drive()
+
+    plays = session.execute(
+        select(Play)
+        .options(load_only(*PLAY_DETAIL_COLUMNS))
+        .where(Play.event_id == event_id)
+        .order_by(Play.drive_id, Play.sequence)
+    ).scalars()
+    plays_by_drive: dict[str, list[PlayDetail]] = defaultdict(list)
+    for play in plays:
+        plays_by_drive[play.drive_id].append(build_play_detail(play))
+    return dict(plays_by_drive)
+
+
+# ---------------------------------------------------------------------------
+# Helper utilities
+# ---------------------------------------------------------------------------
+
+
+def _load_event_state(session: Session, event_id: str) -> tuple[Event, EventState]:
     event_row = session.execute(
         select(Event, EventState)
         .join(EventState, EventState.event_id == Event.event_id)
         .where(Event.event_id == event_id)
     ).one_or_none()
-
     if event_row is None:
         raise ValueError(f"Unknown event_id {event_id}")
     event, state = event_row
+    return event, state
+
 
+def _drive_summaries(
+    session: Session,
+    event: Event,
+    state: EventState,
+    drives: Sequence[Drive],
+    plays_by_drive: Mapping[str, list[PlayDetail]],
+) -> list[DriveSummary]:
     home_team = session.get(Team, event.home_id)
     away_team = session.get(Team, event.away_id)
     if home_team is None or away_team is None:
         raise ValueError("Missing team metadata for event")
 
-    drives = list(
-        session.execute(
-        select(Drive).where(Drive.event_id == event_id).order_by(Drive.drive_id)
-    ).scalars()
-    )
-    plays = list(
-        session.execute(
-        select(Play).where(Play.event_id == event_id).order_by(Play.drive_id, Play.sequence)
-    ).scalars()
-    )
-
-    plays_by_drive: dict[str, list[Play]] = defaultdict(list)
-    for play in plays:
-        plays_by_drive[play.drive_id].append(play)
-
-    drive_payloads: list[DriveSummary] = []
+    summaries: list[DriveSummary] = []
     for drive in drives:
         team = _resolve_drive_team(drive.team_id, home_team, away_team)
+        is_home = team.espn_team_id == home_team.espn_team_id
         team_state = _team_game_state(
             team,
-            state.home_score if team.espn_team_id == home_team.espn_team_id else state.away_score,
-            state.home_timeouts if team.espn_team_id == home_team.espn_team_id else state.away_timeouts,
+            state.home_score if is_home else state.away_score,
+            state.home_timeouts if is_home else state.away_timeouts,
         )
-        drive_payloads.append(
+        summaries.append(
             DriveSummary(
                 drive_id=drive.drive_id,
                 team=team_state,
                 result=drive.result or "Unknown",
                 start_clock=drive.start_clock or "0:00",
                 end_clock=drive.end_clock or drive.start_clock or "0:00",
-                plays=[build_play_detail(play) for play in plays_by_drive.get(drive.drive_id, [])],
+                plays=plays_by_drive.get(drive.drive_id, []),
             )
         )
-
-    return PlayByPlayResponse(
-        event_id=event_id,
-        generated_at=datetime.now(tz=UTC),
-        drives=drive_payloads,
-    )
-
-
-# ---------------------------------------------------------------------------
-# Helper utilities
-# ---------------------------------------------------------------------------
+    return summaries
 
 
 def _team_game_state(team: Team, score: int, timeouts: int | None) -> TeamGameState:
@@ -164,17 +377,13 @@ def _resolve_drive_team(team_id: int | None, home: Team, away: Team) -> Team:
 
 
 def build_play_detail(play: Play) -> PlayDetail:
-    raw = play.raw_json or {}
-    quarter = play.quarter or (raw.get("period") or {}).get("number") or 1
-    clock = play.clock or (raw.get("clock") or {}).get("displayValue") or "0:00"
-    type_text = play.type or (raw.get("type") or {}).get("text") or "Unknown"
+    """Render a play from its promoted columns; ``raw_json`` is never loaded."""
 
     flags: list[str] = []
-    if raw.get("scoringPlay"):
+    if play.scoring_play:
         flags.append("SCORING")
-    abbr = (raw.get("type") or {}).get("abbreviation")
-    if abbr:
-        flags.append(abbr)
+    if play.type_abbreviation:
+        flags.append(play.type_abbreviation)
 
     down = play.down if play.down and play.down > 0 else None
     distance = play.distance if play.distance and play.distance > 0 else None
@@ -182,13 +391,28 @@ def build_play_detail(play: Play) -> PlayDetail:
     return PlayDetail(
         play_id=play.play_id,
         sequence=play.sequence,
-        clock=clock,
-        quarter=quarter,
+        clock=play.clock or "0:00",
+        quarter=play.quarter or 1,
         down=down,
         distance=distance,
         yardline_100=play.yardline_100,
-        type=type_text,
+        type=play.type or "Unknown",
         yards=play.yards,
-        description=raw.get("text", ""),
+        description=play.description or "",
         flags=sorted(set(flags)),
     )
+
+
+def _scoreboard_snapshot(season: int, week: int, response: LiveGamesResponse) -> ScoreboardSnapshot:
+    payload = response.model_dump_json().encode("utf-8")
+    # Build and update timestamps change on every ingest; the ETag covers game content only.
+    content = response.model_dump_json(
+        exclude={"generated_at": True, "games": {"__all__": {"last_update"}}}
+    )
+    return ScoreboardSnapshot(
+        season=season,
+        week=week,
+        etag=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        payload=payload,
+        generated_at=response.generated_at,
+    )
@@ -2,34 +2,89 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from itertools import count
 
-from sqlalchemy import Select, select
+import numpy as np
+from sqlalchemy import Select, delete, select
 from sqlalchemy.orm import Session
 
-from app.models.yahoo import YahooLeague, YahooPlayer, YahooRoster, YahooTeam
+from app.models.projection import IdMap, WeeklyProjection
+from app.models.yahoo import YahooLeague, YahooLineupPlan, YahooPlayer, YahooRoster, YahooTeam
 from app.optimizer import (
     OptimizerAssignment,
     OptimizerPlayer,
+    OptimizerProblem,
     OptimizerResult,
     OptimizerSlot,
-    eligible_positions_for_slot,
     is_reserve_slot,
-    optimize_lineup,
     parse_player_positions,
+    plan_season,
+    position_mask,
+    reserve_slot_kind,
+    slot_positions,
 )
+from app.optimizer.cache import OptimizerResultCache
+from app.optimizer.columns import RosterColumns, RosterColumnsBuilder, RosterEntry
+from app.optimizer.executor import AsyncLineupOptimizer
+from app.optimizer.incremental import IncrementalLineupOptimizer
+from app.optimizer.roster import RosterPlan, plan_reserves
 from app.schemas.leagues import (
+    LeagueLineupsResponse,
     LeagueRosterResponse,
     LeagueSummary,
+    LineupAlternative,
     OptimizerInsight,
+    PlannedStarter,
     PlayerProjection,
     RosterSlot,
+    SeasonPlanResponse,
+    SeasonPlanWeek,
+    TeamLineup,
     TeamSummary,
     UserLeaguesResponse,
 )
 from app.services.models import AuthContext
 
+RosterRow = tuple[YahooRoster, YahooPlayer | None]
+
+# Positions assumed when no rostered player reports any.
+_DEFAULT_POSITION_MASK = position_mask(("QB", "RB", "WR", "TE", "K", "DEF"))
+
+# Last scoring week covered by season plans unless a caller asks otherwise.
+SEASON_FINAL_WEEK = 17
+
+
+@dataclass(frozen=True, slots=True)
+class LineupSolvers:
+    """The optimizer pool and the caches roster and lineup requests solve through.
+
+    ``incremental`` repairs a team's last roster lineup instead of re-solving it,
+    and league-wide cache misses are split into ``batch_jobs`` pool jobs.
+    """
+
+    optimizer: AsyncLineupOptimizer
+    cache: OptimizerResultCache | None = None
+    incremental: IncrementalLineupOptimizer | None = None
+    batch_jobs: int = 1
+
+
+@dataclass(frozen=True, slots=True)
+class RosterQuery:
+    """Which week of a roster to render and how many runner-up lineups to add.
+
+    Each of the ``alternatives`` differs from every better lineup by at least
+    ``min_difference`` starters.
+    """
+
+    week: int
+    alternatives: int = 0
+    min_difference: int = 1
+
 
 def list_user_leagues(session: Session, auth: AuthContext) -> UserLeaguesResponse:
     """Return the leagues available to the authenticated Yahoo user."""
@@ -68,9 +123,55 @@ def list_user_leagues(session: Session, auth: AuthContext) -> UserLeaguesRespons
     return UserLeaguesResponse(generated_at=generated_at, leagues=leagues)
 
 
-def get_league_roster(session: Session, auth: AuthContext, league_key: str, week: int) -> LeagueRosterResponse:
-    """Return a roster payload including lightweight optimizer hints."""
+async def get_league_roster(
+    session: Session,
+    auth: AuthContext,
+    league_key: str,
+    query: RosterQuery,
+    solvers: LineupSolvers,
+) -> LeagueRosterResponse:
+    """Return a roster payload with optimizer hints, solved on the optimizer pool.
+
+    ``query.alternatives`` adds that many runner-up lineups. With
+    ``solvers.incremental``, the team's last lineup for the week is repaired in
+    place when only projections, statuses, or eligibility changed instead of
+    being solved from scratch.
+    """
+
+    optimizer, cache, incremental = solvers.optimizer, solvers.cache, solvers.incremental
+    week = query.week
+    team, roster_rows = _load_user_roster(session, league_key, week)
+    context = _prepare_roster_context(roster_rows)
+    problem = context.problem
+    if query.alternatives:
+        ranked = await optimizer.solve_alternatives(
+            problem, k=query.alternatives + 1, min_difference=query.min_difference
+        )
+        payload = _render_roster_payload(context, ranked[0], alternatives=ranked[1:])
+        return _roster_response(league_key, week, team, payload)
+
+    optimizer_result = await cache.get(problem) if cache is not None else None
+    if optimizer_result is None:
+        if incremental is not None:
+            optimizer_result = await optimizer.solve_incremental(
+                incremental, (team.team_key, week), problem
+            )
+        else:
+            optimizer_result = await optimizer.solve(problem)
+        if cache is not None:
+            await cache.set(problem, optimizer_result)
+    payload = _render_roster_payload(context, optimizer_result)
+    return _roster_response(league_key, week, team, payload)
+
 
+def _load_user_roster(
+    session: Session, league_key: str, week: int
+) -> tuple[YahooTeam, list[RosterRow]]:
+    team = _load_user_team(session, league_key)
+    return team, _load_team_roster(session, team.team_key, week)
+
+
+def _load_user_team(session: Session, league_key: str) -> YahooTeam:
     team = session.execute(
         select(YahooTeam).where(
             YahooTeam.league_key == league_key,
@@ -80,7 +181,10 @@ def get_league_roster(session: Session, auth: AuthContext, league_key: str, week
 
     if team is None:
         raise ValueError(f"No roster found for user in league {league_key}")
+    return team
 
+
+def _load_team_roster(session: Session, team_key: str, week: int) -> list[RosterRow]:
     roster_result = (
         session.execute(
             select(YahooRoster, YahooPlayer)
@@ -89,21 +193,21 @@ def get_league_roster(session: Session, auth: AuthContext, league_key: str, week
                 YahooPlayer.yahoo_player_id == YahooRoster.yahoo_player_id,
                 isouter=True,
             )
-            .where(YahooRoster.team_key == team.team_key, YahooRoster.week == week)
+            .where(YahooRoster.team_key == team_key, YahooRoster.week == week)
         )
         .tuples()
         .all()
     )
-    roster_rows: list[tuple[YahooRoster, YahooPlayer | None]] = [
-        (roster, player) for roster, player in roster_result
-    ]
+    return [(roster, player) for roster, player in roster_result]
 
-    (
-        starters,
-        bench,
-        optimizer,
-    ) = _build_roster_payload(roster_rows)
 
+def _roster_response(
+    league_key: str,
+    week: int,
+    team: YahooTeam,
+    payload: tuple[list[RosterSlot], list[RosterSlot], OptimizerInsight],
+) -> LeagueRosterResponse:
+    starters, bench, optimizer = payload
     return LeagueRosterResponse(
         league_key=league_key,
         week=week,
@@ -115,76 +219,425 @@ def get_league_roster(session: Session, auth: AuthContext, league_key: str, week
     )
 
 
-def _build_player_projection(roster: YahooRoster, player: YahooPlayer | None) -> PlayerProjection:
+def get_season_plan(
+    session: Session,
+    auth: AuthContext,
+    league_key: str,
+    start_week: int,
+    *,
+    end_week: int = SEASON_FINAL_WEEK,
+) -> SeasonPlanResponse:
+    """Return the user's stored season plan; weeks not yet materialized are omitted.
+
+    Plans are written by ``jobs.planning.materialize_season_plans`` or
+    :func:`refresh_season_plan`, never by a read.
+    """
+
+    team = _load_user_team(session, league_key)
+    rows = (
+        session.execute(
+            select(YahooLineupPlan).where(
+                YahooLineupPlan.team_key == team.team_key,
+                YahooLineupPlan.week.between(start_week, end_week),
+            )
+        )
+        .scalars()
+        .all()
+    )
+    return _season_plan_response(league_key, team, rows)
+
+
+def refresh_season_plan(
+    session: Session,
+    auth: AuthContext,
+    league_key: str,
+    start_week: int,
+    *,
+    end_week: int = SEASON_FINAL_WEEK,
+) -> SeasonPlanResponse:
+    """Re-solve and store the user's season plan, then return it.
+
+    Solving every week is CPU-bound; async callers run this in a worker thread.
+    """
+
+    team = _load_user_team(session, league_key)
+    rows = materialize_season_plan(session, team, start_week, end_week=end_week)
+    session.commit()
+    return _season_plan_response(league_key, team, rows)
+
+
+def materialize_season_plan(
+    session: Session,
+    team: YahooTeam,
+    start_week: int,
+    *,
+    end_week: int = SEASON_FINAL_WEEK,
+) -> list[YahooLineupPlan]:
+    """Solve every week from ``start_week`` to ``end_week`` and store the plan rows.
+
+    The roster stored for ``start_week`` is held fixed; per-week projections and
+    bye weeks decide each lineup. Existing rows for those weeks are replaced.
+    The caller owns the transaction.
+    """
+
+    roster_rows = _load_team_roster(session, team.team_key, start_week)
+    if not roster_rows:
+        raise ValueError(f"No roster found for team {team.team_key} in week {start_week}")
+
+    context = _prepare_roster_context(roster_rows)
+    weeks = list(range(start_week, end_week + 1))
+    season = session.execute(
+        select(YahooLeague.season).where(YahooLeague.league_key == team.league_key)
+    ).scalar_one()
+    plan = plan_season(
+        context.optimizer_players,
+        (slot for slot, _ in context.slot_metadata),
+        weeks,
+        weekly_points=_load_weekly_points(
+            session, team.team_key, season, context.columns.player_ids, weeks
+        ),
+        bye_weeks={
+            player.yahoo_player_id: player.bye_week
+            for _roster, player in roster_rows
+            if player is not None
+        },
+    )
+
+    slot_names = {slot.slot_id: slot.slot_name for slot, _ in context.slot_metadata}
+    generated_at = datetime.now(tz=UTC)
+    rows = [
+        YahooLineupPlan(
+            team_key=team.team_key,
+            week=week_plan.week,
+            total_points=week_plan.result.total_points,
+            assignments_json=[
+                {
+                    "slot": assignment.slot_name,
+                    "yahoo_player_id": assignment.player_id,
+                    "full_name": context.name(assignment.player_id) or assignment.player_id,
+                    "projected_points": assignment.projected_points,
+                }
+                for assignment in week_plan.result.assignments
+            ],
+            unfillable_slots_json=[
+                slot_names[slot_id] for slot_id in week_plan.unfillable_slot_ids
+            ],
+            bye_players_json=_player_names(context, week_plan.bye_player_ids),
+            generated_at=generated_at,
+        )
+        for week_plan in plan.weeks
+    ]
+
+    session.execute(
+        delete(YahooLineupPlan).where(
+            YahooLineupPlan.team_key == team.team_key, YahooLineupPlan.week.in_(weeks)
+        )
+    )
+    session.add_all(rows)
+    session.flush()
+    return rows
+
+
+def _load_weekly_points(
+    session: Session,
+    team_key: str,
+    season: int,
+    player_ids: Sequence[str],
+    weeks: Sequence[int],
+) -> dict[int, dict[str, float]]:
+    """Collect per-week projections, preferring canonical projections over Yahoo's."""
+
+    weekly_points: dict[int, dict[str, float]] = defaultdict(dict)
+    yahoo_rows = session.execute(
+        select(YahooRoster.week, YahooRoster.yahoo_player_id, YahooRoster.projected_points).where(
+            YahooRoster.team_key == team_key,
+            YahooRoster.week.in_(weeks),
+            YahooRoster.yahoo_player_id.in_(player_ids),
+        )
+    )
+    for week, player_id, points in yahoo_rows:
+        weekly_points[week][player_id] = points
+
+    canonical_rows = session.execute(
+        select(WeeklyProjection.week, IdMap.yahoo_player_id, WeeklyProjection.points)
+        .join(IdMap, IdMap.canonical_player_id == WeeklyProjection.canonical_player_id)
+        .where(
+            WeeklyProjection.season == season,
+            WeeklyProjection.week.in_(weeks),
+            IdMap.yahoo_player_id.in_(player_ids),
+        )
+    )
+    for week, player_id, points in canonical_rows:
+        weekly_points[week][player_id] = points
+    return weekly_points
+
+
+def _season_plan_response(
+    league_key: str, team: YahooTeam, rows: Sequence[YahooLineupPlan]
+) -> SeasonPlanResponse:
+    weeks = [
+        SeasonPlanWeek(
+            week=row.week,
+            total_points=row.total_points,
+            starters=[PlannedStarter(**starter) for starter in row.assignments_json],
+            unfillable_slots=list(row.unfillable_slots_json),
+            bye_players=list(row.bye_players_json),
+        )
+        for row in sorted(rows, key=lambda row: row.week)
+    ]
+    generated_at = max((row.generated_at for row in rows), default=datetime.now(tz=UTC))
+    if generated_at.tzinfo is None:
+        # SQLite returns naive datetimes; plans are always written in UTC.
+        generated_at = generated_at.replace(tzinfo=UTC)
+    return SeasonPlanResponse(
+        league_key=league_key,
+        team=TeamSummary(team_key=team.team_key, name=team.name, manager=team.manager),
+        generated_at=generated_at,
+        weeks=weeks,
+        unfillable_weeks=[week.week for week in weeks if week.unfillable_slots],
+    )
+
+
+async def get_league_lineups(
+    session: Session,
+    auth: AuthContext,
+    league_key: str,
+    weeks: Sequence[int] | None,
+    solvers: LineupSolvers,
+) -> LeagueLineupsResponse:
+    """Optimize every team's lineup across the requested weeks.
+
+    Cache misses are split into ``solvers.batch_jobs`` optimizer pool jobs.
+    """
+
+    optimizer, cache = solvers.optimizer, solvers.cache
+    rosters = _load_league_rosters(session, auth, league_key, weeks)
+    problems = [context.problem for context in rosters.contexts]
+    results = await _cached_results(problems, cache)
+    misses = [index for index, result in enumerate(results) if result is None]
+
+    chunk_count = max(1, min(solvers.batch_jobs, len(misses)))
+    chunks = [misses[offset::chunk_count] for offset in range(chunk_count)]
+    solved_chunks = await asyncio.gather(
+        *(optimizer.solve_batch(problems[index] for index in chunk) for chunk in chunks if chunk)
+    )
+    solved_by_index = {
+        index: result
+        for chunk, solved in zip((chunk for chunk in chunks if chunk), solved_chunks, strict=True)
+        for index, result in zip(chunk, solved, strict=True)
+    }
+    await _fill_results(problems, results, misses, [solved_by_index[i] for i in misses], cache)
+    return _lineups_response(league_key, rosters, results)
+
+
+@dataclass(slots=True)
+class _LeagueRosters:
+    """Every (team, week) roster in a league, normalized for optimization."""
+
+    teams: dict[str, YahooTeam]
+    keys: list[tuple[str, int]]
+    contexts: list[_RosterContext]
+
+
+def _load_league_rosters(
+    session: Session,
+    auth: AuthContext,
+    league_key: str,
+    weeks: Sequence[int] | None,
+) -> _LeagueRosters:
+    league = session.execute(
+        select(YahooLeague).where(
+            YahooLeague.league_key == league_key,
+            YahooLeague.user_id == auth.user_id,
+        )
+    ).scalar_one_or_none()
+    if league is None:
+        raise ValueError(f"No league {league_key} found for user")
+
+    teams = {
+        team.team_key: team
+        for team in session.execute(
+            select(YahooTeam).where(YahooTeam.league_key == league_key).order_by(YahooTeam.team_key)
+        ).scalars()
+    }
+
+    roster_query = (
+        select(YahooRoster, YahooPlayer)
+        .join(
+            YahooPlayer,
+            YahooPlayer.yahoo_player_id == YahooRoster.yahoo_player_id,
+            isouter=True,
+        )
+        .where(YahooRoster.team_key.in_(list(teams)))
+    )
+    if weeks:
+        roster_query = roster_query.where(YahooRoster.week.in_(list(weeks)))
+
+    grouped_rows: dict[tuple[str, int], list[RosterRow]] = defaultdict(list)
+    for roster, player in session.execute(roster_query).tuples():
+        grouped_rows[(roster.team_key, roster.week)].append((roster, player))
+
+    keys = sorted(grouped_rows, key=lambda key: (key[1], key[0]))
+    contexts = [_prepare_roster_context(grouped_rows[key]) for key in keys]
+    return _LeagueRosters(teams=teams, keys=keys, contexts=contexts)
+
+
+def _lineups_response(
+    league_key: str,
+    rosters: _LeagueRosters,
+    results: Sequence[OptimizerResult | None],
+) -> LeagueLineupsResponse:
+    lineups: list[TeamLineup] = []
+    for (team_key, week), context, optimizer_result in zip(
+        rosters.keys, rosters.contexts, results, strict=True
+    ):
+        if optimizer_result is None:  # pragma: no cover - every miss is solved upstream
+            raise RuntimeError(f"Missing optimizer result for {team_key} week {week}")
+        team = rosters.teams[team_key]
+        starters, bench, optimizer = _render_roster_payload(context, optimizer_result)
+        lineups.append(
+            TeamLineup(
+                team=TeamSummary(team_key=team.team_key, name=team.name, manager=team.manager),
+                week=week,
+                starters=starters,
+                bench=bench,
+                optimizer=optimizer,
+            )
+        )
+
+    return LeagueLineupsResponse(
+        league_key=league_key,
+        generated_at=datetime.now(tz=UTC),
+        lineups=lineups,
+    )
+
+
+async def _cached_results(
+    problems: list[OptimizerProblem], cache: OptimizerResultCache | None
+) -> list[OptimizerResult | None]:
+    if cache is None:
+        return [None] * len(problems)
+    return list(await asyncio.gather(*(cache.get(problem) for problem in problems)))
+
+
+async def _fill_results(
+    problems: list[OptimizerProblem],
+    results: list[OptimizerResult | None],
+    misses: list[int],
+    solved: Sequence[OptimizerResult],
+    cache: OptimizerResultCache | None,
+) -> None:
+    """Slot freshly solved results into ``results`` and remember them in ``cache``."""
+
+    for index, result in zip(misses, solved, strict=True):
+        results[index] = result
+        if cache is not None:
+            await cache.set(problems[index], result)
+
+
+def _player_projection(columns: RosterColumns, row: int) -> PlayerProjection:
+    """Build the response model for one row; only rows placed in the payload get one."""
+
     return PlayerProjection(
-        yahoo_player_id=player.yahoo_player_id if player else "unknown",
-        full_name=player.name if player else "TBD",
-        team_abbr=player.team_abbr if player else "FA",
-        position=player.pos if player else "N/A",
-        status=player.status if player else "UNKNOWN",
-        projected_points=roster.projected_points,
-        actual_points=roster.actual_points,
+        yahoo_player_id=columns.player_ids[row],
+        full_name=columns.names[row],
+        team_abbr=columns.team_abbrs[row],
+        position=columns.position_labels[row],
+        status=columns.status(row),
+        projected_points=float(columns.points[row]),
+        actual_points=columns.actual(row),
     )
 
 
-def _build_roster_payload(
-    roster_rows: list[tuple[YahooRoster, YahooPlayer | None]]
-) -> tuple[list[RosterSlot], list[RosterSlot], OptimizerInsight]:
-    """Transform database rows into API response payloads with optimizer output."""
+@dataclass(slots=True)
+class _RosterContext:
+    """Roster rows normalized into columnar storage plus the active lineup slots."""
 
-    player_projections: dict[str, PlayerProjection] = {}
-    optimizer_players: dict[str, OptimizerPlayer] = {}
-    available_positions: set[str] = set()
-    player_status: dict[str, str | None] = {}
-    player_slot_lookup: dict[str, str] = {}
+    columns: RosterColumns
+    optimizer_players: tuple[OptimizerPlayer, ...]
+    slot_metadata: list[tuple[OptimizerSlot, str | None]]
+    reserve_slot_names: list[str]
 
+    @property
+    def problem(self) -> OptimizerProblem:
+        slots = tuple(slot for slot, _ in self.slot_metadata)
+        return OptimizerProblem(
+            players=self.optimizer_players,
+            slots=slots,
+            matrix=self.columns.lineup_matrix(slots),
+        )
+
+    def name(self, player_id: str) -> str | None:
+        row = self.columns.index.get(player_id)
+        return None if row is None else self.columns.names[row]
+
+
+def _prepare_roster_context(
+    roster_rows: list[tuple[YahooRoster, YahooPlayer | None]]
+) -> _RosterContext:
+    """Normalize roster rows into roster columns and active lineup slots."""
+
+    builder = RosterColumnsBuilder()
     for roster, player in roster_rows:
         if player is None or roster.yahoo_player_id is None:
             continue
 
-        projection = _build_player_projection(roster, player)
-        player_projections[roster.yahoo_player_id] = projection
-        player_slot_lookup[roster.yahoo_player_id] = roster.slot
-        player_status[roster.yahoo_player_id] = projection.status
-
         positions = parse_player_positions(player.pos)
         if not positions:
             positions = (player.pos.upper(),)
-        available_positions.update(positions)
-
-        if roster.yahoo_player_id not in optimizer_players:
-            optimizer_players[roster.yahoo_player_id] = OptimizerPlayer(
+        builder.append(
+            RosterEntry(
                 player_id=roster.yahoo_player_id,
-                name=projection.full_name,
+                name=player.name,
+                team_abbr=player.team_abbr or "FA",
+                position_label=player.pos,
                 positions=positions,
-                projected_points=projection.projected_points,
-                status=projection.status,
+                slot=roster.slot,
+                points=roster.projected_points,
+                actual_points=roster.actual_points,
+                status=player.status,
             )
+        )
 
-    if not available_positions:
-        available_positions.update({"QB", "RB", "WR", "TE", "K", "DEF"})
+    columns = builder.build()
+    available_mask = columns.available_mask or _DEFAULT_POSITION_MASK
 
-    active_slots: list[OptimizerSlot] = []
     slot_metadata: list[tuple[OptimizerSlot, str | None]] = []
+    reserve_slot_names: list[str] = []
     slot_index = count()
 
-    for roster, player in roster_rows:
+    for roster, _player in roster_rows:
         slot_name = roster.slot
         if is_reserve_slot(slot_name):
+            reserve_slot_names.append(slot_name)
             continue
 
         slot_id = f"{slot_name}-{next(slot_index)}"
-        eligible_positions = tuple(sorted(eligible_positions_for_slot(slot_name, available_positions)))
         slot = OptimizerSlot(
             slot_id=slot_id,
             slot_name=slot_name,
-            eligible_positions=eligible_positions,
+            eligible_positions=slot_positions(slot_name, available_mask),
             current_player_id=roster.yahoo_player_id,
         )
-        active_slots.append(slot)
         slot_metadata.append((slot, roster.yahoo_player_id))
 
-    optimizer_result = optimize_lineup(optimizer_players.values(), active_slots)
+    return _RosterContext(
+        columns=columns,
+        optimizer_players=columns.optimizer_players(),
+        slot_metadata=slot_metadata,
+        reserve_slot_names=reserve_slot_names,
+    )
+
+
+def _render_roster_payload(
+    context: _RosterContext,
+    optimizer_result: OptimizerResult,
+    alternatives: Sequence[OptimizerResult] = (),
+) -> tuple[list[RosterSlot], list[RosterSlot], OptimizerInsight]:
+    """Compose starters, bench, and optimizer insight from a solved roster."""
+
+    columns = context.columns
+    slot_metadata = context.slot_metadata
     recommended_ids = optimizer_result.recommended_player_ids
 
     assignment_map = {assignment.slot_id: assignment for assignment in optimizer_result.assignments}
@@ -193,92 +646,160 @@ def _build_roster_payload(
     for slot, current_player_id in slot_metadata:
         assignment = assignment_map.get(slot.slot_id)
         if assignment is None:
-            if current_player_id and current_player_id in player_projections:
-                projection = player_projections[current_player_id]
+            current_row = columns.index.get(current_player_id) if current_player_id else None
+            if current_row is not None:
                 starters.append(
                     RosterSlot(
                         slot=slot.slot_name,
-                        player=projection,
+                        player=_player_projection(columns, current_row),
                         recommended=False,
                         locked=False,
                     )
                 )
             continue
-        projection = player_projections.get(assignment.player_id)
-        if projection is None:
+        row = columns.index.get(assignment.player_id)
+        if row is None:
             continue
         starters.append(
             RosterSlot(
                 slot=slot.slot_name,
-                player=projection,
+                player=_player_projection(columns, row),
                 recommended=True,
                 locked=False,
             )
         )
 
+    plan = plan_reserves(
+        context.optimizer_players,
+        optimizer_result,
+        context.reserve_slot_names,
+        current_slots=dict(zip(columns.player_ids, columns.slots, strict=True)),
+    )
+    placements = {placement.player_id: placement for placement in plan.reserves}
+
     bench: list[RosterSlot] = []
-    for player_id, projection in player_projections.items():
+    for row in np.argsort(-columns.points, kind="stable").tolist():
+        player_id = columns.player_ids[row]
         if player_id in recommended_ids:
             continue
-        bench_slot = player_slot_lookup.get(player_id, "BENCH")
+        placement = placements.get(player_id)
         bench.append(
             RosterSlot(
-                slot=bench_slot,
-                player=projection,
+                slot=columns.slots[row],
+                player=_player_projection(columns, row),
                 recommended=False,
                 locked=False,
+                recommended_slot=placement.slot_name if placement else None,
             )
         )
 
-    bench.sort(key=lambda slot: slot.player.projected_points, reverse=True)
-
     optimizer = _build_optimizer_summary(
         slot_metadata=slot_metadata,
         assignment_map=assignment_map,
-        player_projections=player_projections,
-        player_status=player_status,
+        columns=columns,
         optimizer_result=optimizer_result,
     )
+    optimizer.alternatives = _build_alternatives(optimizer_result, alternatives, context)
+    optimizer.reserve_moves = _build_reserve_moves(context, plan)
+    optimizer.overflow_players = _player_names(context, plan.overflow_player_ids)
 
     return starters, bench, optimizer
 
 
+def _player_names(context: _RosterContext, player_ids: Iterable[str]) -> list[str]:
+    return [name for name in map(context.name, player_ids) if name is not None]
+
+
+def _build_reserve_moves(context: _RosterContext, plan: RosterPlan) -> list[str]:
+    """Describe bench/IR/taxi moves the plan makes relative to the current roster."""
+
+    columns = context.columns
+    moves: list[str] = []
+    for placement in plan.reserves:
+        row = columns.index.get(placement.player_id)
+        if row is None:
+            continue
+        current_slot = columns.slots[row]
+        current_kind = reserve_slot_kind(current_slot)
+        if current_kind == placement.kind:
+            continue
+        name = columns.names[row]
+        if placement.kind == "injured_reserve":
+            moves.append(f"Move {name} to {placement.slot_name} to open a bench spot.")
+        elif current_kind == "injured_reserve":
+            moves.append(f"Activate {name} from {current_slot} to {placement.slot_name}.")
+    return moves
+
+
+def _build_alternatives(
+    best: OptimizerResult,
+    alternatives: Sequence[OptimizerResult],
+    context: _RosterContext,
+) -> list[LineupAlternative]:
+    """Describe runner-up lineups relative to the recommended one."""
+
+    best_ids = best.recommended_player_ids
+    described: list[LineupAlternative] = []
+    for rank, alternative in enumerate(alternatives, start=2):
+        starter_ids = [assignment.player_id for assignment in alternative.assignments]
+        described.append(
+            LineupAlternative(
+                rank=rank,
+                total_points=round(alternative.total_points, 2),
+                points_behind=round(max(0.0, best.total_points - alternative.total_points), 2),
+                recommended_starters=_player_names(context, starter_ids),
+                starts=_player_names(context, (pid for pid in starter_ids if pid not in best_ids)),
+                sits=_player_names(
+                    context,
+                    (
+                        assignment.player_id
+                        for assignment in best.assignments
+                        if assignment.player_id not in alternative.recommended_player_ids
+                    ),
+                ),
+            )
+        )
+    return described
+
+
 def _build_optimizer_summary(
     *,
     slot_metadata: list[tuple[OptimizerSlot, str | None]],
     assignment_map: dict[str, OptimizerAssignment],
-    player_projections: dict[str, PlayerProjection],
-    player_status: dict[str, str | None],
+    columns: RosterColumns,
     optimizer_result: OptimizerResult,
 ) -> OptimizerInsight:
     """Compose the OptimizerInsight payload from solver results."""
 
-    current_total = 0.0
-    recommended_names: list[str] = []
-    recommended_statuses: list[str | None] = []
+    index = columns.index
+    points = columns.points
+    names = columns.names
+    current_rows = [
+        index[current_player_id]
+        for _, current_player_id in slot_metadata
+        if current_player_id in index
+    ]
+    current_total = float(points[current_rows].sum())
+    recommended_rows: list[int] = []
     rationale: list[str] = []
     changes: list[tuple[float, str]] = []
 
     for slot, current_player_id in slot_metadata:
         assignment = assignment_map.get(slot.slot_id)
-        if current_player_id and current_player_id in player_projections:
-            current_total += player_projections[current_player_id].projected_points
-        if assignment:
-            projection = player_projections.get(assignment.player_id)
-            if projection:
-                recommended_names.append(projection.full_name)
-                recommended_statuses.append(projection.status)
-
-        if assignment and current_player_id and assignment.player_id != current_player_id:
-            new_player = player_projections.get(assignment.player_id)
-            current_player = player_projections.get(current_player_id)
-            if new_player and current_player:
-                gain = new_player.projected_points - current_player.projected_points
-                description = (
-                    f"{slot.slot_name}: start {new_player.full_name} ({new_player.projected_points:.1f}) "
-                    f"over {current_player.full_name} ({current_player.projected_points:.1f}) for +{gain:.1f} pts"
-                )
-                changes.append((gain, description))
+        new_row = index.get(assignment.player_id) if assignment else None
+        if new_row is not None:
+            recommended_rows.append(new_row)
+
+        current_row = index.get(current_player_id) if current_player_id else None
+        if new_row is not None and current_row is not None and new_row != current_row:
+            new_points = float(points[new_row])
+            current_points = float(points[current_row])
+            gain = new_points - current_points
+            description = (
+                f"{slot.slot_name}: start {names[new_row]} ({new_points:.1f}) "
+                f"over {names[current_row]} ({current_points:.1f}) for +{gain:.1f} pts"
+            )
+            changes.append((gain, description))
 
     optimized_total = optimizer_result.total_points
     raw_delta = optimized_total - current_total
@@ -298,16 +819,21 @@ def _build_optimizer_summary(
     if raw_delta <= 0 and not changes:
         rationale.append("Current lineup already optimal based on projections.")
 
-    for name, status in zip(recommended_names, recommended_statuses):
+    for row in recommended_rows:
+        status = columns.status(row)
         if status and status not in {"ACTIVE", "OK"}:
-            rationale.append(f"Monitor {name} ({status.lower()}) before lineup lock.")
+            rationale.append(f"Monitor {names[row]} ({status.lower()}) before lineup lock.")
             break
 
     if optimizer_result.fallback_used:
-        rationale.append("Greedy fallback used because CP-SAT solver was unavailable.")
+        rationale.append("Greedy fallback used because the exact solver was unavailable.")
 
+    distribution = optimizer_result.distribution
     return OptimizerInsight(
-        recommended_starters=recommended_names,
+        recommended_starters=[names[row] for row in recommended_rows],
         delta_points=delta_points,
         rationale=rationale,
+        floor_points=distribution.floor if distribution else None,
+        ceiling_points=distribution.ceiling if distribution else None,
+        win_probability=distribution.win_probability if distribution else None,
     )
@@ -0,0 +1,103 @@
+"""Cache of serialized play-by-play responses keyed by event content version."""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from threading import Lock
+
+from app.clients.redis import AsyncRedis
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache key layout or the response schema changes.
+CACHE_KEY_VERSION = "v1"
+
+
+class PlayByPlayCache:
+    """Two-tier (in-process LRU + optional Redis) cache of ``PlayByPlayResponse`` JSON.
+
+    Keys embed the event's ``pbp_version`` and scoreboard fingerprint, so an entry
+    is never stale: ingest moves the key instead of invalidating it. Entries for
+    completed games are kept in Redis without expiry; live games expire after
+    ``live_ttl_seconds`` so superseded versions are collected. Reads and writes
+    are coroutines that use the async Redis client.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 256,
+        live_ttl_seconds: int = 300,
+        redis_client: AsyncRedis | None = None,
+        namespace: str = "pbp",
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.live_ttl_seconds = live_ttl_seconds
+        self._redis = redis_client
+        self._namespace = namespace
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = Lock()
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached response body for ``key`` or ``None`` on a miss."""
+
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                return payload
+
+        payload = await self._get_remote(key)
+        if payload is not None:
+            self._set_local(key, payload)
+        return payload
+
+    async def set(self, key: str, payload: bytes, *, final: bool) -> None:
+        """Store a response body; ``final`` entries never expire from Redis."""
+
+        self._set_local(key, payload)
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                self._redis_key(key),
+                payload.decode("utf-8"),
+                ex=None if final else self.live_ttl_seconds,
+            )
+        except Exception:  # pragma: no cover - network failures only skip the shared tier
+            logger.warning("Play-by-play cache write failed", exc_info=True)
+
+    def clear(self) -> None:
+        """Drop every in-process entry."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _set_local(self, key: str, payload: bytes) -> None:
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self._namespace}:{CACHE_KEY_VERSION}:{key}"
+
+    async def _get_remote(self, key: str) -> bytes | None:
+        if self._redis is None:
+            return None
+        try:
+            payload = await self._redis.get(self._redis_key(key))
+        except Exception:  # pragma: no cover - network failures degrade to a miss
+            logger.warning("Play-by-play cache read failed", exc_info=True)
+            return None
+        if payload is None:
+            return None
+        return payload.encode("utf-8") if isinstance(payload, str) else bytes(payload)
@@ -0,0 +1,176 @@
+"""Columnar, compressed archive format for the plays of completed events."""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.models.espn import Play, PlayArchive
+from app.schemas.games import PlayDetail
+
+ARCHIVE_MAGIC = b"RPA1"
+# Stand-in for NULL in integer columns; no real down, yardage, or quarter gets near it.
+INT_NULL = np.iinfo(np.int64).min
+
+_HEADER = struct.Struct("<4sI")
+_INT_COLUMNS = ("sequence", "quarter", "down", "distance", "yardline_100", "yards")
+_JSON_COLUMNS = ("play_id", "drive_id", "clock", "type", "description", "flags", "raw_json")
+
+
+def encode_play_archive(
+    drive_ids: Sequence[str],
+    details: Sequence[PlayDetail],
+    raw_json: Sequence[dict[str, Any]],
+) -> bytes:
+    """Encode plays as independently zlib-compressed column blocks.
+
+    The layout is ``magic | header length | JSON header | blocks``; the header maps
+    each column to its block's offset and length, so readers only decompress the
+    columns they touch. Integer columns are little-endian int64 arrays.
+    """
+
+    blocks: dict[str, tuple[str, bytes]] = {}
+    for name in _INT_COLUMNS:
+        values = [getattr(detail, name) for detail in details]
+        array = np.array([INT_NULL if value is None else value for value in values], dtype="<i8")
+        blocks[name] = ("int", array.tobytes())
+    columns: dict[str, list[Any]] = {
+        "play_id": [detail.play_id for detail in details],
+        "drive_id": list(drive_ids),
+        "clock": [detail.clock for detail in details],
+        "type": [detail.type for detail in details],
+        "description": [detail.description for detail in details],
+        "flags": [detail.flags for detail in details],
+        "raw_json": list(raw_json),
+    }
+    for name in _JSON_COLUMNS:
+        encoded = json.dumps(columns[name], separators=(",", ":"), default=str)
+        blocks[name] = ("json", encoded.encode("utf-8"))
+
+    directory: dict[str, list[Any]] = {}
+    body = bytearray()
+    for name, (kind, raw) in blocks.items():
+        compressed = zlib.compress(raw)
+        directory[name] = [kind, len(body), len(compressed)]
+        body.extend(compressed)
+    header = json.dumps({"rows": len(details), "columns": directory}).encode("utf-8")
+    return _HEADER.pack(ARCHIVE_MAGIC, len(header)) + header + bytes(body)
+
+
+class PlayArchiveColumns:
+    """Read-only view over an encoded archive held in any buffer (bytes, mmap, ...).
+
+    Columns are decompressed on first access and cached; building play details
+    never touches the ``raw_json`` block.
+    """
+
+    __slots__ = ("_buffer", "_columns", "_data_start", "_decoded", "rows")
+
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        view = memoryview(buffer)
+        magic, header_length = _HEADER.unpack_from(view)
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError("Not a play archive")
+        header_end = _HEADER.size + header_length
+        header = json.loads(bytes(view[_HEADER.size : header_end]))
+        self._buffer = view
+        self._columns: dict[str, list[Any]] = header["columns"]
+        self._data_start = header_end
+        self._decoded: dict[str, Any] = {}
+        self.rows: int = header["rows"]
+
+    def column(self, name: str) -> Any:
+        """Return one column: an int64 array for integer columns, else a list."""
+
+        if name not in self._decoded:
+            kind, offset, length = self._columns[name]
+            start = self._data_start + offset
+            raw = zlib.decompress(self._buffer[start : start + length])
+            self._decoded[name] = (
+                np.frombuffer(raw, dtype="<i8") if kind == "int" else json.loads(raw)
+            )
+        return self._decoded[name]
+
+    def play_details_by_drive(self) -> dict[str, list[PlayDetail]]:
+        """Return play details grouped by drive, each drive in sequence order."""
+
+        ints = {name: self.column(name).tolist() for name in _INT_COLUMNS}
+        by_drive: dict[str, list[PlayDetail]] = defaultdict(list)
+        for row, (play_id, drive_id, clock, type_text, description, flags) in enumerate(
+            zip(
+                self.column("play_id"),
+                self.column("drive_id"),
+                self.column("clock"),
+                self.column("type"),
+                self.column("description"),
+                self.column("flags"),
+                strict=True,
+            )
+        ):
+            # Values were validated as PlayDetail when the archive was written.
+            by_drive[drive_id].append(
+                PlayDetail.model_construct(
+                    play_id=play_id,
+                    sequence=ints["sequence"][row],
+                    clock=clock,
+                    quarter=ints["quarter"][row],
+                    down=_nullable(ints["down"][row]),
+                    distance=_nullable(ints["distance"][row]),
+                    yardline_100=_nullable(ints["yardline_100"][row]),
+                    type=type_text,
+                    yards=_nullable(ints["yards"][row]),
+                    description=description,
+                    flags=flags,
+                )
+            )
+        return dict(by_drive)
+
+
+def load_play_archive(session: Session, event_id: str) -> PlayArchiveColumns | None:
+    """Return the archived plays for ``event_id``, or ``None`` when it is not archived."""
+
+    payload = session.scalar(select(PlayArchive.payload).where(PlayArchive.event_id == event_id))
+    return None if payload is None else PlayArchiveColumns(payload)
+
+
+def promoted_play_columns(raw: dict[str, Any]) -> dict[str, Any]:
+    """Return the ``plays`` columns derived from a play's raw ESPN JSON."""
+
+    return {
+        "description": raw.get("text"),
+        "scoring_play": bool(raw.get("scoringPlay")),
+        "type_abbreviation": (raw.get("type") or {}).get("abbreviation"),
+    }
+
+
+def restore_play_archive(session: Session, event_id: str) -> bool:
+    """Copy archived raw JSON back onto the event's play rows and drop the archive.
+
+    The promoted detail columns are recomputed from the same JSON, so rows
+    archived before those columns existed are complete again. Ingest calls this
+    before changing an archived event's plays; returns whether an archive existed.
+    """
+
+    archive = load_play_archive(session, event_id)
+    if archive is None:
+        return False
+    rows = [
+        {"event_id": event_id, "play_id": play_id, "raw_json": raw, **promoted_play_columns(raw)}
+        for play_id, raw in zip(archive.column("play_id"), archive.column("raw_json"), strict=True)
+    ]
+    if rows:
+        session.execute(update(Play), rows)
+    session.execute(delete(PlayArchive).where(PlayArchive.event_id == event_id))
+    return True
+
+
+def _nullable(value: int) -> int | None:
+    return None if value == INT_NULL else value
@@ -1,5 +1,13 @@
 """PyESPN ingestion and query services."""
 
+from app.services.pyespn.deltas import GameDeltaBatch, GameDeltaPublisher
 from app.services.pyespn.ingest import PyESPNIngestionService
+from app.services.pyespn.poller import PollCadence, PyESPNPoller
 
-__all__ = ["PyESPNIngestionService"]
+__all__ = [
+    "GameDeltaBatch",
+    "GameDeltaPublisher",
+    "PollCadence",
+    "PyESPNIngestionService",
+    "PyESPNPoller",
+]
@@ -0,0 +1,223 @@
+"""Publish PyESPN ingestion changes to the Redis ``game-deltas`` channels."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import astuple, dataclass, fields
+from datetime import UTC, datetime
+
+from redis import Redis
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.espn import EventState, Play
+from app.schemas.ws import GameDelta
+from app.services.games import build_play_detail
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "game-deltas"
+SCOREBOARD_DELTA_TYPE = "Scoreboard"
+# Scoreboard frames share one sequence so clients keyed by sequence keep the latest.
+SCOREBOARD_SEQUENCE = 0
+PUBLISHED_HISTORY_SIZE = 10_000
+
+_MAX_QUARTER = 5
+_STATE_FLAGS = {
+    "status": "STATUS",
+    "status_detail": "STATUS",
+    "quarter": "CLOCK",
+    "clock": "CLOCK",
+    "possession": "POSSESSION",
+    "home_score": "SCORE",
+    "away_score": "SCORE",
+}
+
+
+def delta_channel(event_id: str) -> str:
+    """Return the pub/sub channel that ``ws/games`` subscribes to for ``event_id``."""
+
+    return f"{CHANNEL_PREFIX}:{event_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class StateSnapshot:
+    """The ``EventState`` columns that warrant a scoreboard delta when they change."""
+
+    status: str
+    status_detail: str | None
+    quarter: int | None
+    clock: str | None
+    possession: str | None
+    home_score: int
+    away_score: int
+
+    def changed_flags(self, previous: StateSnapshot | None) -> list[str]:
+        """Return the delta flags for fields that differ from ``previous``."""
+
+        flags = {
+            _STATE_FLAGS[item.name]
+            for item in fields(self)
+            if previous is None or getattr(self, item.name) != getattr(previous, item.name)
+        }
+        return sorted(flags)
+
+    def fingerprint(self) -> str:
+        return hashlib.sha256(repr(astuple(self)).encode("utf-8")).hexdigest()
+
+
+def snapshot_event_states(session: Session, event_ids: Iterable[str]) -> dict[str, StateSnapshot]:
+    """Load the current scoreboard snapshot for each of ``event_ids`` in one query."""
+
+    ids = list(event_ids)
+    if not ids:
+        return {}
+    rows = session.execute(
+        select(
+            EventState.event_id,
+            EventState.status,
+            EventState.status_detail,
+            EventState.quarter,
+            EventState.clock,
+            EventState.possession,
+            EventState.home_score,
+            EventState.away_score,
+        ).where(EventState.event_id.in_(ids))
+    )
+    return {event_id: StateSnapshot(*values) for event_id, *values in rows}
+
+
+@dataclass(frozen=True, slots=True)
+class PendingDelta:
+    """A delta awaiting publication, keyed by event and play for de-duplication."""
+
+    key: tuple[str, str]
+    fingerprint: str
+    delta: GameDelta
+
+
+class GameDeltaBatch:
+    """Collect the deltas produced by one ingest until its transaction commits.
+
+    Each play, and each event's scoreboard, is held at most once; recording it
+    again within the same batch replaces the earlier version.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[str, str], PendingDelta] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record_states(
+        self,
+        before: Mapping[str, StateSnapshot],
+        after: Mapping[str, StateSnapshot],
+    ) -> None:
+        """Record a scoreboard delta for every event whose snapshot changed."""
+
+        generated_at = datetime.now(tz=UTC)
+        for event_id, snapshot in after.items():
+            flags = snapshot.changed_flags(before.get(event_id))
+            if not flags:
+                continue
+            delta = GameDelta(
+                event_id=event_id,
+                sequence=SCOREBOARD_SEQUENCE,
+                clock=snapshot.clock,
+                quarter=_quarter(snapshot.quarter),
+                type=SCOREBOARD_DELTA_TYPE,
+                flags=flags,
+                description=snapshot.status_detail or snapshot.status,
+                generated_at=generated_at,
+            )
+            self._add(PendingDelta((event_id, ""), snapshot.fingerprint(), delta))
+
+    def record_plays(self, plays: Iterable[Play]) -> None:
+        """Record a play delta for each new or changed play."""
+
+        generated_at = datetime.now(tz=UTC)
+        for play in plays:
+            detail = build_play_detail(play)
+            delta = GameDelta(
+                event_id=play.event_id,
+                play_id=play.play_id,
+                sequence=detail.sequence,
+                clock=detail.clock,
+                quarter=_quarter(detail.quarter),
+                down=detail.down,
+                distance=detail.distance,
+                yardline_100=detail.yardline_100,
+                type=detail.type,
+                yards=detail.yards,
+                flags=detail.flags,
+                description=detail.description,
+                generated_at=generated_at,
+            )
+            fingerprint = play.content_hash or str(play.sequence)
+            self._add(PendingDelta((play.event_id, play.play_id), fingerprint, delta))
+
+    def extend(self, other: GameDeltaBatch) -> None:
+        """Move every pending delta of ``other`` into this batch."""
+
+        for item in other.drain():
+            self._add(item)
+
+    def drain(self) -> list[PendingDelta]:
+        """Return the pending deltas (plays by sequence, then scoreboard) and reset."""
+
+        pending = sorted(
+            self._pending.values(),
+            key=lambda item: (item.key[0], item.key[1] == "", item.delta.sequence),
+        )
+        self._pending.clear()
+        return pending
+
+    def _add(self, item: PendingDelta) -> None:
+        self._pending.pop(item.key, None)
+        self._pending[item.key] = item
+
+
+class GameDeltaPublisher:
+    """Publish batches of deltas with a single pipelined round trip.
+
+    The fingerprint last published for each play and scoreboard is remembered,
+    so re-ingesting an unchanged payload publishes nothing.
+    """
+
+    def __init__(self, redis_client: Redis, *, history_size: int = PUBLISHED_HISTORY_SIZE) -> None:
+        self.redis = redis_client
+        self.history_size = history_size
+        self._published: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+    def publish(self, batch: GameDeltaBatch) -> int:
+        """Publish the batch's unseen deltas; call after the ingest has committed."""
+
+        pending = [
+            item for item in batch.drain() if self._published.get(item.key) != item.fingerprint
+        ]
+        if not pending:
+            return 0
+
+        pipeline = self.redis.pipeline(transaction=False)
+        for item in pending:
+            pipeline.publish(delta_channel(item.delta.event_id), item.delta.model_dump_json())
+        try:
+            pipeline.execute()
+        except Exception:  # pragma: no cover - network failures drop this batch only
+            logger.warning("Publishing %d game deltas failed", len(pending), exc_info=True)
+            return 0
+
+        for item in pending:
+            self._published[item.key] = item.fingerprint
+            self._published.move_to_end(item.key)
+        while len(self._published) > self.history_size:
+            self._published.popitem(last=False)
+        return len(pending)
+
+
+def _quarter(value: int | None) -> int | None:
+    return value if value is not None and 1 <= value <= _MAX_QUARTER else None
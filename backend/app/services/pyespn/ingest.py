@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from collections import defaultdict
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import delete
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 
-from app.models.espn import Drive, Event, EventState, Play, Team, Venue
+from app.models.base import Base
+from app.models.espn import Drive, Event, EventState, Play, PlayArchive, Team, Venue
+from app.services.games import refresh_scoreboard_snapshots
+from app.services.play_archive import promoted_play_columns, restore_play_archive
+from app.services.pyespn.deltas import GameDeltaBatch, snapshot_event_states
+
+# Rows per INSERT ... ON CONFLICT statement; keeps bind parameters well under
+# SQLite's limit while still collapsing a full slate into a handful of statements.
+UPSERT_BATCH_ROWS = 500
 
 
 @dataclass(slots=True)
@@ -24,6 +36,38 @@ class EventContext:
     venue: Venue | None
 
 
+@dataclass(slots=True)
+class ScoreboardEvent:
+    """One scoreboard event parsed into the pieces every upsert path needs."""
+
+    event_id: str
+    season: int
+    week: int
+    start_ts: datetime
+    status_type: dict[str, Any]
+    competition: dict[str, Any]
+    teams_by_home_away: dict[str, dict[str, Any]]
+    situation: dict[str, Any]
+    possession_abbr: str | None
+
+    @property
+    def status_name(self) -> str:
+        return self.status_type.get("name", "UNKNOWN")
+
+    @property
+    def venue_payload(self) -> dict[str, Any]:
+        return self.competition.get("venue") or {}
+
+    def state_context(self) -> EventStateContext:
+        return EventStateContext(
+            status_type=self.status_type,
+            competition=self.competition,
+            teams_by_home_away=self.teams_by_home_away,
+            situation=self.situation,
+            possession_abbr=self.possession_abbr,
+        )
+
+
 @dataclass(slots=True)
 class EventStateContext:
     status_type: dict[str, Any]
@@ -33,88 +77,352 @@ class EventStateContext:
     possession_abbr: str | None
 
 
+@dataclass(frozen=True, slots=True)
+class PlayByPlayMerge:
+    """Outcome of writing one play-by-play payload.
+
+    ``removed`` marks deleted drives or plays, which a delta since an older
+    version cannot express.
+    """
+
+    plays: list[Play]
+    changed: bool
+    removed: bool = False
+
+
 class PyESPNIngestionService:
-    """Normalize and upsert PyESPN JSON payloads into the database."""
+    """Normalize and upsert PyESPN JSON payloads into the database.
+
+    When ``deltas`` is provided, every scoreboard change and every new or changed
+    play is recorded on it for publication once the caller commits.
+    """
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: Session, *, deltas: GameDeltaBatch | None = None) -> None:
         self.session = session
+        self.deltas = deltas
 
     # ------------------------------------------------------------------
     # Scoreboard ingestion
     # ------------------------------------------------------------------
-    def ingest_scoreboard(self, payload: dict[str, Any]) -> list[str]:
-        """Upsert teams, venues, events, and state snapshots from a scoreboard."""
+    def ingest_scoreboard(self, payload: dict[str, Any], *, bulk: bool = False) -> list[str]:
+        """Upsert teams, venues, events, and state snapshots from a scoreboard.
+
+        With ``bulk``, existing teams and venues are prefetched with one
+        ``IN`` query per table and every row is written with batched
+        ``INSERT ... ON CONFLICT DO UPDATE`` statements. Dialects without an
+        upsert construct use the row-by-row path. Afterwards the stored
+        ``/games/live`` snapshot is rebuilt for each week whose game states changed.
+        """
 
         event_ids: list[str] = []
-        events = payload.get("events", [])
-        for event in events:
+        parsed: list[ScoreboardEvent] = []
+        for event in payload.get("events", []):
             try:
                 event_id = str(event["id"])
             except KeyError:  # pragma: no cover - defensive guard
                 continue
             event_ids.append(event_id)
+            scoreboard_event = _parse_scoreboard_event(event_id, event)
+            if scoreboard_event is not None:
+                parsed.append(scoreboard_event)
 
-            competition = (event.get("competitions") or [{}])[0]
-            season = int(event.get("season", {}).get("year", datetime.now(tz=UTC).year))
-            week = int(event.get("week", {}).get("number", 0))
-            start_ts = _parse_datetime(competition.get("date") or event.get("date"))
-            status_type = competition.get("status", {}).get("type", {})
+        parsed_ids = [item.event_id for item in parsed]
+        before = snapshot_event_states(self.session, parsed_ids)
 
-            teams_by_home_away = _split_competitors(competition.get("competitors") or [])
-            if not teams_by_home_away:
-                continue
+        upsert = _dialect_insert(self.session) if bulk else None
+        if upsert is not None:
+            self._bulk_upsert_scoreboard(parsed, upsert)
+        else:
+            self._upsert_scoreboard_rows(parsed)
+
+        self.session.flush()
+        after = snapshot_event_states(self.session, parsed_ids)
+        if self.deltas is not None:
+            self.deltas.record_states(before, after)
+        refresh_scoreboard_snapshots(
+            self.session,
+            {
+                (item.season, item.week)
+                for item in parsed
+                if item.event_id in after
+                and after[item.event_id].changed_flags(before.get(item.event_id))
+            },
+        )
+        return event_ids
 
-            home_team = self._upsert_team(teams_by_home_away["home"])
-            away_team = self._upsert_team(teams_by_home_away["away"])
-            venue = self._upsert_venue(competition.get("venue") or {})
+    def _upsert_scoreboard_rows(self, parsed: list[ScoreboardEvent]) -> None:
+        for item in parsed:
+            home_team = self._upsert_team(item.teams_by_home_away["home"])
+            away_team = self._upsert_team(item.teams_by_home_away["away"])
+            venue = self._upsert_venue(item.venue_payload)
 
             context = EventContext(
-                season=season,
-                week=week,
-                start_ts=start_ts,
-                status_name=status_type.get("name", "UNKNOWN"),
+                season=item.season,
+                week=item.week,
+                start_ts=item.start_ts,
+                status_name=item.status_name,
                 home_team=home_team,
                 away_team=away_team,
                 venue=venue,
             )
-            self._upsert_event(event_id=event_id, context=context)
-
-            situation = competition.get("situation") or {}
-            possession_id = situation.get("possession")
-            possession_abbr = None
-            if possession_id is not None:
-                possession_team = _lookup_team_by_id(teams_by_home_away, str(possession_id))
-                if possession_team:
-                    team_payload = possession_team.get("team") or {}
-                    possession_abbr = team_payload.get("abbreviation")
-
-            state = self._ensure_event_state(event_id)
-            state_context = EventStateContext(
-                status_type=status_type,
-                competition=competition,
-                teams_by_home_away=teams_by_home_away,
-                situation=situation,
-                possession_abbr=possession_abbr,
+            self._upsert_event(event_id=item.event_id, context=context)
+
+            state = self._ensure_event_state(item.event_id)
+            self._update_event_state(state=state, context=item.state_context())
+
+    def _bulk_upsert_scoreboard(
+        self, parsed: list[ScoreboardEvent], upsert: Callable[..., Any]
+    ) -> None:
+        team_payloads: dict[int, dict[str, Any]] = {}
+        venue_payloads: dict[str, dict[str, Any]] = {}
+        for item in parsed:
+            for side in ("home", "away"):
+                team_info = item.teams_by_home_away[side].get("team") or {}
+                team_id = _safe_int(team_info.get("id"))
+                if team_id is None:
+                    raise ValueError("Missing team id in competitor payload")
+                team_payloads[team_id] = team_info
+            venue_id = item.venue_payload.get("id")
+            if venue_id is not None:
+                venue_payloads[str(venue_id)] = item.venue_payload
+
+        existing_teams = {
+            row.espn_team_id: row
+            for row in self.session.execute(
+                select(Team.espn_team_id, Team.name, Team.abbr, Team.logos_json).where(
+                    Team.espn_team_id.in_(team_payloads)
+                )
             )
-            self._update_event_state(state=state, context=state_context)
+        }
+        existing_venues = {
+            row.venue_id: row
+            for row in self.session.execute(
+                select(Venue.venue_id, Venue.name, Venue.city, Venue.state, Venue.surface).where(
+                    Venue.venue_id.in_(venue_payloads)
+                )
+            )
+        }
 
-        return event_ids
+        team_rows = [
+            _team_row(team_id, team_info, existing_teams.get(team_id))
+            for team_id, team_info in team_payloads.items()
+        ]
+        venue_rows = [
+            _venue_row(venue_id, venue_payload, existing_venues.get(venue_id))
+            for venue_id, venue_payload in venue_payloads.items()
+        ]
+        event_rows: dict[str, dict[str, Any]] = {}
+        state_rows: dict[str, dict[str, Any]] = {}
+        for item in parsed:
+            venue_id = item.venue_payload.get("id")
+            event_rows[item.event_id] = {
+                "event_id": item.event_id,
+                "season": item.season,
+                "week": item.week,
+                "start_ts": item.start_ts,
+                "status": item.status_name,
+                "home_id": _safe_int((item.teams_by_home_away["home"].get("team") or {}).get("id")),
+                "away_id": _safe_int((item.teams_by_home_away["away"].get("team") or {}).get("id")),
+                "venue_id": str(venue_id) if venue_id is not None else None,
+            }
+            state_rows[item.event_id] = {
+                "event_id": item.event_id,
+                **_event_state_values(item.state_context()),
+            }
+
+        # Parents first so foreign keys resolve within the same transaction.
+        self._upsert_rows(upsert, Team, team_rows)
+        # Seeded coordinates are never part of the scoreboard, so keep them.
+        self._upsert_rows(upsert, Venue, venue_rows, preserve=("lat", "lon"))
+        self._upsert_rows(upsert, Event, list(event_rows.values()))
+        self._upsert_rows(upsert, EventState, list(state_rows.values()))
+
+        # Core upserts bypass the identity map; drop any stale loaded copies.
+        for instance in list(self.session.identity_map.values()):
+            if isinstance(instance, Team | Venue | Event | EventState):
+                self.session.expire(instance)
+
+    def _upsert_rows(
+        self,
+        upsert: Callable[..., Any],
+        model: type[Base],
+        rows: list[dict[str, Any]],
+        *,
+        preserve: tuple[str, ...] = (),
+    ) -> None:
+        if not rows:
+            return
+        table = model.__table__
+        primary_key = [column.name for column in table.primary_key.columns]
+        update_columns = [
+            name for name in rows[0] if name not in primary_key and name not in preserve
+        ]
+        for start in range(0, len(rows), UPSERT_BATCH_ROWS):
+            statement = upsert(table).values(rows[start : start + UPSERT_BATCH_ROWS])
+            statement = statement.on_conflict_do_update(
+                index_elements=primary_key,
+                set_={name: statement.excluded[name] for name in update_columns},
+            )
+            self.session.execute(statement)
 
     # ------------------------------------------------------------------
     # Play-by-play ingestion
     # ------------------------------------------------------------------
-    def ingest_play_by_play(self, event_id: str, payload: dict[str, Any]) -> None:
-        """Replace the drives/plays for a specific event with normalized rows."""
+    def ingest_play_by_play(
+        self, event_id: str, payload: dict[str, Any], *, incremental: bool = False
+    ) -> list[Play]:
+        """Store the drives/plays for a specific event and return new or changed plays.
+
+        By default every stored drive and play for the event is replaced. With
+        ``incremental``, incoming plays are compared by id, sequence number, and a
+        hash of their payload against what is stored: only new plays are inserted,
+        only changed plays are updated, and plays ESPN has retracted are removed.
+        An archived event is restored to full rows before any of its plays change.
+
+        Any change bumps ``Event.pbp_version`` and stamps the written drives and
+        plays with it; removals also move ``Event.pbp_reset_version``. The event
+        row stays locked until the caller commits.
+        """
 
         drives_payload = payload.get("drives", {})
         drives = (drives_payload.get("current") or []) + (drives_payload.get("previous") or [])
         if not drives:
-            return
+            return []
 
+        # Lock the event row until commit so concurrent ingests of the same game
+        # serialize instead of both stamping the same next version.
+        current = self.session.scalar(
+            select(Event.pbp_version).where(Event.event_id == event_id).with_for_update()
+        )
+        version = (current or 0) + 1
+        if incremental:
+            merge = self._merge_play_by_play(event_id, drives, version)
+        else:
+            plays = self._replace_play_by_play(event_id, drives, version)
+            merge = PlayByPlayMerge(plays, changed=True, removed=True)
+        if merge.removed:
+            self.session.execute(
+                update(Event)
+                .where(Event.event_id == event_id)
+                .values(pbp_version=version, pbp_reset_version=version)
+            )
+        elif merge.changed:
+            self.session.execute(
+                update(Event).where(Event.event_id == event_id).values(pbp_version=version)
+            )
+        if self.deltas is not None:
+            self.deltas.record_plays(merge.plays)
+        return merge.plays
+
+    def _replace_play_by_play(
+        self, event_id: str, drives: list[dict[str, Any]], version: int
+    ) -> list[Play]:
+        self.session.execute(delete(PlayArchive).where(PlayArchive.event_id == event_id))
         self.session.execute(delete(Play).where(Play.event_id == event_id))
         self.session.execute(delete(Drive).where(Drive.event_id == event_id))
 
+        plays: list[Play] = []
+        for drive_values, play_values in self._normalize_drives(event_id, drives):
+            self.session.add(Drive(**drive_values, pbp_version=version))
+            for values in play_values:
+                play_row = Play(**values, pbp_version=version)
+                self.session.add(play_row)
+                plays.append(play_row)
+        return plays
+
+    def _merge_play_by_play(
+        self, event_id: str, drives: list[dict[str, Any]], version: int
+    ) -> PlayByPlayMerge:
+        """Merge the payload, stamping every inserted or updated row with ``version``."""
+
+        stored_plays = {
+            play_id: (sequence, content_hash)
+            for play_id, sequence, content_hash in self.session.execute(
+                select(Play.play_id, Play.sequence, Play.content_hash).where(
+                    Play.event_id == event_id
+                )
+            )
+        }
+        stored_drives = {
+            drive.drive_id: drive
+            for drive in self.session.scalars(select(Drive).where(Drive.event_id == event_id))
+        }
+
+        incoming_drives: set[str] = set()
+        drives_changed = False
+        incoming_plays: set[str] = set()
+        inserted: list[Play] = []
+        changed: dict[str, dict[str, Any]] = {}
+        for drive_values, play_values in self._normalize_drives(event_id, drives):
+            incoming_drives.add(drive_values["drive_id"])
+            stored_drive = stored_drives.get(drive_values["drive_id"])
+            if self._merge_drive(stored_drive, drive_values, version):
+                drives_changed = True
+
+            for values in play_values:
+                play_id = values["play_id"]
+                incoming_plays.add(play_id)
+                stored = stored_plays.get(play_id)
+                if stored is None:
+                    play_row = Play(**values, pbp_version=version)
+                    self.session.add(play_row)
+                    inserted.append(play_row)
+                elif stored != (values["sequence"], values["content_hash"]):
+                    changed[play_id] = values
+
+        retracted = set(stored_plays) - incoming_plays
+        if inserted or changed or retracted:
+            restore_play_archive(self.session, event_id)
+
+        updated: list[Play] = []
+        if changed:
+            for play_row in self.session.scalars(
+                select(Play).where(Play.event_id == event_id, Play.play_id.in_(changed))
+            ):
+                for name, value in changed[play_row.play_id].items():
+                    setattr(play_row, name, value)
+                play_row.pbp_version = version
+                updated.append(play_row)
+
+        if retracted:
+            self.session.execute(
+                delete(Play).where(Play.event_id == event_id, Play.play_id.in_(retracted))
+            )
+        retracted_drives = set(stored_drives) - incoming_drives
+        for drive_id in retracted_drives:
+            self.session.delete(stored_drives[drive_id])
+
+        changed_plays = sorted(inserted + updated, key=lambda play: play.sequence)
+        removed = bool(retracted or retracted_drives)
+        return PlayByPlayMerge(
+            plays=changed_plays,
+            changed=bool(changed_plays or drives_changed or removed),
+            removed=removed,
+        )
+
+    def _merge_drive(self, drive: Drive | None, drive_values: dict[str, Any], version: int) -> bool:
+        """Insert or update one drive; returns whether anything about it changed."""
+
+        if drive is None:
+            self.session.add(Drive(**drive_values, pbp_version=version))
+            return True
+        changed = False
+        for name, value in drive_values.items():
+            # Only assign differing values so the ORM issues no needless UPDATE.
+            if getattr(drive, name) != value:
+                setattr(drive, name, value)
+                changed = True
+        if changed:
+            drive.pbp_version = version
+        return changed
+
+    def _normalize_drives(
+        self, event_id: str, drives: list[dict[str, Any]]
+    ) -> list[tuple[dict[str, Any], list[dict[str, Any]]]]:
+        """Return column values for each drive with a known team and its plays."""
+
         team_cache: dict[int, Team] = {}
+        normalized: list[tuple[dict[str, Any], list[dict[str, Any]]]] = []
 
         for drive in drives:
             drive_id = str(drive.get("id"))
@@ -128,39 +436,43 @@ class PyESPNIngestionService:
 
             start = drive.get("start") or {}
             end = drive.get("end") or {}
-
-            db_drive = Drive(
-                event_id=event_id,
-                drive_id=drive_id,
-                team_id=team_id,
-                start_yardline_100=_safe_int(start.get("yardsToEndzone")),
-                end_yardline_100=_safe_int(end.get("yardsToEndzone")),
-                result=drive.get("result") or drive.get("displayResult"),
-                start_clock=_extract_clock(start),
-                end_clock=_extract_clock(end),
-            )
-            self.session.add(db_drive)
-
+            drive_values = {
+                "event_id": event_id,
+                "drive_id": drive_id,
+                "team_id": team_id,
+                "start_yardline_100": _safe_int(start.get("yardsToEndzone")),
+                "end_yardline_100": _safe_int(end.get("yardsToEndzone")),
+                "result": drive.get("result") or drive.get("displayResult"),
+                "start_clock": _extract_clock(start),
+                "end_clock": _extract_clock(end),
+            }
+
+            play_values: list[dict[str, Any]] = []
             for play in drive.get("plays") or []:
                 play_id = str(play.get("id"))
                 if not play_id:
                     continue
                 start_play = play.get("start") or {}
-                play_row = Play(
-                    event_id=event_id,
-                    play_id=play_id,
-                    drive_id=drive_id,
-                    sequence=int(play.get("sequenceNumber", 0)),
-                    clock=_extract_clock(play),
-                    quarter=_safe_int((play.get("period") or {}).get("number")),
-                    down=_safe_int(start_play.get("down")),
-                    distance=_safe_int(start_play.get("distance")),
-                    yardline_100=_safe_int(start_play.get("yardsToEndzone")),
-                    type=_play_type(play),
-                    yards=_safe_int(play.get("statYardage")),
-                    raw_json=play,
+                play_values.append(
+                    {
+                        "event_id": event_id,
+                        "play_id": play_id,
+                        "drive_id": drive_id,
+                        "sequence": int(play.get("sequenceNumber", 0)),
+                        "clock": _extract_clock(play),
+                        "quarter": _safe_int((play.get("period") or {}).get("number")),
+                        "down": _safe_int(start_play.get("down")),
+                        "distance": _safe_int(start_play.get("distance")),
+                        "yardline_100": _safe_int(start_play.get("yardsToEndzone")),
+                        "type": _play_type(play),
+                        "yards": _safe_int(play.get("statYardage")),
+                        **promoted_play_columns(play),
+                        "raw_json": play,
+                        "content_hash": _content_hash(drive_id, play),
+                    }
                 )
-                self.session.add(play_row)
+            normalized.append((drive_values, play_values))
+        return normalized
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -249,22 +561,8 @@ class PyESPNIngestionService:
         return state
 
     def _update_event_state(self, *, state: EventState, context: EventStateContext) -> None:
-        scoreboard_status = context.competition.get("status") or {}
-        status_description = context.status_type.get("description")
-        state.status = (
-            status_description if isinstance(status_description, str) else "Final"
-        )
-        status_detail = context.status_type.get("shortDetail")
-        state.status_detail = status_detail if isinstance(status_detail, str) else None
-        state.quarter = scoreboard_status.get("period")
-        state.clock = scoreboard_status.get("displayClock")
-        state.possession = context.possession_abbr
-        state.home_score = int(context.teams_by_home_away["home"].get("score", 0))
-        state.away_score = int(context.teams_by_home_away["away"].get("score", 0))
-        state.home_timeouts = context.situation.get("homeTimeouts")
-        state.away_timeouts = context.situation.get("awayTimeouts")
-        state.broadcast_json = _normalize_broadcasts(context.competition.get("broadcasts") or [])
-        state.last_update = datetime.now(tz=UTC)
+        for name, value in _event_state_values(context).items():
+            setattr(state, name, value)
 
     def _upsert_venue(self, venue_payload: dict[str, Any]) -> Venue | None:
         venue_id = venue_payload.get("id")
@@ -298,6 +596,123 @@ class PyESPNIngestionService:
 # Helper functions
 # ----------------------------------------------------------------------
 
+def _parse_scoreboard_event(event_id: str, event: dict[str, Any]) -> ScoreboardEvent | None:
+    competition = (event.get("competitions") or [{}])[0]
+    teams_by_home_away = _split_competitors(competition.get("competitors") or [])
+    if not teams_by_home_away:
+        return None
+
+    situation = competition.get("situation") or {}
+    possession_id = situation.get("possession")
+    possession_abbr = None
+    if possession_id is not None:
+        possession_team = _lookup_team_by_id(teams_by_home_away, str(possession_id))
+        if possession_team:
+            team_payload = possession_team.get("team") or {}
+            possession_abbr = team_payload.get("abbreviation")
+
+    return ScoreboardEvent(
+        event_id=event_id,
+        season=int(event.get("season", {}).get("year", datetime.now(tz=UTC).year)),
+        week=int(event.get("week", {}).get("number", 0)),
+        start_ts=_parse_datetime(competition.get("date") or event.get("date")),
+        status_type=competition.get("status", {}).get("type", {}),
+        competition=competition,
+        teams_by_home_away=teams_by_home_away,
+        situation=situation,
+        possession_abbr=possession_abbr,
+    )
+
+
+def _event_state_values(context: EventStateContext) -> dict[str, Any]:
+    scoreboard_status = context.competition.get("status") or {}
+    status_description = context.status_type.get("description")
+    status_detail = context.status_type.get("shortDetail")
+    return {
+        "status": status_description if isinstance(status_description, str) else "Final",
+        "status_detail": status_detail if isinstance(status_detail, str) else None,
+        "quarter": scoreboard_status.get("period"),
+        "clock": scoreboard_status.get("displayClock"),
+        "possession": context.possession_abbr,
+        "home_score": int(context.teams_by_home_away["home"].get("score", 0)),
+        "away_score": int(context.teams_by_home_away["away"].get("score", 0)),
+        "home_timeouts": context.situation.get("homeTimeouts"),
+        "away_timeouts": context.situation.get("awayTimeouts"),
+        "broadcast_json": _normalize_broadcasts(context.competition.get("broadcasts") or []),
+        "last_update": datetime.now(tz=UTC),
+    }
+
+
+def _team_row(team_id: int, team_info: dict[str, Any], existing: Any | None) -> dict[str, Any]:
+    """Mirror ``_upsert_team``: keep stored names/logos when the payload omits them."""
+
+    logos = _extract_logos(team_info)
+    if existing is None:
+        name = team_info.get("displayName", team_info.get("name", "Unknown"))
+        abbr = team_info.get("abbreviation", "UNK")
+    else:
+        name = team_info.get("displayName", existing.name)
+        abbr = team_info.get("abbreviation", existing.abbr)
+        logos = logos if logos else existing.logos_json
+    return {
+        "espn_team_id": team_id,
+        "name": name,
+        "abbr": abbr,
+        "colors_json": {
+            "primary": team_info.get("color"),
+            "alternate": team_info.get("alternateColor"),
+        },
+        "logos_json": logos,
+    }
+
+
+def _venue_row(
+    venue_id: str, venue_payload: dict[str, Any], existing: Any | None
+) -> dict[str, Any]:
+    """Mirror ``_upsert_venue``: keep stored fields the payload omits."""
+
+    address = venue_payload.get("address") or {}
+    if existing is None:
+        return {
+            "venue_id": venue_id,
+            "name": venue_payload.get("fullName", "Unknown Venue"),
+            "city": address.get("city", ""),
+            "state": address.get("state", ""),
+            "roof_type": "indoor" if venue_payload.get("indoor") else None,
+            "surface": venue_payload.get("surface"),
+            "lat": None,
+            "lon": None,
+        }
+    return {
+        "venue_id": venue_id,
+        "name": venue_payload.get("fullName", existing.name),
+        "city": address.get("city", existing.city),
+        "state": address.get("state", existing.state),
+        "roof_type": "indoor" if venue_payload.get("indoor") else venue_payload.get("roofType"),
+        "surface": venue_payload.get("surface", existing.surface),
+        "lat": None,
+        "lon": None,
+    }
+
+
+def _content_hash(drive_id: str, play: dict[str, Any]) -> str:
+    """Hash a play payload (and its drive) so unchanged plays can be skipped."""
+
+    encoded = json.dumps([drive_id, play], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _dialect_insert(session: Session) -> Callable[..., Any] | None:
+    """Return the dialect ``insert`` supporting ``ON CONFLICT``, if there is one."""
+
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert
+    if dialect == "sqlite":
+        return sqlite.insert
+    return None
+
+
 def _parse_datetime(value: str | None) -> datetime:
     if not value:
         return datetime.now(tz=UTC)
@@ -0,0 +1,245 @@
+"""Concurrent PyESPN polling with a per-game cadence driven by ``EventState.status``."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.clients.pyespn import AsyncPyESPNClient
+from app.clients.redis import RedisClientFactory
+from app.core.config import Settings, get_settings
+from app.db.session import get_session_factory
+from app.services.games import PHASE_FINAL, PHASE_LIVE, PHASE_PREGAME, game_phase
+from app.services.pyespn.deltas import GameDeltaBatch, GameDeltaPublisher, snapshot_event_states
+from app.services.pyespn.ingest import PyESPNIngestionService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class PollCadence:
+    """Seconds between polls for each game phase; final games are not polled."""
+
+    live_seconds: float = 2.0
+    pregame_seconds: float = 60.0
+
+    def interval(self, status: str | None) -> float | None:
+        phase = game_phase(status)
+        if phase == PHASE_LIVE:
+            return self.live_seconds
+        if phase == PHASE_PREGAME:
+            return self.pregame_seconds
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class PollCycle:
+    """Outcome of one poll: what was fetched and when the next poll is due."""
+
+    statuses: dict[str, str]
+    polled: tuple[str, ...]
+    unchanged: tuple[str, ...]
+    failed: tuple[str, ...]
+    published: int
+    next_poll_seconds: float | None
+
+
+@dataclass(slots=True)
+class PyESPNPoller:
+    """Poll the scoreboard and every due game's play-by-play on one shared client.
+
+    Each cycle ingests the scoreboard in bulk, reads back each game's status, and
+    fetches the play-by-play of games whose cadence has elapsed concurrently,
+    at most ``concurrency`` requests at a time. Responses identical to the previous
+    poll are neither parsed nor ingested. Each game is ingested in its own
+    transaction; one that fails is rolled back and refetched in full next cycle.
+    A game that reaches a final status gets one last fetch and is then dropped
+    from the schedule. Deltas are published after the cycle's writes commit.
+    """
+
+    client: AsyncPyESPNClient
+    session_factory: Callable[[], Session]
+    season: int
+    week: int | None = None
+    cadence: PollCadence = field(default_factory=PollCadence)
+    concurrency: int = 4
+    publisher: GameDeltaPublisher | None = None
+    clock: Callable[[], float] = time.monotonic
+    _statuses: dict[str, str] = field(init=False, default_factory=dict)
+    _next_due: dict[str, float] = field(init=False, default_factory=dict)
+    _finished: set[str] = field(init=False, default_factory=set)
+
+    async def poll_once(self) -> PollCycle:
+        """Run one poll cycle."""
+
+        batch = GameDeltaBatch()
+        scoreboard = await self.client.get_scoreboard_if_changed(self.season, self.week)
+        if scoreboard is not None:
+            try:
+                self._statuses = await asyncio.to_thread(
+                    self._ingest_scoreboard, scoreboard, batch
+                )
+            except Exception:
+                # Keep the previous statuses and refetch the scoreboard in full next cycle.
+                logger.exception("PyESPN scoreboard ingest failed")
+                self.client.forget_scoreboard(self.season, self.week)
+                batch = GameDeltaBatch()
+        statuses = dict(self._statuses)
+
+        now = self.clock()
+        due = [
+            event_id
+            for event_id, status in statuses.items()
+            if event_id not in self._finished
+            and (game_phase(status) == PHASE_FINAL or self._next_due.get(event_id, 0.0) <= now)
+        ]
+        responses = await self._fetch_play_by_play(due)
+        changed = {
+            event_id: payload for event_id, payload in responses.items() if payload is not None
+        }
+        published, rejected = await asyncio.to_thread(self._ingest_play_by_play, changed, batch)
+        for event_id in rejected:
+            # Failed payloads are retried as new on the next cycle.
+            self.client.forget_play_by_play(event_id)
+            del responses[event_id]
+
+        for event_id in responses:
+            interval = self.cadence.interval(statuses[event_id])
+            if interval is None:
+                self._finished.add(event_id)
+                self._next_due.pop(event_id, None)
+            else:
+                self._next_due[event_id] = now + interval
+
+        return PollCycle(
+            statuses=statuses,
+            polled=tuple(responses),
+            unchanged=tuple(event_id for event_id in responses if event_id not in changed),
+            failed=tuple(event_id for event_id in due if event_id not in responses),
+            published=published,
+            next_poll_seconds=self._next_poll_seconds(statuses, now),
+        )
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """Poll until every game is final or ``stop`` is set."""
+
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            try:
+                cycle = await self.poll_once()
+                delay = cycle.next_poll_seconds
+            except Exception:
+                logger.exception("PyESPN poll cycle failed")
+                delay = self.cadence.live_seconds
+            if delay is None:
+                return
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except TimeoutError:
+                continue
+
+    async def _fetch_play_by_play(
+        self, event_ids: list[str]
+    ) -> dict[str, dict[str, Any] | None]:
+        """Fetch due play-by-play; ``None`` marks an unchanged payload, failures are omitted."""
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        responses: dict[str, dict[str, Any] | None] = {}
+
+        async def fetch(event_id: str) -> None:
+            async with semaphore:
+                try:
+                    responses[event_id] = await self.client.get_play_by_play_if_changed(event_id)
+                except Exception:
+                    logger.warning(
+                        "PyESPN play-by-play poll failed for %s", event_id, exc_info=True
+                    )
+
+        await asyncio.gather(*(fetch(event_id) for event_id in event_ids))
+        return {event_id: responses[event_id] for event_id in event_ids if event_id in responses}
+
+    def _ingest_scoreboard(
+        self, scoreboard: dict[str, Any], batch: GameDeltaBatch
+    ) -> dict[str, str]:
+        with self.session_factory() as session:
+            service = PyESPNIngestionService(session, deltas=batch)
+            event_ids = service.ingest_scoreboard(scoreboard, bulk=True)
+            session.commit()
+            snapshots = snapshot_event_states(session, event_ids)
+        return {event_id: snapshot.status for event_id, snapshot in snapshots.items()}
+
+    def _ingest_play_by_play(
+        self, payloads: dict[str, dict[str, Any]], batch: GameDeltaBatch
+    ) -> tuple[int, list[str]]:
+        """Ingest each event in its own transaction; return deltas published and failures."""
+
+        rejected: list[str] = []
+        for event_id, payload in payloads.items():
+            event_batch = GameDeltaBatch()
+            with self.session_factory() as session:
+                try:
+                    service = PyESPNIngestionService(session, deltas=event_batch)
+                    service.ingest_play_by_play(event_id, payload, incremental=True)
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    logger.exception("PyESPN play-by-play ingest failed for %s", event_id)
+                    rejected.append(event_id)
+                    continue
+            batch.extend(event_batch)
+        if self.publisher is None:
+            return 0, rejected
+        return self.publisher.publish(batch), rejected
+
+    def _next_poll_seconds(self, statuses: dict[str, str], now: float) -> float | None:
+        pending = [event_id for event_id in statuses if event_id not in self._finished]
+        if statuses and not pending:
+            return None
+        # The scoreboard carries status changes, so poll it at the fastest active cadence.
+        intervals = [
+            interval
+            for event_id in pending
+            if (interval := self.cadence.interval(statuses[event_id])) is not None
+        ]
+        delay = min(intervals, default=self.cadence.pregame_seconds)
+        due_in = [
+            self._next_due[event_id] - now for event_id in pending if event_id in self._next_due
+        ]
+        return max(0.0, min([delay, *due_in]))
+
+
+async def run_poller(settings: Settings, *, week: int | None = None) -> None:
+    """Poll ESPN for ``settings.pyespn_season_year`` until every game is final."""
+
+    client = AsyncPyESPNClient(settings=settings, max_connections=settings.pyespn_concurrency)
+    publisher = (
+        GameDeltaPublisher(RedisClientFactory(settings=settings).create_sync())
+        if settings.redis_url
+        else None
+    )
+    poller = PyESPNPoller(
+        client=client,
+        session_factory=get_session_factory(settings),
+        season=settings.pyespn_season_year,
+        week=week,
+        cadence=PollCadence(
+            live_seconds=settings.pyespn_poll_ms / 1000,
+            pregame_seconds=settings.pyespn_pregame_poll_ms / 1000,
+        ),
+        concurrency=settings.pyespn_concurrency,
+        publisher=publisher,
+    )
+    try:
+        await poller.run()
+    finally:
+        await client.aclose()
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    asyncio.run(run_poller(get_settings()))
@@ -12,14 +12,12 @@ from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, s
 from fastapi.websockets import WebSocketState
 from pydantic import ValidationError
 from redis.asyncio import Redis
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.config import Settings
 from app.dependencies.database import provide_db_session
 from app.dependencies.redis import provide_redis_client
 from app.dependencies.settings import provide_settings
-from app.models.espn import Play
 from app.schemas.runtime import FeatureFlags
 from app.schemas.ws import (
     ErrorMessage,
@@ -29,7 +27,7 @@ from app.schemas.ws import (
     ReplayCompleteMessage,
     WebSocketHandshake,
 )
-from app.services.games import build_play_detail
+from app.services.games import load_play_details_by_drive
 
 logger = logging.getLogger(__name__)
 
@@ -168,11 +166,11 @@ async def _stream_replay(
     event_id: str,
     speed: float,
 ) -> None:
-    plays = list(
-        session.execute(
-            select(Play).where(Play.event_id == event_id).order_by(Play.drive_id, Play.sequence)
-        ).scalars()
-    )
+    plays = [
+        detail
+        for details in load_play_details_by_drive(session, event_id).values()
+        for detail in details
+    ]
 
     if not plays:
         await _send_frame(
@@ -186,11 +184,10 @@ async def _stream_replay(
         await _close_socket(websocket, status.WS_1008_POLICY_VIOLATION)
         return
 
-    for play in plays:
-        detail = build_play_detail(play)
+    for detail in plays:
         delta = GameDelta(
             event_id=event_id,
-            play_id=play.play_id,
+            play_id=detail.play_id,
             sequence=detail.sequence,
             clock=detail.clock,
             quarter=detail.quarter,
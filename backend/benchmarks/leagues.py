@@ -0,0 +1,140 @@
+"""Synthetic fantasy league generator for optimizer benchmarks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from app.optimizer import (
+    OptimizerPlayer,
+    OptimizerProblem,
+    OptimizerSlot,
+    position_mask,
+    slot_positions,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LeagueLayout:
+    """Starting slots plus the positional mix players are drawn from."""
+
+    name: str
+    slots: tuple[str, ...]
+    bench_size: int
+    position_weights: dict[str, float]
+
+
+_OFFENSE_WEIGHTS = {"QB": 0.14, "RB": 0.3, "WR": 0.34, "TE": 0.12, "K": 0.05, "DEF": 0.05}
+_IDP_WEIGHTS = {
+    "QB": 0.1,
+    "RB": 0.2,
+    "WR": 0.22,
+    "TE": 0.08,
+    "K": 0.04,
+    "DEF": 0.04,
+    "DL": 0.11,
+    "LB": 0.11,
+    "DB": 0.1,
+}
+_STANDARD_SLOTS = ("QB", "RB", "RB", "WR", "WR", "TE", "W/R/T", "K", "DEF")
+
+LAYOUTS: dict[str, LeagueLayout] = {
+    layout.name: layout
+    for layout in (
+        LeagueLayout("standard", _STANDARD_SLOTS, 6, _OFFENSE_WEIGHTS),
+        LeagueLayout("superflex", (*_STANDARD_SLOTS, "Q/W/R/T"), 6, _OFFENSE_WEIGHTS),
+        LeagueLayout(
+            "two_qb",
+            ("QB", "QB", "RB", "RB", "WR", "WR", "WR", "TE", "W/R/T", "K", "DEF"),
+            6,
+            {**_OFFENSE_WEIGHTS, "QB": 0.22, "WR": 0.3, "RB": 0.26},
+        ),
+        LeagueLayout(
+            "idp",
+            (*_STANDARD_SLOTS, "DL", "DL", "LB", "LB", "DB", "DB", "DL/LB/DB"),
+            7,
+            _IDP_WEIGHTS,
+        ),
+        LeagueLayout("deep_bench", _STANDARD_SLOTS, 15, _OFFENSE_WEIGHTS),
+    )
+}
+
+# Mean weekly projection and spread per position.
+_PROJECTION_PARAMS: dict[str, tuple[float, float]] = {
+    "QB": (17.0, 5.0),
+    "RB": (10.0, 5.0),
+    "WR": (10.0, 5.0),
+    "TE": (7.0, 3.5),
+    "K": (8.0, 2.0),
+    "DEF": (7.0, 3.0),
+    "DL": (6.0, 2.5),
+    "LB": (8.0, 3.0),
+    "DB": (6.5, 2.5),
+}
+_DUAL_ELIGIBLE_SHARE = 0.08
+
+
+def generate_problem(
+    layout: LeagueLayout, roster_size: int, rng: np.random.Generator
+) -> OptimizerProblem:
+    """Draw one team's roster of ``roster_size`` players for ``layout``.
+
+    The first players cover every starting slot, as a real drafted roster
+    would; the remainder are drawn from the layout's positional mix.
+    """
+
+    layout_mask = position_mask(layout.position_weights)
+    slot_eligibility = [slot_positions(slot_name, layout_mask) for slot_name in layout.slots]
+
+    drawn = [_draw_position(layout, eligible, rng) for eligible in slot_eligibility]
+    drawn.extend(
+        _draw_position(layout, tuple(layout.position_weights), rng)
+        for _ in range(max(0, roster_size - len(drawn)))
+    )
+
+    players: list[OptimizerPlayer] = []
+    for index, position in enumerate(drawn):
+        mean, spread = _PROJECTION_PARAMS[position]
+        eligible: tuple[str, ...] = (position,)
+        if position in {"RB", "WR"} and rng.random() < _DUAL_ELIGIBLE_SHARE:
+            eligible = ("RB", "WR")
+        players.append(
+            OptimizerPlayer(
+                player_id=f"p{index}",
+                name=f"Player {index}",
+                positions=eligible,
+                projected_points=round(max(0.0, float(rng.normal(mean, spread))), 2),
+                projected_stddev=spread,
+            )
+        )
+
+    slots = tuple(
+        OptimizerSlot(
+            slot_id=f"{slot_name}-{index}", slot_name=slot_name, eligible_positions=eligible
+        )
+        for index, (slot_name, eligible) in enumerate(
+            zip(layout.slots, slot_eligibility, strict=True)
+        )
+    )
+    return OptimizerProblem(players=tuple(players), slots=slots)
+
+
+def _draw_position(
+    layout: LeagueLayout, candidates: tuple[str, ...], rng: np.random.Generator
+) -> str:
+    weights = np.array([layout.position_weights.get(position, 0.0) for position in candidates])
+    return candidates[int(rng.choice(len(candidates), p=weights / weights.sum()))]
+
+
+def generate_league(
+    layout: LeagueLayout,
+    *,
+    teams: int,
+    roster_size: int | None = None,
+    seed: int = 0,
+) -> list[OptimizerProblem]:
+    """Generate ``teams`` rosters; ``roster_size`` defaults to starters plus bench."""
+
+    size = max(roster_size or len(layout.slots) + layout.bench_size, len(layout.slots))
+    rng = np.random.default_rng(seed)
+    return [generate_problem(layout, size, rng) for _ in range(teams)]
@@ -0,0 +1,203 @@
+"""Benchmark every optimizer engine across synthetic league layouts.
+
+Run from ``backend/``::
+
+    python -m benchmarks.optimizer --output optimizer-bench.json
+
+Each (layout, roster size, engine) cell reports p50/p99 solve latency, the
+optimality gap against the exact assignment solution, how many lineups broke
+slot eligibility or started a player twice, and peak traced memory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import get_args
+
+import numpy as np
+from app.optimizer import OptimizerEngine, OptimizerProblem, OptimizerResult, optimize_lineup
+from app.optimizer.engine import clear_model_cache
+
+from benchmarks.leagues import LAYOUTS, LeagueLayout, generate_league
+
+SCHEMA_VERSION = 1
+ENGINES: tuple[OptimizerEngine, ...] = get_args(OptimizerEngine)
+DEFAULT_SIZE_MULTIPLIERS = (1.0, 2.0, 4.0)
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkConfig:
+    """Which layouts, engines, and roster sizes to measure, and how often."""
+
+    layouts: Sequence[str] = tuple(LAYOUTS)
+    engines: Sequence[OptimizerEngine] = ENGINES
+    size_multipliers: Sequence[float] = DEFAULT_SIZE_MULTIPLIERS
+    teams: int = 12
+    repeats: int = 3
+    seed: int = 0
+
+
+DEFAULT_CONFIG = BenchmarkConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCell:
+    """Aggregated measurements for one engine on one league shape."""
+
+    layout: str
+    roster_size: int
+    engine: str
+    problems: int
+    repeats: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    mean_gap: float
+    max_gap: float
+    invalid_lineups: int
+    peak_memory_kib: float
+
+
+def run_cell(
+    layout: LeagueLayout,
+    roster_size: int,
+    engine: OptimizerEngine,
+    problems: Sequence[OptimizerProblem],
+    *,
+    repeats: int = 3,
+) -> BenchmarkCell:
+    """Time ``engine`` over ``problems`` and compare against exact optima."""
+
+    clear_model_cache()
+    exact_totals = [optimize_lineup(p.players, p.slots).total_points for p in problems]
+
+    durations_ms: list[float] = []
+    gaps: list[float] = []
+    invalid_lineups = 0
+    for _ in range(repeats):
+        for problem, exact_total in zip(problems, exact_totals, strict=True):
+            start = time.perf_counter()
+            result = optimize_lineup(problem.players, problem.slots, engine=engine)
+            durations_ms.append((time.perf_counter() - start) * 1000)
+            gaps.append((exact_total - result.total_points) / exact_total if exact_total else 0.0)
+            invalid_lineups += not is_valid_lineup(problem, result)
+
+    # Memory is traced on a separate pass so tracing overhead does not skew latency.
+    tracemalloc.start()
+    try:
+        for problem in problems:
+            optimize_lineup(problem.players, problem.slots, engine=engine)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies = np.asarray(durations_ms)
+    return BenchmarkCell(
+        layout=layout.name,
+        roster_size=roster_size,
+        engine=engine,
+        problems=len(problems),
+        repeats=repeats,
+        p50_ms=round(float(np.percentile(latencies, 50)), 4),
+        p99_ms=round(float(np.percentile(latencies, 99)), 4),
+        mean_ms=round(float(latencies.mean()), 4),
+        mean_gap=round(float(np.mean(gaps)), 6),
+        max_gap=round(float(np.max(gaps)), 6),
+        invalid_lineups=invalid_lineups,
+        peak_memory_kib=round(peak_bytes / 1024, 2),
+    )
+
+
+def is_valid_lineup(problem: OptimizerProblem, result: OptimizerResult) -> bool:
+    """Return True when every starter is eligible for its slot and starts once."""
+
+    players = {player.player_id: player for player in problem.players}
+    slots = {slot.slot_id: slot for slot in problem.slots}
+    starters = [assignment.player_id for assignment in result.assignments]
+    if len(starters) != len(set(starters)):
+        return False
+    return all(
+        set(players[assignment.player_id].positions)
+        & set(slots[assignment.slot_id].eligible_positions)
+        for assignment in result.assignments
+    )
+
+
+def run_benchmarks(config: BenchmarkConfig = DEFAULT_CONFIG) -> dict[str, object]:
+    """Run the full matrix and return a JSON-serializable report."""
+
+    cells: list[BenchmarkCell] = []
+    for layout_name in config.layouts:
+        layout = LAYOUTS[layout_name]
+        base_size = len(layout.slots) + layout.bench_size
+        for multiplier in config.size_multipliers:
+            roster_size = max(len(layout.slots), round(base_size * multiplier))
+            problems = generate_league(
+                layout, teams=config.teams, roster_size=roster_size, seed=config.seed
+            )
+            cells.extend(
+                run_cell(layout, roster_size, engine, problems, repeats=config.repeats)
+                for engine in config.engines
+            )
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "generated_at": datetime.now(tz=UTC).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+        },
+        "config": {
+            "layouts": list(config.layouts),
+            "engines": list(config.engines),
+            "size_multipliers": list(config.size_multipliers),
+            "teams": config.teams,
+            "repeats": config.repeats,
+            "seed": config.seed,
+        },
+        "results": [asdict(cell) for cell in cells],
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point writing the JSON report to a file or stdout."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--layout", action="append", choices=sorted(LAYOUTS), dest="layouts")
+    parser.add_argument("--engine", action="append", choices=ENGINES, dest="engines")
+    parser.add_argument("--size-multiplier", action="append", type=float, dest="multipliers")
+    parser.add_argument("--teams", type=int, default=12)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        BenchmarkConfig(
+            layouts=args.layouts or tuple(LAYOUTS),
+            engines=args.engines or ENGINES,
+            size_multipliers=args.multipliers or DEFAULT_SIZE_MULTIPLIERS,
+            teams=args.teams,
+            repeats=args.repeats,
+            seed=args.seed,
+        )
+    )
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        sys.stdout.write(payload + "\n")
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    main()
@@ -0,0 +1,31 @@
+"""Materialized season lineup plans."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251023_0005"
+down_revision = "20251023_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lineup_plans",
+        sa.Column("team_key", sa.String(length=64), nullable=False),
+        sa.Column("week", sa.Integer(), nullable=False),
+        sa.Column("total_points", sa.Float(), nullable=False),
+        sa.Column("assignments_json", sa.JSON(), nullable=False),
+        sa.Column("unfillable_slots_json", sa.JSON(), nullable=False),
+        sa.Column("bye_players_json", sa.JSON(), nullable=False),
+        sa.Column("generated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["team_key"], ["yahoo_teams.team_key"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("team_key", "week", name="pk_lineup_plans"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("lineup_plans")
@@ -0,0 +1,127 @@
+"""Promote play description, scoring flag, and type abbreviation out of raw_json."""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251023_0008"
+down_revision = "20251023_0007"
+branch_labels = None
+depends_on = None
+
+_BACKFILL_BATCH_ROWS = 1000
+
+
+def upgrade() -> None:
+    op.add_column("plays", sa.Column("description", sa.Text(), nullable=True))
+    op.add_column(
+        "plays",
+        sa.Column("scoring_play", sa.Boolean(), nullable=False, server_default=sa.false()),
+    )
+    op.add_column("plays", sa.Column("type_abbreviation", sa.String(length=16), nullable=True))
+
+    plays = sa.table(
+        "plays",
+        sa.column("event_id", sa.String()),
+        sa.column("play_id", sa.String()),
+        sa.column("raw_json", sa.JSON()),
+        sa.column("description", sa.Text()),
+        sa.column("scoring_play", sa.Boolean()),
+        sa.column("type_abbreviation", sa.String()),
+    )
+    statement = (
+        plays.update()
+        .where(
+            plays.c.event_id == sa.bindparam("b_event_id"),
+            plays.c.play_id == sa.bindparam("b_play_id"),
+        )
+        .values(
+            description=sa.bindparam("b_description"),
+            scoring_play=sa.bindparam("b_scoring_play"),
+            type_abbreviation=sa.bindparam("b_type_abbreviation"),
+        )
+    )
+    # Archived events had their raw_json emptied; their plays' JSON lives in the archive.
+    archives = sa.table(
+        "play_archives",
+        sa.column("event_id", sa.String()),
+        sa.column("payload", sa.LargeBinary()),
+    )
+    connection = op.get_bind()
+    key = sa.tuple_(plays.c.event_id, plays.c.play_id)
+    last_key: tuple[str, str] | None = None
+    # Walk the primary key in pages so only one batch of rows is held at a time.
+    while True:
+        query = (
+            sa.select(plays.c.event_id, plays.c.play_id, plays.c.raw_json)
+            .order_by(plays.c.event_id, plays.c.play_id)
+            .limit(_BACKFILL_BATCH_ROWS)
+        )
+        if last_key is not None:
+            query = query.where(key > sa.tuple_(*last_key))
+        rows = connection.execute(query).all()
+        if not rows:
+            break
+        archived_raw: dict[tuple[str, str], dict] = {}
+        for event_id, payload in connection.execute(
+            sa.select(archives.c.event_id, archives.c.payload).where(
+                archives.c.event_id.in_({row.event_id for row in rows})
+            )
+        ):
+            for play_id, raw in _archived_raw_json(bytes(payload)):
+                archived_raw[(event_id, play_id)] = raw
+        connection.execute(
+            statement,
+            [
+                _backfill_params(event_id, play_id, archived_raw.get((event_id, play_id), raw))
+                for event_id, play_id, raw in rows
+            ],
+        )
+        last_key = rows[-1].event_id, rows[-1].play_id
+
+    op.alter_column("plays", "scoring_play", server_default=None)
+
+
+def _backfill_params(event_id: str, play_id: str, raw: dict | None) -> dict:
+    raw = raw or {}
+    return {
+        "b_event_id": event_id,
+        "b_play_id": play_id,
+        "b_description": raw.get("text"),
+        "b_scoring_play": bool(raw.get("scoringPlay")),
+        "b_type_abbreviation": (raw.get("type") or {}).get("abbreviation"),
+    }
+
+
+def _archived_raw_json(payload: bytes) -> list[tuple[str, dict]]:
+    """Decode the play ids and raw JSON of a revision 0007 play archive.
+
+    Layout: ``b"RPA1" | uint32 header length | JSON header | zlib column blocks``,
+    where the header maps each column to ``[kind, offset, length]``. Decoded here
+    rather than via ``app.services.play_archive`` so the migration stays frozen.
+    """
+
+    magic, header_length = struct.unpack_from("<4sI", payload)
+    if magic != b"RPA1":
+        return []
+    data_start = 8 + header_length
+    columns = json.loads(payload[8:data_start])["columns"]
+
+    def column(name: str) -> list:
+        _kind, offset, length = columns[name]
+        start = data_start + offset
+        return json.loads(zlib.decompress(payload[start : start + length]))
+
+    return list(zip(column("play_id"), column("raw_json"), strict=True))
+
+
+def downgrade() -> None:
+    op.drop_column("plays", "type_abbreviation")
+    op.drop_column("plays", "scoring_play")
+    op.drop_column("plays", "description")
@@ -0,0 +1,24 @@
+"""Version each event's play-by-play so rendered responses can be cached."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251023_0009"
+down_revision = "20251023_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column("pbp_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.alter_column("events", "pbp_version", server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column("events", "pbp_version")
@@ -0,0 +1,38 @@
+"""Stamp drives and plays with the play-by-play version that last changed them."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251023_0011"
+down_revision = "20251023_0010"
+branch_labels = None
+depends_on = None
+
+_VERSIONED_TABLES = ("drives", "plays")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "events",
+        sa.Column("pbp_reset_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.alter_column("events", "pbp_reset_version", server_default=None)
+    # Existing rows carry no change history, so cursors older than today get the full timeline.
+    op.execute("UPDATE events SET pbp_reset_version = pbp_version")
+    for table in _VERSIONED_TABLES:
+        op.add_column(
+            table,
+            sa.Column("pbp_version", sa.Integer(), nullable=False, server_default="0"),
+        )
+        op.alter_column(table, "pbp_version", server_default=None)
+    op.create_index("ix_plays_event_version", "plays", ["event_id", "pbp_version"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_plays_event_version", table_name="plays")
+    for table in _VERSIONED_TABLES:
+        op.drop_column(table, "pbp_version")
+    op.drop_column("events", "pbp_reset_version")
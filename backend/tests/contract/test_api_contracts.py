@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from app.core.config import get_settings
+from app.dependencies.optimizer import provide_async_optimizer, provide_optimizer_cache
+from app.dependencies.settings import provide_settings
+from app.optimizer.executor import OptimizerSaturatedError
 from fastapi.testclient import TestClient
 
 HTTP_OK = 200
+HTTP_NOT_MODIFIED = 304
+HTTP_NOT_FOUND = 404
+HTTP_SERVICE_UNAVAILABLE = 503
 TARGET_WEEK = 7
 
 
@@ -40,6 +47,64 @@ def test_league_roster_contract(client: TestClient) -> None:
     assert len(roster["starters"]) > 0
     assert roster["optimizer"]["source"] == "optimizer"
     assert any(slot["slot"] == "QB" for slot in roster["starters"])
+    assert roster["optimizer"]["alternatives"] == []
+    assert roster["optimizer"]["overflow_players"] == []
+    assert all("recommended_slot" in slot for slot in roster["bench"])
+
+
+def test_league_roster_alternatives_contract(client: TestClient) -> None:
+    response = client.get(
+        "/api/leagues/nfl.l.12345/roster", params={"week": TARGET_WEEK, "alternatives": 2}
+    )
+    assert response.status_code == HTTP_OK
+    insight = response.json()["optimizer"]
+
+    alternatives = insight["alternatives"]
+    assert [alternative["rank"] for alternative in alternatives] == [2, 3]
+    for alternative in alternatives:
+        assert alternative["points_behind"] >= 0
+        assert alternative["starts"] and alternative["sits"]
+
+
+def test_league_lineups_contract(client: TestClient) -> None:
+    response = client.get("/api/leagues/nfl.l.12345/lineups", params={"week": TARGET_WEEK})
+    assert response.status_code == HTTP_OK
+    payload = response.json()
+
+    assert payload["league_key"] == "nfl.l.12345"
+    assert payload["lineups"], "Expected at least one optimized lineup"
+    lineup = payload["lineups"][0]
+    assert lineup["week"] == TARGET_WEEK
+    assert lineup["team"]["team_key"].startswith("nfl.l.12345.t.")
+    assert lineup["optimizer"]["source"] == "optimizer"
+
+    missing = client.get("/api/leagues/nfl.l.00000/lineups")
+    assert missing.status_code == HTTP_NOT_FOUND
+
+
+class _SaturatedOptimizer:
+    async def solve(self, *_args, **_kwargs):
+        raise OptimizerSaturatedError(retry_after=2)
+
+    async def solve_batch(self, *_args, **_kwargs):
+        raise OptimizerSaturatedError(retry_after=2)
+
+    async def solve_incremental(self, *_args, **_kwargs):
+        raise OptimizerSaturatedError(retry_after=2)
+
+
+def test_saturated_optimizer_sheds_load(client: TestClient) -> None:
+    overrides = client.app.dependency_overrides  # type: ignore[attr-defined]
+    overrides[provide_async_optimizer] = _SaturatedOptimizer
+    overrides[provide_optimizer_cache] = lambda: None
+    try:
+        response = client.get("/api/leagues/nfl.l.12345/roster", params={"week": TARGET_WEEK})
+    finally:
+        overrides.pop(provide_async_optimizer)
+        overrides.pop(provide_optimizer_cache)
+
+    assert response.status_code == HTTP_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "2"
 
 
 def test_games_contract(client: TestClient) -> None:
@@ -68,6 +133,45 @@ def test_games_contract(client: TestClient) -> None:
     assert first_drive["plays"], "Drive should include plays"
     assert any("SCORING" in play["flags"] for play in first_drive["plays"])
 
+    delta_response = client.get(f"/api/games/{event_id}/pbp", params={"since": pbp["cursor"]})
+    assert delta_response.status_code == HTTP_OK
+    delta = delta_response.json()
+    assert delta["cursor"] == pbp["cursor"]
+    assert delta["since"] == pbp["cursor"]
+    assert delta["drives"] == []
+
+
+def test_live_games_etag_and_filters(client: TestClient) -> None:
+    response = client.get("/api/games/live", params={"season": 2022, "week": 17})
+    assert response.status_code == HTTP_OK
+    etag = response.headers["ETag"]
+    assert etag.startswith('"')
+    assert [game["event_id"] for game in response.json()["games"]] == ["401437933"]
+
+    cached = client.get("/api/games/live", headers={"If-None-Match": etag})
+    assert cached.status_code == HTTP_NOT_MODIFIED
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    other_week = client.get("/api/games/live", params={"week": 1})
+    assert other_week.status_code == HTTP_OK
+    assert other_week.json()["games"] == []
+    assert other_week.headers["ETag"] != etag
+
+
+def test_unfiltered_live_games_cover_every_season(client: TestClient) -> None:
+    overrides = client.app.dependency_overrides  # type: ignore[attr-defined]
+    later_season = get_settings().model_copy(update={"pyespn_season_year": 2025})
+    overrides[provide_settings] = lambda: later_season
+    try:
+        unfiltered = client.get("/api/games/live")
+        configured = client.get("/api/games/live", params={"week": 17})
+    finally:
+        overrides.pop(provide_settings)
+
+    assert "401437933" in {game["event_id"] for game in unfiltered.json()["games"]}
+    assert configured.json()["games"] == []
+
 
 def test_openapi_includes_contract_routes(client: TestClient) -> None:
     response = client.get("/openapi.json")
@@ -80,7 +184,37 @@ def test_openapi_includes_contract_routes(client: TestClient) -> None:
         "/readyz",
         "/api/me/leagues",
         "/api/leagues/{league_key}/roster",
+        "/api/leagues/{league_key}/lineups",
         "/api/games/live",
         "/api/games/{event_id}/pbp",
+        "/api/leagues/{league_key}/season-plan",
     ]:
         assert path in paths, f"Missing {path} from OpenAPI schema"
+
+
+def test_league_season_plan_contract(client: TestClient) -> None:
+    unplanned = client.get(
+        "/api/leagues/nfl.l.12345/season-plan", params={"start_week": 13, "end_week": 13}
+    )
+    assert unplanned.status_code == HTTP_OK
+    assert unplanned.json()["weeks"] == []
+
+    response = client.post(
+        "/api/leagues/nfl.l.12345/season-plan",
+        params={"start_week": TARGET_WEEK, "end_week": 12},
+    )
+    assert response.status_code == HTTP_OK
+    plan = response.json()
+
+    assert [week["week"] for week in plan["weeks"]] == list(range(TARGET_WEEK, 13))
+    # The only rostered QB is on a bye in week 10.
+    assert plan["unfillable_weeks"] == [10]
+    bye_week = next(week for week in plan["weeks"] if week["week"] == 10)  # noqa: PLR2004
+    assert bye_week["unfillable_slots"] == ["QB"]
+    assert bye_week["bye_players"] == ["Jalen Hurts"]
+
+    cached = client.get(
+        "/api/leagues/nfl.l.12345/season-plan",
+        params={"start_week": TARGET_WEEK, "end_week": 12},
+    ).json()
+    assert cached["generated_at"] == plan["generated_at"]
@@ -1,13 +1,65 @@
 """Unit tests covering the lineup optimizer helpers."""
 
+import itertools
+import random
+from dataclasses import replace
+
+import pytest
 from app.optimizer import (
+    IncrementalLineupOptimizer,
+    LineupDistribution,
+    OptimizerAssignment,
     OptimizerPlayer,
+    OptimizerProblem,
+    OptimizerResult,
     OptimizerSlot,
+    RiskProfile,
+    SolverBudget,
+    build_lineup_matrix,
     eligible_positions_for_slot,
+    is_injured_reserve_eligible,
     is_reserve_slot,
     optimize_lineup,
+    optimize_lineup_alternatives,
+    optimize_lineup_risk_aware,
+    optimize_lineups,
+    optimize_roster,
     parse_player_positions,
+    plan_reserves,
+    plan_season,
+    reserve_slot_kind,
+)
+from app.optimizer.batch import MIN_PARALLEL_PROBLEMS
+from app.optimizer.columns import RosterColumnsBuilder, RosterEntry
+from app.optimizer.rules import (
+    position_mask,
+    positions_for_mask,
+    resolve_slot_mask,
+    slot_positions,
 )
+from app.services.leagues import _build_optimizer_summary
+
+# Best total for ``_flex_first_fixture``: Alpha WR at WR and Bravo RB at FLEX.
+FLEX_FIRST_OPTIMUM = 27.0
+KEY = ("team", 1)
+
+
+def _player(player_id: str, positions: str, points: float, **fields: object) -> OptimizerPlayer:
+    return OptimizerPlayer(
+        player_id=player_id,
+        name=player_id.upper(),
+        positions=tuple(positions.split(",")),
+        projected_points=points,
+        **fields,  # type: ignore[arg-type]
+    )
+
+
+def _slot(slot_id: str, positions: str) -> OptimizerSlot:
+    return OptimizerSlot(
+        slot_id=slot_id,
+        slot_name=slot_id.split("-")[0],
+        eligible_positions=tuple(positions.split(",")),
+    )
 
 
 def test_parse_player_positions_splits_tokens() -> None:
@@ -24,6 +76,24 @@ def test_eligible_positions_handles_aliases() -> None:
     assert rb_slot == {"RB"}
 
 
+def test_slot_resolution_is_memoized_and_immutable() -> None:
+    available_mask = position_mask(("QB", "RB", "WR", "TE"))
+    resolve_slot_mask.cache_clear()
+
+    first = slot_positions("W/R/T", available_mask)
+    second = slot_positions("W/R/T", available_mask)
+
+    assert first == second == ("RB", "TE", "WR")
+    assert resolve_slot_mask.cache_info().hits == 1
+    assert isinstance(eligible_positions_for_slot("FLEX", {"RB"}), frozenset)
+    assert positions_for_mask(resolve_slot_mask("UTIL", available_mask)) == {
+        "QB",
+        "RB",
+        "TE",
+        "WR",
+    }
+
+
 def test_is_reserve_slot_flags_bench_variants() -> None:
     assert is_reserve_slot("BENCH")
     assert is_reserve_slot("bn")
@@ -32,14 +102,23 @@ def test_is_reserve_slot_flags_bench_variants() -> None:
 
 def test_optimize_lineup_selects_highest_projection_assignment() -> None:
     players = [
-        OptimizerPlayer(player_id="p1", name="Starter WR", positions=("WR",), projected_points=10.0),
+        OptimizerPlayer(
+            player_id="p1", name="Starter WR", positions=("WR",), projected_points=10.0
+        ),
         OptimizerPlayer(player_id="p2", name="Bench WR", positions=("WR",), projected_points=14.0),
         OptimizerPlayer(player_id="p3", name="Flex RB", positions=("RB",), projected_points=9.0),
     ]
 
     slots = [
-        OptimizerSlot(slot_id="WR-0", slot_name="WR", eligible_positions=("WR",), current_player_id="p1"),
-        OptimizerSlot(slot_id="FLEX-1", slot_name="FLEX", eligible_positions=("RB", "WR", "TE"), current_player_id="p3"),
+        OptimizerSlot(
+            slot_id="WR-0", slot_name="WR", eligible_positions=("WR",), current_player_id="p1"
+        ),
+        OptimizerSlot(
+            slot_id="FLEX-1",
+            slot_name="FLEX",
+            eligible_positions=("RB", "WR", "TE"),
+            current_player_id="p3",
+        ),
     ]
 
     result = optimize_lineup(players, slots)
@@ -48,3 +127,482 @@ def test_optimize_lineup_selects_highest_projection_assignment() -> None:
     # Optimizer should promote the higher projected bench WR and slide the original starter to FLEX.
     assert assigned_players == {"p1", "p2"}
     assert result.total_points == 24.0
+
+
+@pytest.mark.parametrize(
+    ("slot_name", "kind"),
+    [("BN", "bench"), ("IR+", "injured_reserve"), ("TAXI", "taxi"), ("WR", None)],
+)
+def test_reserve_slot_kind_classifies_bench_ir_and_taxi(slot_name: str, kind: str | None) -> None:
+    assert reserve_slot_kind(slot_name) == kind
+
+
+@pytest.mark.parametrize(("status", "eligible"), [("IR-R", True), ("O", False), ("OUT", False)])
+def test_game_day_out_status_is_not_ir_eligible(status: str, eligible: bool) -> None:
+    assert is_injured_reserve_eligible(status) is eligible
+
+
+def test_optimize_lineup_reuses_model_template_for_same_slot_layout() -> None:
+    from app.optimizer.engine import _cp_sat_templates, clear_model_cache
+
+    clear_model_cache()
+    slots = [_slot("QB-0", "QB"), _slot("WR-1", "WR")]
+    week_one = [_player("q1", "QB", 18.0), _player("w1", "WR", 11.0), _player("w2", "WR", 7.0)]
+    week_two = [_player("q1", "QB", 16.0), _player("w1", "WR", 4.0), _player("w2", "WR", 12.5)]
+
+    first = optimize_lineup(week_one, slots, engine="cp_sat")
+    second = optimize_lineup(week_two, slots, engine="cp_sat")
+
+    assert len(_cp_sat_templates) == 1
+    (template,) = _cp_sat_templates.values()
+    assert not template.model.Proto().HasField("objective")
+    assert first.recommended_player_ids == {"q1", "w1"}
+    assert second.recommended_player_ids == {"q1", "w2"}
+    assert second.total_points == optimize_lineup(week_two, slots).total_points
+
+
+def _flex_first_fixture() -> tuple[list[OptimizerPlayer], list[OptimizerSlot]]:
+    players = [_player("w1", "WR", 15.0), _player("r1", "RB", 12.0), _player("w2", "WR", 3.0)]
+    slots = [_slot("FLEX-0", "RB,TE,WR"), _slot("WR-1", "WR")]
+    return players, slots
+
+
+@pytest.mark.parametrize(
+    ("engine", "fallback_used"), [("assignment", False), ("cp_sat", False), ("greedy", True)]
+)
+def test_engines_find_the_optimum_with_flex_listed_first(engine: str, fallback_used: bool) -> None:
+    players, slots = _flex_first_fixture()
+
+    result = optimize_lineup(players, slots, engine=engine)  # type: ignore[arg-type]
+
+    assert result.engine == engine
+    assert result.fallback_used is fallback_used
+    assert result.recommended_player_ids == {"w1", "r1"}
+    assert result.total_points == FLEX_FIRST_OPTIMUM
+    assert [assignment.slot_id for assignment in result.assignments] == ["FLEX-0", "WR-1"]
+
+
+def test_assignment_engine_is_the_default() -> None:
+    players, slots = _flex_first_fixture()
+
+    assert optimize_lineup(players, slots).engine == "assignment"
+
+
+def test_engines_report_objective_bound_and_gap() -> None:
+    players, slots = _flex_first_fixture()
+    budget = SolverBudget(deadline_seconds=0.5, workers=1, relative_gap=0.05)
+
+    exact = optimize_lineup(players, slots)
+    bounded = optimize_lineup(players, slots, engine="cp_sat", budget=budget)
+    heuristic = optimize_lineup(players, slots, engine="greedy")
+
+    assert exact.objective_bound == exact.total_points
+    assert exact.optimality_gap == 0.0
+    assert bounded.objective_bound is not None
+    assert bounded.objective_bound >= bounded.total_points
+    assert bounded.optimality_gap is not None
+    assert bounded.optimality_gap <= budget.relative_gap
+    assert heuristic.objective_bound is heuristic.optimality_gap is None
+
+
+@pytest.mark.parametrize("kwargs", [{"deadline_seconds": 0}, {"workers": 0}, {"relative_gap": 1.5}])
+def test_solver_budget_rejects_invalid_limits(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError):
+        SolverBudget(**kwargs)  # type: ignore[arg-type]
+
+
+def test_assignment_engine_leaves_unfillable_slot_vacant() -> None:
+    players = [_player("q1", "QB", 20.0), _player("w1", "WR", 9.0)]
+    slots = [_slot("QB-0", "QB"), _slot("QB-1", "QB"), _slot("WR-2", "WR")]
+
+    result = optimize_lineup(players, slots)
+
+    assert {assignment.slot_id for assignment in result.assignments} in (
+        {"QB-0", "WR-2"},
+        {"QB-1", "WR-2"},
+    )
+    assert result.total_points == sum(player.projected_points for player in players)
+
+
+def test_optimize_lineups_deduplicates_and_preserves_order() -> None:
+    players, slots = _flex_first_fixture()
+    shared = OptimizerProblem(players=tuple(players), slots=tuple(slots))
+    smaller = OptimizerProblem(players=tuple(players[1:]), slots=tuple(slots))
+
+    results = optimize_lineups([shared, smaller, shared])
+
+    assert [result.total_points for result in results] == [27.0, 15.0, 27.0]
+    assert results[0] is results[2]
+
+
+def test_optimize_lineups_runs_on_process_pool() -> None:
+    players, slots = _flex_first_fixture()
+    problems = [
+        OptimizerProblem(
+            players=tuple(
+                replace(player, projected_points=player.projected_points + week)
+                for player in players
+            ),
+            slots=tuple(slots),
+        )
+        for week in range(MIN_PARALLEL_PROBLEMS)
+    ]
+
+    results = optimize_lineups(problems, max_workers=2)
+
+    assert [result.total_points for result in results] == [
+        FLEX_FIRST_OPTIMUM + 2 * week for week in range(MIN_PARALLEL_PROBLEMS)
+    ]
+
+
+def test_build_lineup_matrix_encodes_eligibility_and_points() -> None:
+    players, slots = _flex_first_fixture()
+    slots.append(_slot("XYZ-2", "XYZ"))
+
+    matrix = build_lineup_matrix(players, slots)
+
+    assert matrix.shape == (3, 3)
+    assert matrix.eligibility.tolist() == [
+        [True, True, True],
+        [True, False, True],
+        # Unknown slot types stay open to every player.
+        [True, True, True],
+    ]
+    assert matrix.points.tolist() == [15.0, 12.0, 3.0]
+
+
+def _risk_fixture() -> tuple[list[OptimizerPlayer], list[OptimizerSlot]]:
+    players = [
+        _player("steady", "WR", 12.0, projected_stddev=1.0),
+        _player("boom", "WR", 11.0, projected_stddev=9.0),
+    ]
+    return players, [_slot("WR-0", "WR")]
+
+
+@pytest.mark.parametrize(
+    ("profile", "expected"),
+    [
+        (RiskProfile(seed=7), {"steady"}),
+        (RiskProfile(objective="percentile", percentile=0.9, seed=3), {"boom"}),
+        (
+            RiskProfile(
+                objective="win_probability", opponent_mean=20.0, opponent_stddev=2.0, seed=3
+            ),
+            {"boom"},
+        ),
+    ],
+)
+def test_risk_aware_optimizer_is_seedable_and_follows_objective(
+    profile: RiskProfile, expected: set[str]
+) -> None:
+    players, slots = _risk_fixture()
+
+    result = optimize_lineup_risk_aware(players, slots, profile)
+
+    assert result == optimize_lineup_risk_aware(players, slots, profile)
+    assert result.recommended_player_ids == expected
+    distribution = result.distribution
+    assert distribution is not None
+    assert distribution.floor < distribution.mean < distribution.ceiling
+    if profile.opponent_mean is None:
+        assert distribution.win_probability is None
+    else:
+        # Only the high-variance receiver gives the underdog a real chance.
+        assert distribution.win_probability is not None
+        assert 0.0 < distribution.win_probability < 0.5  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"objective": "median"},
+        {"simulations": 0},
+        {"percentile": 1.5},
+        {"objective": "win_probability"},
+    ],
+)
+def test_risk_profile_rejects_invalid_settings(kwargs: dict[str, object]) -> None:
+    with pytest.raises(ValueError):
+        RiskProfile(**kwargs)  # type: ignore[arg-type]
+
+
+def test_expected_objective_returns_the_exact_optimum_of_the_means() -> None:
+    players, slots = _risk_fixture()
+
+    exact = optimize_lineup(players, slots)
+    # A single draw makes the Monte Carlo mean as noisy as it gets.
+    expected = optimize_lineup_risk_aware(players, slots, RiskProfile(simulations=1, seed=11))
+
+    assert expected.recommended_player_ids == exact.recommended_player_ids
+    assert expected.total_points == exact.total_points
+    assert expected.distribution is not None
+
+
+@pytest.mark.parametrize("apply", ["update_player", "refresh"])
+def test_incremental_optimizer_repairs_lineup_after_projection_drop(apply: str) -> None:
+    players, slots = _flex_first_fixture()
+    optimizer = IncrementalLineupOptimizer()
+    initial = optimizer.solve(KEY, players, slots)
+    assert initial.total_points == FLEX_FIRST_OPTIMUM
+
+    downgraded = [replace(players[0], projected_points=1.0), *players[1:]]
+    if apply == "refresh":
+        result = optimizer.refresh(KEY, downgraded, slots)
+    else:
+        repair = optimizer.update_player(KEY, downgraded[0])
+        assert repair is not None
+        assert repair.warm_started
+        assert {a.player_id for a in repair.changed_assignments} == {"w2"}
+        result = repair.result
+
+    assert result.total_points == optimize_lineup(downgraded, slots).total_points
+    assert result.recommended_player_ids == {"r1", "w2"}
+    assert optimizer.result_for(KEY) == result
+
+
+def test_incremental_optimizer_refresh_resolves_a_changed_roster() -> None:
+    players, slots = _flex_first_fixture()
+    optimizer = IncrementalLineupOptimizer()
+    optimizer.refresh(KEY, players, slots)
+
+    reshuffled = optimizer.refresh(KEY, players[:2], slots)
+
+    assert reshuffled.total_points == optimize_lineup(players[:2], slots).total_points
+
+
+@pytest.mark.parametrize(
+    ("max_entries", "boosted_id", "repaired_keys"),
+    [
+        (2, "w2", {("team-a", 1), ("team-b", 1)}),
+        # The first lineup is evicted, so an update for its only-rostered player is a no-op.
+        (1, "w1", set()),
+        (1, "r1", {("team-b", 1)}),
+    ],
+)
+def test_incremental_optimizer_fans_out_player_updates(
+    max_entries: int, boosted_id: str, repaired_keys: set[tuple[str, int]]
+) -> None:
+    players, slots = _flex_first_fixture()
+    optimizer = IncrementalLineupOptimizer(max_entries=max_entries)
+    optimizer.solve(("team-a", 1), players, slots)
+    optimizer.solve(("team-b", 1), players[1:], slots)
+    boosted = next(replace(p, projected_points=40.0) for p in players if p.player_id == boosted_id)
+
+    repairs = optimizer.apply_player_update(boosted)
+
+    assert {repair.key for repair in repairs} == repaired_keys
+    for repair in repairs:
+        assert boosted_id in repair.result.recommended_player_ids
+    assert (optimizer.result_for(("team-a", 1)) is None) is (max_entries == 1)
+
+
+@pytest.mark.parametrize(
+    ("min_difference", "expected"),
+    [
+        (1, [{"w1", "r1"}, {"w1", "t1"}, {"w1", "w2"}]),
+        (2, [{"w1", "r1"}, {"w2", "t1"}]),
+    ],
+)
+def test_lineup_alternatives_are_ranked_and_distinct(
+    min_difference: int, expected: list[set[str]]
+) -> None:
+    players, slots = _flex_first_fixture()
+    players.append(_player("t1", "TE", 9.0))
+
+    ranked = optimize_lineup_alternatives(players, slots, k=3, min_difference=min_difference)
+
+    assert [result.recommended_player_ids for result in ranked] == expected
+    assert ranked[0].total_points == optimize_lineup(players, slots).total_points
+    totals = [result.total_points for result in ranked]
+    assert totals == sorted(totals, reverse=True)
+
+
+def test_optimize_roster_moves_injured_player_to_ir_and_keeps_taxi() -> None:
+    slots = [_slot("WR-0", "WR")]
+    players = [
+        _player("w1", "WR", 15.0),
+        _player("w2", "WR", 9.0),
+        _player("w3", "WR", 0.0, status="IR"),
+        _player("w4", "WR", 2.0),
+        _player("w5", "WR", 1.0),
+    ]
+    current = {"w1": "WR", "w2": "BN", "w3": "BN", "w4": "TAXI", "w5": "BN"}
+
+    plan = optimize_roster(players, slots, ["BN", "BN", "IR", "TAXI"], current_slots=current)
+
+    placements = {p.player_id: (p.slot_name, p.kind) for p in plan.reserves}
+    assert plan.lineup.recommended_player_ids == {"w1"}
+    assert placements == {
+        "w2": ("BN", "bench"),
+        "w3": ("IR", "injured_reserve"),
+        "w4": ("TAXI", "taxi"),
+        "w5": ("BN", "bench"),
+    }
+    assert plan.overflow_player_ids == ()
+
+
+def test_optimize_roster_reports_overflow_on_deep_roster() -> None:
+    slots = [_slot(f"WR-{index}", "WR") for index in range(9)]
+    players = [_player(f"p{index}", "WR", index) for index in range(45)]
+
+    plan = optimize_roster(players, slots, ["BN"] * 30 + ["IR"] * 3)
+
+    assert len(plan.lineup.assignments) == len(slots)
+    assert len(plan.reserves) == 30  # noqa: PLR2004
+    # Healthy players cannot use IR, so the six lowest projections overflow.
+    assert set(plan.overflow_player_ids) == {f"p{index}" for index in range(6)}
+
+
+def test_plan_reserves_frees_ir_for_a_taxi_player_who_is_also_injured() -> None:
+    players = [_player("hurt", "WR", 5.0, status="IR"), _player("rookie", "WR", 1.0)]
+    current = {"hurt": "TAXI", "rookie": "TAXI"}
+    empty = OptimizerResult(assignments=(), total_points=0.0)
+
+    plan = plan_reserves(players, empty, ["TAXI", "IR"], current_slots=current)
+
+    assert {p.player_id: p.kind for p in plan.reserves} == {
+        "hurt": "injured_reserve",
+        "rookie": "taxi",
+    }
+    assert plan.overflow_player_ids == ()
+
+
+def _reserve_fits(player: OptimizerPlayer, kind: str | None, current: dict[str, str]) -> bool:
+    if kind == "taxi":
+        return reserve_slot_kind(current.get(player.player_id, "")) == "taxi"
+    if kind == "injured_reserve":
+        return is_injured_reserve_eligible(player.status)
+    return kind == "bench"
+
+
+def _exhaustive_reserve_score(
+    players: list[OptimizerPlayer], reserve_slots: list[str], current: dict[str, str]
+) -> tuple[int, int]:
+    """Best (kept, projected cents) over every placement, by brute force."""
+
+    best = (0, 0)
+    for choice in itertools.product(range(-1, len(reserve_slots)), repeat=len(players)):
+        placed = [(p, col) for p, col in zip(players, choice, strict=True) if col >= 0]
+        if len({col for _, col in placed}) != len(placed) or not all(
+            _reserve_fits(p, reserve_slot_kind(reserve_slots[col]), current) for p, col in placed
+        ):
+            continue
+        best = max(best, (len(placed), sum(round(p.projected_points * 100) for p, _ in placed)))
+    return best
+
+
+@pytest.mark.parametrize("seed", [11, 12, 22])
+def test_plan_reserves_matches_exhaustive_search(seed: int) -> None:
+    rng = random.Random(seed)  # noqa: S311 - reproducible test data
+    empty = OptimizerResult(assignments=(), total_points=0.0)
+    for _ in range(20):
+        players = [
+            _player(
+                f"p{index}",
+                "WR",
+                rng.choice([0.0, 1.5, 4.0, 7.25, 12.0]),
+                status=rng.choice([None, None, "IR", "O"]),
+            )
+            for index in range(rng.randint(1, 5))
+        ]
+        reserve_slots = rng.sample(["BN", "BN", "IR", "IR+", "TAXI", "TAXI"], rng.randint(1, 4))
+        current = {p.player_id: rng.choice(["BN", "IR", "TAXI", "WR"]) for p in players}
+
+        plan = plan_reserves(players, empty, reserve_slots, current_slots=current)
+
+        by_id = {player.player_id: player for player in players}
+        kept = [by_id[placement.player_id] for placement in plan.reserves]
+        for placement in plan.reserves:
+            assert _reserve_fits(by_id[placement.player_id], placement.kind, current)
+        kinds = [placement.kind for placement in plan.reserves]
+        for kind in set(kinds):
+            slots_of_kind = [name for name in reserve_slots if reserve_slot_kind(name) == kind]
+            assert kinds.count(kind) <= len(slots_of_kind)
+        score = (len(kept), sum(round(player.projected_points * 100) for player in kept))
+        assert score == _exhaustive_reserve_score(players, reserve_slots, current)
+        assert len(plan.reserves) + len(plan.overflow_player_ids) == len(players)
+
+
+def test_plan_season_applies_weekly_points_and_flags_bye_weeks() -> None:
+    players, slots = _flex_first_fixture()
+
+    plan = plan_season(
+        players,
+        slots,
+        [3, 1, 2],
+        weekly_points={2: {"w2": 30.0}},
+        bye_weeks={"r1": 3, "w1": 3, "w2": 3},
+    )
+
+    assert [week.week for week in plan.weeks] == [1, 2, 3]
+    first, second, third = plan.weeks
+    assert first.result.total_points == optimize_lineup(players, slots).total_points
+    assert "w2" in second.result.recommended_player_ids
+    assert third.bye_player_ids == ("w1", "r1", "w2")
+    assert len(third.unfillable_slot_ids) == len(slots)
+    assert plan.unfillable_weeks == [3]
+
+
+def _roster_entry(player_id: str, positions: str, points: float, **fields: object) -> RosterEntry:
+    return RosterEntry(
+        player_id,
+        name=player_id.upper(),
+        team_abbr="PHI",
+        position_label=positions,
+        positions=tuple(positions.split(",")),
+        slot="BN",
+        points=points,
+        **fields,  # type: ignore[arg-type]
+    )
+
+
+def test_roster_columns_store_players_as_arrays() -> None:
+    builder = RosterColumnsBuilder()
+    assert builder.append(_roster_entry("p1", "WR", 12.5))
+    assert builder.append(_roster_entry("p2", "RB,WR", 8.0, actual_points=3.0, status="Q"))
+    assert not builder.append(_roster_entry("p1", "QB", 1.0))
+
+    columns = builder.build()
+
+    assert len(columns) == 2  # noqa: PLR2004
+    assert columns.index == {"p1": 0, "p2": 1}
+    assert columns.points.tolist() == [12.5, 8.0]
+    assert columns.available_mask == position_mask(("RB", "WR"))
+    assert columns.status(0) is None
+    assert columns.status(1) == "Q"
+    assert columns.actual(0) is None
+    assert columns.actual(1) == 3.0  # noqa: PLR2004
+    players = columns.optimizer_players()
+    assert [player.player_id for player in players] == ["p1", "p2"]
+    assert players[1] == _player("p2", "RB,WR", 8.0, status="Q")
+    slots = [_slot("WR-0", "WR"), _slot("K-1", "K")]
+    matrix = columns.lineup_matrix(slots)
+    expected = build_lineup_matrix(list(players), slots)
+    assert matrix.eligibility.tolist() == expected.eligibility.tolist()
+    assert matrix.points.tolist() == expected.points.tolist()
+
+
+def test_optimizer_summary_exposes_distribution_floor_and_ceiling() -> None:
+    builder = RosterColumnsBuilder()
+    builder.append(_roster_entry("p1", "WR", 12.5))
+    slot = _slot("WR-0", "WR")
+    assignment = OptimizerAssignment(
+        slot_id="WR-0", slot_name="WR", player_id="p1", projected_points=12.5
+    )
+    distribution = LineupDistribution(
+        mean=12.5, floor=7.0, ceiling=18.0, simulations=100, win_probability=0.6
+    )
+    result = OptimizerResult(
+        assignments=(assignment,), total_points=12.5, distribution=distribution
+    )
+
+    insight = _build_optimizer_summary(
+        slot_metadata=[(slot, "p1")],
+        assignment_map={"WR-0": assignment},
+        columns=builder.build(),
+        optimizer_result=result,
+    )
+
+    assert insight.floor_points == distribution.floor
+    assert insight.ceiling_points == distribution.ceiling
+    assert insight.win_probability == distribution.win_probability
@@ -0,0 +1,70 @@
+"""Smoke coverage for the optimizer benchmark harness."""
+
+from __future__ import annotations
+
+import json
+
+from app.optimizer import optimize_lineup
+from benchmarks.leagues import LAYOUTS, generate_league
+from benchmarks.optimizer import SCHEMA_VERSION, BenchmarkConfig, main, run_benchmarks
+
+
+def test_generated_leagues_can_fill_every_starting_slot() -> None:
+    for layout in LAYOUTS.values():
+        for problem in generate_league(layout, teams=3, seed=7):
+            assert len(problem.players) == len(layout.slots) + layout.bench_size
+            positions = {player.player_id: set(player.positions) for player in problem.players}
+            for slot in problem.slots:
+                # The lineup matrix opens unmatched slots to everyone; require a real match.
+                assert any(set(slot.eligible_positions) & held for held in positions.values())
+
+            result = optimize_lineup(problem.players, problem.slots)
+            slots = {slot.slot_id: set(slot.eligible_positions) for slot in problem.slots}
+            assert len(result.assignments) == len(problem.slots)
+            for assignment in result.assignments:
+                assert slots[assignment.slot_id] & positions[assignment.player_id]
+
+
+def test_run_benchmarks_reports_latency_gap_and_memory() -> None:
+    report = run_benchmarks(
+        BenchmarkConfig(
+            layouts=("superflex",),
+            engines=("assignment", "greedy"),
+            size_multipliers=(1.0,),
+            teams=2,
+            repeats=1,
+        )
+    )
+
+    assert report["schema_version"] == SCHEMA_VERSION
+    results = report["results"]
+    assert [cell["engine"] for cell in results] == ["assignment", "greedy"]
+    exact = results[0]
+    assert exact["mean_gap"] == exact["max_gap"] == 0.0
+    assert exact["invalid_lineups"] == 0
+    assert exact["p99_ms"] >= exact["p50_ms"] > 0
+    assert exact["peak_memory_kib"] > 0
+
+
+def test_benchmark_cli_writes_json(tmp_path) -> None:
+    output = tmp_path / "bench.json"
+    main(
+        [
+            "--layout",
+            "standard",
+            "--engine",
+            "assignment",
+            "--size-multiplier",
+            "1",
+            "--teams",
+            "1",
+            "--repeats",
+            "1",
+            "--output",
+            str(output),
+        ]
+    )
+
+    payload = json.loads(output.read_text(encoding="utf-8"))
+    assert payload["config"]["layouts"] == ["standard"]
+    assert len(payload["results"]) == 1
@@ -0,0 +1,105 @@
+"""Unit coverage for the optimizer result cache."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+from app.optimizer import OptimizerPlayer, OptimizerProblem, OptimizerSlot, optimize_lineup
+from app.optimizer.cache import OptimizerResultCache, problem_fingerprint
+
+
+class DictRedis:
+    """Async Redis stand-in that records TTLs."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, name: str) -> str | None:
+        return self.values.get(name)
+
+    async def set(self, name: str, value: str, ex: int | None = None) -> bool:
+        self.values[name] = value
+        self.ttls[name] = ex
+        return True
+
+
+def _problem(points: float = 20.0) -> OptimizerProblem:
+    players = (
+        OptimizerPlayer(player_id="p1", name="Alpha", positions=("WR",), projected_points=points),
+        OptimizerPlayer(player_id="p2", name="Bravo", positions=("WR",), projected_points=12.0),
+    )
+    slots = (OptimizerSlot(slot_id="WR-0", slot_name="WR", eligible_positions=("WR",)),)
+    return OptimizerProblem(players=players, slots=slots)
+
+
+def _solve(problem: OptimizerProblem):
+    return optimize_lineup(problem.players, problem.slots)
+
+
+def test_fingerprint_tracks_projection_and_status_changes() -> None:
+    problem = _problem()
+    assert problem_fingerprint(problem) == problem_fingerprint(_problem())
+    assert problem_fingerprint(problem) != problem_fingerprint(_problem(points=8.0))
+
+    injured = replace(problem.players[0], status="O")
+    changed = OptimizerProblem(players=(injured, problem.players[1]), slots=problem.slots)
+    assert problem_fingerprint(problem) != problem_fingerprint(changed)
+    assert problem_fingerprint(problem) != problem_fingerprint(problem, "greedy")
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_hits_and_misses_on_changed_projection() -> None:
+    cache = OptimizerResultCache(max_entries=4)
+    calls: list[OptimizerProblem] = []
+
+    def compute(problem: OptimizerProblem):
+        calls.append(problem)
+        return _solve(problem)
+
+    first = await cache.get_or_compute(_problem(), compute)
+    second = await cache.get_or_compute(_problem(), compute)
+    assert first is second
+    assert len(calls) == 1
+
+    downgraded = await cache.get_or_compute(_problem(points=8.0), compute)
+    assert len(calls) == 2  # noqa: PLR2004
+    assert downgraded.recommended_player_ids == {"p2"}
+
+
+@pytest.mark.asyncio
+async def test_cache_skips_results_truncated_by_solver_budget() -> None:
+    cache = OptimizerResultCache(max_entries=4)
+    truncated = replace(_solve(_problem()), objective_bound=25.0, optimality_gap=0.2)
+
+    await cache.set(_problem(), truncated)
+
+    assert await cache.get(_problem()) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_and_evicts_entries() -> None:
+    expired = OptimizerResultCache(ttl_seconds=0)
+    await expired.set(_problem(), _solve(_problem()))
+    assert await expired.get(_problem()) is None
+
+    bounded = OptimizerResultCache(max_entries=1)
+    await bounded.set(_problem(), _solve(_problem()))
+    await bounded.set(_problem(points=5.0), _solve(_problem(points=5.0)))
+    assert len(bounded) == 1
+    assert await bounded.get(_problem()) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_shares_results_through_redis_tier() -> None:
+    redis_client = DictRedis()
+    writer = OptimizerResultCache(ttl_seconds=90, redis_client=redis_client)
+    result = _solve(_problem())
+    await writer.set(_problem(), result)
+
+    assert set(redis_client.ttls.values()) == {90}
+
+    reader = OptimizerResultCache(redis_client=redis_client)
+    assert await reader.get(_problem()) == result
+    assert len(reader) == 1
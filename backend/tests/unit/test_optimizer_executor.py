@@ -0,0 +1,104 @@
+"""Unit coverage for the async optimizer facade."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+import pytest
+from app.optimizer import (
+    OptimizerPlayer,
+    OptimizerProblem,
+    OptimizerSlot,
+    SolverBudget,
+    optimize_lineup,
+)
+from app.optimizer.executor import AdmissionLimits, AsyncLineupOptimizer, OptimizerSaturatedError
+
+
+class ManualExecutor(Executor):
+    """Executor that holds submitted work until the test releases it."""
+
+    def __init__(self) -> None:
+        self.jobs: list[tuple[Future, object, tuple]] = []
+
+    def submit(self, fn, /, *args, **kwargs):  # type: ignore[override]
+        future: Future = Future()
+        self.jobs.append((future, fn, args))
+        return future
+
+    def release_all(self) -> None:
+        for future, fn, args in self.jobs:
+            future.set_result(fn(*args))  # type: ignore[operator]
+        self.jobs.clear()
+
+
+def _problem(points: float) -> OptimizerProblem:
+    players = (
+        OptimizerPlayer(player_id="p1", name="Alpha", positions=("RB",), projected_points=points),
+        OptimizerPlayer(player_id="p2", name="Bravo", positions=("RB",), projected_points=10.0),
+    )
+    slots = (OptimizerSlot(slot_id="RB-0", slot_name="RB", eligible_positions=("RB",)),)
+    return OptimizerProblem(players=players, slots=slots)
+
+
+@pytest.mark.asyncio
+async def test_async_optimizer_matches_synchronous_solver() -> None:
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        optimizer = AsyncLineupOptimizer(AdmissionLimits(max_concurrency=2), executor=pool)
+        single = await optimizer.solve(_problem(20.0))
+        batch = await optimizer.solve_batch([_problem(5.0), _problem(20.0)])
+
+    expected = optimize_lineup(_problem(20.0).players, _problem(20.0).slots)
+    assert single == expected
+    assert [result.recommended_player_ids for result in batch] == [{"p2"}, {"p1"}]
+    assert optimizer.running == optimizer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_async_optimizer_sheds_load_when_saturated() -> None:
+    executor = ManualExecutor()
+    limits = AdmissionLimits(max_concurrency=1, max_queue_depth=1, retry_after_seconds=3)
+    optimizer = AsyncLineupOptimizer(limits, executor=executor)
+
+    running = asyncio.create_task(optimizer.solve(_problem(20.0)))
+    queued = asyncio.create_task(optimizer.solve(_problem(5.0)))
+    await asyncio.sleep(0)
+    assert optimizer.running == optimizer.pending == 1
+
+    with pytest.raises(OptimizerSaturatedError) as excinfo:
+        await optimizer.solve(_problem(1.0))
+    assert excinfo.value.retry_after == 3  # noqa: PLR2004
+
+    executor.release_all()
+    await asyncio.wait_for(running, timeout=1)
+    await asyncio.sleep(0)
+    executor.release_all()
+    assert (await asyncio.wait_for(queued, timeout=1)).recommended_player_ids == {"p2"}
+    assert optimizer.running == optimizer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_async_optimizer_shrinks_solver_budget_under_load() -> None:
+    executor = ManualExecutor()
+    budget = SolverBudget(deadline_seconds=2.0, workers=4)
+    limits = AdmissionLimits(max_concurrency=1, max_queue_depth=4)
+    optimizer = AsyncLineupOptimizer(limits, executor=executor, budget=budget)
+    assert optimizer.budget_for_load() == budget
+
+    running = asyncio.create_task(optimizer.solve(_problem(20.0)))
+    queued = asyncio.create_task(optimizer.solve(_problem(5.0)))
+    await asyncio.sleep(0)
+
+    submitted_budget = executor.jobs[0][1].keywords["budget"]  # type: ignore[attr-defined]
+    assert submitted_budget == budget
+    shrunk = optimizer.budget_for_load()
+    assert shrunk.deadline_seconds == pytest.approx(2.0 / 3)
+    assert shrunk.workers == budget.workers
+
+    executor.release_all()
+    await asyncio.wait_for(running, timeout=1)
+    await asyncio.sleep(0)
+    assert executor.jobs[0][1].keywords["budget"].deadline_seconds == 1.0  # type: ignore[attr-defined]
+    executor.release_all()
+    await asyncio.wait_for(queued, timeout=1)
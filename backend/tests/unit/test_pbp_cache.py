@@ -0,0 +1,97 @@
+"""Unit coverage for the versioned play-by-play response cache."""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from app.models import Base
+from app.models.espn import Event
+from app.services import games
+from app.services.games import get_play_by_play_json
+from app.services.pbp_cache import PlayByPlayCache
+from app.services.pyespn.ingest import PyESPNIngestionService
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from ..fixtures.pyespn import load_play_by_play_fixture, load_scoreboard_fixture
+
+EVENT_ID = "401437933"
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_reused_until_ingest_bumps_the_version(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'pbp_cache.db'}", future=True)
+    Base.metadata.create_all(engine)
+    cache = PlayByPlayCache(max_entries=8)
+
+    with Session(engine) as session:
+        service = PyESPNIngestionService(session)
+        service.ingest_scoreboard(load_scoreboard_fixture())
+        payload = load_play_by_play_fixture(EVENT_ID)
+        service.ingest_play_by_play(EVENT_ID, payload, incremental=True)
+        session.commit()
+        version = session.scalar(select(Event.pbp_version).where(Event.event_id == EVENT_ID))
+        assert version == 1
+
+        first = await get_play_by_play_json(session, EVENT_ID, cache)
+        with patch.object(games, "get_play_by_play", wraps=games.get_play_by_play) as build:
+            assert await get_play_by_play_json(session, EVENT_ID, cache) is first
+            build.assert_not_called()
+
+        service.ingest_play_by_play(EVENT_ID, payload, incremental=True)
+        session.commit()
+        session.expire_all()
+        assert session.scalar(select(Event.pbp_version).where(Event.event_id == EVENT_ID)) == 1
+
+        updated = copy.deepcopy(payload)
+        updated["drives"]["previous"][-1]["plays"][0]["text"] = "Corrected play description"
+        service.ingest_play_by_play(EVENT_ID, updated, incremental=True)
+        session.commit()
+        session.expire_all()
+        version = session.scalar(select(Event.pbp_version).where(Event.event_id == EVENT_ID))
+        assert version == 2  # noqa: PLR2004
+
+        second = await get_play_by_play_json(session, EVENT_ID, cache)
+        assert second != first
+        assert b"Corrected play description" in second
+        assert len(cache) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_unknown_event_raises_value_error(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'pbp_missing.db'}", future=True)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        with pytest.raises(ValueError, match="Unknown event_id"):
+            await get_play_by_play_json(session, "missing", PlayByPlayCache())
+
+
+class _AsyncDictRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, name: str) -> str | None:
+        return self.values.get(name)
+
+    async def set(self, name: str, value: str, ex: int | None = None) -> bool:
+        self.values[name] = value
+        self.ttls[name] = ex
+        return True
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_and_final_entries_never_expire() -> None:
+    redis_client = _AsyncDictRedis()
+    writer = PlayByPlayCache(live_ttl_seconds=30, redis_client=redis_client)
+    await writer.set("live", b"{}", final=False)
+    await writer.set("done", b"[]", final=True)
+
+    assert redis_client.ttls == {"pbp:v1:live": 30, "pbp:v1:done": None}
+    reader = PlayByPlayCache(redis_client=redis_client)
+    assert await reader.get("done") == b"[]"
+    assert len(reader) == 1
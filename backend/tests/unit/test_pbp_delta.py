@@ -0,0 +1,67 @@
+"""Unit coverage for since-cursor play-by-play deltas."""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+
+from app.models import Base
+from app.services.games import get_play_by_play, get_play_by_play_since
+from app.services.pyespn.ingest import PyESPNIngestionService
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from ..fixtures.pyespn import load_play_by_play_fixture, load_scoreboard_fixture
+
+EVENT_ID = "401437933"
+
+
+def test_since_cursor_returns_only_later_changes(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'pbp_delta.db'}", future=True)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        service = PyESPNIngestionService(session)
+        service.ingest_scoreboard(load_scoreboard_fixture())
+        payload = load_play_by_play_fixture(EVENT_ID)
+        service.ingest_play_by_play(EVENT_ID, payload, incremental=True)
+        session.commit()
+
+        full = get_play_by_play(session, EVENT_ID)
+        assert (full.cursor, full.since) == (1, None)
+        from_start = get_play_by_play_since(session, EVENT_ID, 0)
+        assert from_start.since == 0
+        assert [drive.model_dump() for drive in from_start.drives] == [
+            drive.model_dump() for drive in full.drives
+        ]
+        caught_up = get_play_by_play_since(session, EVENT_ID, full.cursor)
+        assert (caught_up.cursor, caught_up.drives) == (1, [])
+
+        updated = copy.deepcopy(payload)
+        last_drive = updated["drives"]["previous"][-1]
+        last_drive["plays"][0]["text"] = "Corrected play description"
+        new_play = copy.deepcopy(last_drive["plays"][-1])
+        new_play["id"] = "999999999"
+        new_play["sequenceNumber"] = "999999"
+        last_drive["plays"].append(new_play)
+        service.ingest_play_by_play(EVENT_ID, updated, incremental=True)
+        session.commit()
+        session.expire_all()
+
+        delta = get_play_by_play_since(session, EVENT_ID, full.cursor)
+        assert (delta.cursor, delta.since) == (2, 1)
+        assert [drive.drive_id for drive in delta.drives] == [str(last_drive["id"])]
+        assert [play.play_id for play in delta.drives[0].plays] == [
+            last_drive["plays"][0]["id"],
+            "999999999",
+        ]
+
+        retracted = copy.deepcopy(updated)
+        retracted["drives"]["previous"][-1]["plays"].pop()
+        service.ingest_play_by_play(EVENT_ID, retracted, incremental=True)
+        session.commit()
+        session.expire_all()
+
+        reset = get_play_by_play_since(session, EVENT_ID, delta.cursor)
+        assert (reset.cursor, reset.since) == (3, None)
+        assert len(reset.drives) == len(full.drives)
@@ -0,0 +1,92 @@
+"""Unit coverage for the columnar play archive."""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+
+from app.jobs.archive import archive_final_events
+from app.models import Base
+from app.models.espn import Play, PlayArchive
+from app.services.games import get_play_by_play
+from app.services.play_archive import load_play_archive, restore_play_archive
+from app.services.pyespn.ingest import PyESPNIngestionService
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session
+
+from ..fixtures.pyespn import load_play_by_play_fixture, load_scoreboard_fixture
+
+EVENT_ID = "401437933"
+
+
+def test_final_events_are_served_from_the_archive(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'archive.db'}", future=True)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        service = PyESPNIngestionService(session)
+        service.ingest_scoreboard(load_scoreboard_fixture())
+        payload = load_play_by_play_fixture(EVENT_ID)
+        service.ingest_play_by_play(EVENT_ID, payload, incremental=True)
+        session.commit()
+        before = get_play_by_play(session, EVENT_ID).model_dump(exclude={"generated_at"})
+
+        assert archive_final_events(session) == 1
+        session.commit()
+        assert archive_final_events(session) == 0
+
+        raw = session.scalars(select(Play.raw_json).where(Play.event_id == EVENT_ID)).all()
+        assert raw and all(value == {} for value in raw)
+        after = get_play_by_play(session, EVENT_ID).model_dump(exclude={"generated_at"})
+        assert after == before
+
+        archive = load_play_archive(session, EVENT_ID)
+        assert archive is not None
+        archive.play_details_by_drive()
+        assert "raw_json" not in archive._decoded
+
+        # Changing an archived event restores full rows before applying the change.
+        updated = copy.deepcopy(payload)
+        corrected = updated["drives"]["previous"][-1]["plays"][0]
+        corrected["text"] = "Corrected play description"
+        service.ingest_play_by_play(EVENT_ID, updated, incremental=True)
+        session.commit()
+
+        assert session.get(PlayArchive, EVENT_ID) is None
+        raw = session.scalars(select(Play.raw_json).where(Play.event_id == EVENT_ID)).all()
+        assert all(value for value in raw)
+        descriptions = [
+            play["description"]
+            for drive in get_play_by_play(session, EVENT_ID).model_dump()["drives"]
+            for play in drive["plays"]
+        ]
+        assert "Corrected play description" in descriptions
+
+
+def test_restore_recomputes_promoted_columns(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'restore.db'}", future=True)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        service = PyESPNIngestionService(session)
+        service.ingest_scoreboard(load_scoreboard_fixture())
+        payload = load_play_by_play_fixture(EVENT_ID)
+        service.ingest_play_by_play(EVENT_ID, payload, incremental=True)
+        session.commit()
+        assert archive_final_events(session) == 1
+        # Rows archived before the detail columns existed were backfilled from empty JSON.
+        session.execute(
+            update(Play)
+            .where(Play.event_id == EVENT_ID)
+            .values(description=None, scoring_play=False, type_abbreviation=None)
+        )
+        session.commit()
+
+        assert restore_play_archive(session, EVENT_ID)
+        session.commit()
+
+        plays = [
+            play for drive in get_play_by_play(session, EVENT_ID).drives for play in drive.plays
+        ]
+        assert all(play.description for play in plays)
+        assert any("SCORING" in play.flags for play in plays)
@@ -0,0 +1,60 @@
+"""Unit coverage for conditional requests in the PyESPN client."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+from app.clients.pyespn import PyESPNClient
+from app.core.config import Settings
+
+PAYLOAD = {"gamepackageJSON": {"drives": {"previous": []}}}
+
+
+def test_unchanged_responses_are_not_parsed_twice() -> None:
+    requests: list[httpx.Request] = []
+    bodies = [json.dumps(PAYLOAD), json.dumps(PAYLOAD)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if "scoreboard" in request.url.path:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"events": []}, headers={"ETag": '"v1"'})
+        return httpx.Response(200, text=bodies.pop(0) if bodies else json.dumps({}))
+
+    client = PyESPNClient(
+        settings=Settings(),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    assert client.get_scoreboard_if_changed(2022, 1) == {"events": []}
+    assert client.get_scoreboard_if_changed(2022, 1) is None
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+    # No validators upstream: the body hash detects the repeat instead.
+    assert client.get_play_by_play_if_changed("401437933") == PAYLOAD["gamepackageJSON"]
+    assert client.get_play_by_play_if_changed("401437933") is None
+    assert client.get_play_by_play_if_changed("401437933") == {}
+
+
+def test_forgotten_urls_are_refetched_in_full() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "scoreboard" in request.url.path:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"events": []}, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json=PAYLOAD)
+
+    client = PyESPNClient(
+        settings=Settings(),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    assert client.get_scoreboard_if_changed(2022, 1) == {"events": []}
+    client.forget_scoreboard(2022, 1)
+    assert client.get_scoreboard_if_changed(2022, 1) == {"events": []}
+
+    assert client.get_play_by_play_if_changed("401437933") is not None
+    client.forget_play_by_play("401437933")
+    assert client.get_play_by_play_if_changed("401437933") == PAYLOAD["gamepackageJSON"]
@@ -0,0 +1,102 @@
+"""Unit coverage for publishing PyESPN ingestion deltas."""
+
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+
+from app.models import Base
+from app.schemas.ws import GameDelta
+from app.services.pyespn.deltas import (
+    SCOREBOARD_DELTA_TYPE,
+    GameDeltaBatch,
+    GameDeltaPublisher,
+    delta_channel,
+)
+from app.services.pyespn.ingest import PyESPNIngestionService
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from ..fixtures.pyespn import load_play_by_play_fixture, load_scoreboard_fixture
+
+EVENT_ID = "401437933"
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self.redis = redis
+        self.queued: list[tuple[str, str]] = []
+
+    def publish(self, channel: str, message: str) -> None:
+        self.queued.append((channel, message))
+
+    def execute(self) -> None:
+        self.redis.round_trips += 1
+        self.redis.messages.extend(self.queued)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.messages: list[tuple[str, str]] = []
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        assert transaction is False
+        return _FakePipeline(self)
+
+
+def _ingest(session: Session, batch: GameDeltaBatch, scoreboard: dict, pbp: dict) -> None:
+    service = PyESPNIngestionService(session, deltas=batch)
+    service.ingest_scoreboard(scoreboard, bulk=True)
+    service.ingest_play_by_play(EVENT_ID, pbp, incremental=True)
+    session.commit()
+
+
+def test_publishes_each_change_once_in_one_round_trip(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'deltas.db'}", future=True)
+    Base.metadata.create_all(engine)
+    redis = _FakeRedis()
+    publisher = GameDeltaPublisher(redis)  # type: ignore[arg-type]
+    scoreboard = load_scoreboard_fixture()
+    pbp = load_play_by_play_fixture(EVENT_ID)
+
+    with Session(engine) as session:
+        batch = GameDeltaBatch()
+        _ingest(session, batch, scoreboard, pbp)
+        published = publisher.publish(batch)
+
+        assert published == len(redis.messages)
+        assert redis.round_trips == 1
+        deltas = [GameDelta.model_validate(json.loads(message)) for _, message in redis.messages]
+        plays = [delta for delta in deltas if delta.event_id == EVENT_ID and delta.play_id]
+        assert len(plays) == len({delta.play_id for delta in plays})
+        assert [delta.sequence for delta in plays] == sorted(delta.sequence for delta in plays)
+        assert any(delta.type == SCOREBOARD_DELTA_TYPE for delta in deltas)
+        assert [channel for channel, _ in redis.messages] == [
+            delta_channel(delta.event_id) for delta in deltas
+        ]
+
+        # An unchanged payload publishes nothing.
+        _ingest(session, batch, scoreboard, pbp)
+        assert publisher.publish(batch) == 0
+        assert redis.round_trips == 1
+
+        # A score change and a corrected play publish exactly those two deltas.
+        redis.messages.clear()
+        updated_scoreboard = copy.deepcopy(scoreboard)
+        for event in updated_scoreboard["events"]:
+            if str(event["id"]) == EVENT_ID:
+                competitor = event["competitions"][0]["competitors"][0]
+                competitor["score"] = str(int(competitor.get("score", 0)) + 7)
+        updated_pbp = copy.deepcopy(pbp)
+        corrected = updated_pbp["drives"]["previous"][-1]["plays"][0]
+        corrected["text"] = "Corrected play description"
+        _ingest(session, batch, updated_scoreboard, updated_pbp)
+
+        assert publisher.publish(batch) == 2  # noqa: PLR2004
+        deltas = [GameDelta.model_validate(json.loads(message)) for _, message in redis.messages]
+        assert {channel for channel, _ in redis.messages} == {delta_channel(EVENT_ID)}
+        assert [delta.play_id for delta in deltas] == [str(corrected["id"]), None]
+        assert deltas[0].description == "Corrected play description"
+        assert deltas[1].flags == ["SCORE"]
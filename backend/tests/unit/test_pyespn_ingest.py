@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import copy
+from functools import partial
 from pathlib import Path
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, event, func, select
 from sqlalchemy.orm import Session
 
 from app.models import Base
-from app.models.espn import Drive, Event, EventState, Play, Team, Venue
+from app.models.espn import Drive, Event, EventState, Play, ScoreboardSnapshot, Team, Venue
+from app.services.games import (
+    build_scoreboard_snapshot,
+    load_all_games_snapshot,
+    load_scoreboard_snapshot,
+)
 from app.services.pyespn.ingest import PyESPNIngestionService
 from ..fixtures.pyespn import load_play_by_play_fixture, load_scoreboard_fixture
 
@@ -47,3 +54,126 @@ def test_ingests_scoreboard_and_play_by_play(tmp_path: Path) -> None:
         assert len(drives) > 0
         assert len(plays) > 0
         assert any(play.raw_json.get("scoringPlay") for play in plays)
+
+
+def _record(statements: list[str], *args: object) -> None:
+    statements.append(str(args[2]))
+
+
+def _snapshot(session: Session) -> dict[str, list[tuple]]:
+    def rows(model, *columns):
+        return sorted(
+            tuple(getattr(row, column) for column in columns)
+            for row in session.scalars(select(model))
+        )
+
+    return {
+        "teams": rows(Team, "espn_team_id", "name", "abbr", "colors_json", "logos_json"),
+        "venues": rows(Venue, "venue_id", "name", "city", "state", "roof_type", "lat"),
+        "events": rows(Event, "event_id", "season", "week", "status", "home_id", "venue_id"),
+        "states": rows(EventState, "event_id", "status", "home_score", "away_score", "clock"),
+    }
+
+
+def test_bulk_scoreboard_upsert_matches_row_path_in_few_statements(tmp_path: Path) -> None:
+    snapshots = []
+    for mode in ("rows", "bulk"):
+        engine = create_engine(f"sqlite:///{tmp_path / f'{mode}.db'}", future=True)
+        Base.metadata.create_all(engine)
+        statements: list[str] = []
+        event.listen(engine, "before_cursor_execute", partial(_record, statements))
+        with Session(engine) as session:
+            service = PyESPNIngestionService(session)
+            scoreboard = load_scoreboard_fixture()
+            session.add(Venue(venue_id="5348", name="Old", city="", state="", lat=33.7, lon=-84.4))
+            session.commit()
+            statements.clear()
+
+            # Ingest twice so the second pass exercises the update branch.
+            service.ingest_scoreboard(scoreboard, bulk=mode == "bulk")
+            service.ingest_scoreboard(scoreboard, bulk=mode == "bulk")
+            session.commit()
+            if mode == "bulk":
+                # Per pass: state reads before and after, two prefetch SELECTs, and
+                # one upsert per table; only the first pass changes states, so only it
+                # rebuilds the week and all-games snapshots (query, lookup, write each).
+                assert len(statements) <= 22  # noqa: PLR2004
+            snapshots.append(_snapshot(session))
+            venue = session.get(Venue, "5348")
+            assert venue is not None
+            assert venue.name != "Old"
+            assert venue.lat == 33.7  # noqa: PLR2004
+
+    assert snapshots[0] == snapshots[1]
+
+
+def test_incremental_play_by_play_writes_only_new_and_changed_plays(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'pbp.db'}", future=True)
+    Base.metadata.create_all(engine)
+    event_id = "401437933"
+
+    with Session(engine) as session:
+        service = PyESPNIngestionService(session)
+        service.ingest_scoreboard(load_scoreboard_fixture())
+        payload = load_play_by_play_fixture(event_id)
+        first = service.ingest_play_by_play(event_id, payload, incremental=True)
+        session.commit()
+        stored_count = len(first)
+        assert stored_count > 0
+
+        assert service.ingest_play_by_play(event_id, payload, incremental=True) == []
+
+        updated = copy.deepcopy(payload)
+        last_drive = updated["drives"]["previous"][-1]
+        last_drive["plays"][0]["text"] = "Corrected play description"
+        new_play = copy.deepcopy(last_drive["plays"][-1])
+        new_play["id"] = "999999999"
+        new_play["sequenceNumber"] = "999999"
+        last_drive["plays"].append(new_play)
+
+        changes = service.ingest_play_by_play(event_id, updated, incremental=True)
+        session.commit()
+
+        assert [play.play_id for play in changes] == [last_drive["plays"][0]["id"], "999999999"]
+        assert changes[0].raw_json["text"] == "Corrected play description"
+        plays = session.scalars(select(Play).where(Play.event_id == event_id)).all()
+        assert len(plays) == stored_count + 1
+
+
+def test_scoreboard_ingest_rebuilds_the_week_snapshot(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'snapshot.db'}", future=True)
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        service = PyESPNIngestionService(session)
+        scoreboard = load_scoreboard_fixture()
+        service.ingest_scoreboard(scoreboard, bulk=True)
+        session.commit()
+        first = load_scoreboard_snapshot(session, season=2022)
+        assert (first.season, first.week) == (2022, 17)
+        first_etag = first.etag
+        first_generated_at = first.generated_at
+
+        service.ingest_scoreboard(copy.deepcopy(scoreboard), bulk=True)
+        session.commit()
+        session.expire_all()
+        unchanged = load_scoreboard_snapshot(session, season=2022, week=17)
+        assert unchanged.etag == first_etag
+        assert unchanged.generated_at == first_generated_at
+        assert build_scoreboard_snapshot(session, 2022, 17).etag == first_etag
+
+        updated = copy.deepcopy(scoreboard)
+        updated["events"][0]["competitions"][0]["competitors"][0]["score"] = "27"
+        service.ingest_scoreboard(updated, bulk=True)
+        session.commit()
+        session.expire_all()
+
+        # One row for the week plus the unfiltered all-games scoreboard.
+        assert session.scalar(select(func.count()).select_from(ScoreboardSnapshot)) == 2  # noqa: PLR2004
+        second = load_scoreboard_snapshot(session, season=2022, week=17)
+        assert second.etag != first_etag
+        assert b'"score":27' in second.payload
+        assert load_all_games_snapshot(session).payload.count(b'"event_id"') == len(
+            scoreboard["events"]
+        )
+        assert b'"games":[]' in load_scoreboard_snapshot(session, season=2022, week=1).payload
@@ -0,0 +1,184 @@
+"""Unit coverage for the concurrent PyESPN poller."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from pathlib import Path
+from typing import Any
+
+import pytest
+from app.models import Base
+from app.models.espn import Play
+from app.services.pyespn.ingest import PyESPNIngestionService
+from app.services.pyespn.poller import (
+    PHASE_FINAL,
+    PHASE_LIVE,
+    PHASE_PREGAME,
+    PollCadence,
+    PyESPNPoller,
+    game_phase,
+)
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from ..fixtures.pyespn import load_play_by_play_fixture, load_scoreboard_fixture
+
+EVENT_ID = "401437933"
+EVENT_IDS = (EVENT_ID, "900000001", "900000002")
+
+
+def _scoreboard(description: str) -> dict[str, Any]:
+    base = load_scoreboard_fixture()
+    template = next(event for event in base["events"] if str(event["id"]) == EVENT_ID)
+    events = []
+    for event_id in EVENT_IDS:
+        event = copy.deepcopy(template)
+        event["id"] = event_id
+        event["competitions"][0]["status"]["type"]["description"] = description
+        events.append(event)
+    return {**base, "events": events}
+
+
+class _FakeClient:
+    def __init__(self, scoreboard: dict[str, Any]) -> None:
+        self.scoreboard = scoreboard
+        self.pbp = load_play_by_play_fixture(EVENT_ID)
+        self.unchanged = False
+        self.fetched: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.forgotten: list[str] = []
+
+    async def get_scoreboard_if_changed(
+        self, season: int, week: int | None = None
+    ) -> dict[str, Any]:
+        return self.scoreboard
+
+    async def get_play_by_play_if_changed(self, event_id: str) -> dict[str, Any] | None:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.fetched.append(event_id)
+        return None if self.unchanged else self.pbp
+
+    def forget_scoreboard(self, season: int, week: int | None = None) -> None:
+        self.forgotten.append("scoreboard")
+
+    def forget_play_by_play(self, event_id: str) -> None:
+        self.forgotten.append(event_id)
+
+
+def test_game_phase_follows_event_state_status() -> None:
+    assert game_phase("Scheduled") == PHASE_PREGAME
+    assert game_phase("In Progress") == PHASE_LIVE
+    assert game_phase("Halftime") == PHASE_LIVE
+    assert game_phase("Final/OT") == PHASE_FINAL
+    assert game_phase("Postponed") == PHASE_FINAL
+
+
+@pytest.mark.asyncio
+async def test_poller_adapts_cadence_and_stops_after_final(tmp_path: Path) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'poller.db'}",
+        future=True,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    client = _FakeClient(_scoreboard("In Progress"))
+    now = [100.0]
+    poller = PyESPNPoller(
+        client=client,  # type: ignore[arg-type]
+        session_factory=factory,
+        season=2022,
+        cadence=PollCadence(live_seconds=2.0, pregame_seconds=60.0),
+        concurrency=2,
+        clock=lambda: now[0],
+    )
+
+    cycle = await poller.poll_once()
+    assert sorted(cycle.polled) == sorted(EVENT_IDS)
+    assert client.max_in_flight == 2  # noqa: PLR2004
+    assert cycle.next_poll_seconds == 2.0  # noqa: PLR2004
+    with factory() as session:
+        counts = dict(
+            session.execute(select(Play.event_id, func.count()).group_by(Play.event_id)).all()
+        )
+    assert set(counts) == set(EVENT_IDS)
+    assert len(set(counts.values())) == 1
+
+    # Not due yet: only the scoreboard is refreshed.
+    cycle = await poller.poll_once()
+    assert cycle.polled == ()
+
+    # Unchanged payloads are still rescheduled but skip ingestion.
+    now[0] += 2.0
+    client.unchanged = True
+    cycle = await poller.poll_once()
+    assert sorted(cycle.unchanged) == sorted(EVENT_IDS)
+    assert cycle.next_poll_seconds == 2.0  # noqa: PLR2004
+    client.unchanged = False
+
+    now[0] += 2.0
+    client.scoreboard = _scoreboard("Scheduled")
+    cycle = await poller.poll_once()
+    assert sorted(cycle.polled) == sorted(EVENT_IDS)
+    assert cycle.unchanged == ()
+    assert cycle.next_poll_seconds == 60.0  # noqa: PLR2004
+
+    # A final game is fetched once more, then dropped from the schedule.
+    client.scoreboard = _scoreboard("Final")
+    cycle = await poller.poll_once()
+    assert sorted(cycle.polled) == sorted(EVENT_IDS)
+    assert cycle.next_poll_seconds is None
+
+    client.fetched.clear()
+    await poller.run()
+    assert client.fetched == []
+
+
+@pytest.mark.asyncio
+async def test_failed_ingest_is_isolated_and_refetched(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'poller_failure.db'}",
+        future=True,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    client = _FakeClient(_scoreboard("Final"))
+    poller = PyESPNPoller(
+        client=client,  # type: ignore[arg-type]
+        session_factory=factory,
+        season=2022,
+        clock=lambda: 100.0,
+    )
+
+    original = PyESPNIngestionService.ingest_play_by_play
+    failing = {EVENT_ID}
+
+    def ingest(self: PyESPNIngestionService, event_id: str, *args: Any, **kwargs: Any) -> Any:
+        if event_id in failing:
+            raise ValueError("Missing team id in competitor payload")
+        return original(self, event_id, *args, **kwargs)
+
+    monkeypatch.setattr(PyESPNIngestionService, "ingest_play_by_play", ingest)
+
+    cycle = await poller.poll_once()
+    assert cycle.failed == (EVENT_ID,)
+    assert client.forgotten == [EVENT_ID]
+    assert cycle.next_poll_seconds is not None
+    with factory() as session:
+        stored = set(session.scalars(select(Play.event_id).distinct()))
+    assert stored == set(EVENT_IDS) - {EVENT_ID}
+
+    failing.clear()
+    client.fetched.clear()
+    cycle = await poller.poll_once()
+    assert client.fetched == [EVENT_ID]
+    assert cycle.failed == ()
+    assert cycle.next_poll_seconds is None
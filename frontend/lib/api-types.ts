@@ -93,6 +93,8 @@ export interface PlayByPlayResponse {
   event_id: string;
   drives: DriveSummary[];
   generated_at: string;
+  cursor: number;
+  since: number | null;
 }
 
 export interface FeatureFlags {